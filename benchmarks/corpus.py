@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic corpus generator for benchmarks.
+
+Builds raw text lines (pipeline input) and NDRP entries (validator input)
+from a ``CorpusSpec``: size, target mode mix, line lengths, duplicate rate
+and invalid-entry rate. The same spec and seed always produce the same
+corpus, so benchmark results are comparable between runs and machines.
+
+Usage:
+    python benchmarks/corpus.py raw <output.txt> [--lines N] [--seed S] ...
+    python benchmarks/corpus.py entries <output.jsonl> [--lines N] ...
+"""
+import argparse
+import json
+import random
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from extraction.classifier import MODE_MARKERS, detect_mode
+from standardization.rewrite import to_ndrp_entry
+
+# Words that contain no classifier marker, so a line's mode comes from the
+# marker inserted for it
+FILLER_WORDS = (
+    "the data model token system value process result output input river "
+    "light signal pattern memory north quiet field green stone paper glass "
+    "number center metal ocean garden market simple under across"
+).split()
+
+DEFAULT_MODE_MIX = {
+    "reasoning": 1.0,
+    "instruction": 2.0,
+    "narrative": 1.0,
+    "conversation": 2.0,
+    "emotion": 1.0,
+    "meta": 1.0,
+    "other": 2.0,
+}
+
+# Ways an entry is made invalid, cycled through by the generator
+CORRUPTIONS = ("missing_intent", "bad_mode", "empty_content", "bad_role", "incoherent")
+
+_MARKERS: Dict[str, List[str]] = {
+    mode: [marker.strip() for marker in markers] for mode, markers in MODE_MARKERS
+}
+
+
+@dataclass
+class CorpusSpec:
+    """
+    Attributes:
+        lines: Number of raw lines / entries
+        seed: Random seed
+        mode_mix: Relative weight of each target mode ("other" = no marker)
+        min_words: Shortest line, in words
+        max_words: Longest line, in words
+        duplicate_rate: Share of lines repeating an earlier line, half of
+            them exactly and half with one extra word (near duplicates)
+        invalid_rate: Share of entries made schema- or check-invalid
+    """
+    lines: int = 10_000
+    seed: int = 0
+    mode_mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MODE_MIX))
+    min_words: int = 4
+    max_words: int = 40
+    duplicate_rate: float = 0.05
+    invalid_rate: float = 0.02
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def iter_raw_lines(spec: CorpusSpec) -> Iterator[str]:
+    """
+    Yield ``spec.lines`` raw text lines.
+    """
+    rng = random.Random(spec.seed)
+    modes = list(spec.mode_mix)
+    weights = [spec.mode_mix[mode] for mode in modes]
+    produced: List[str] = []
+
+    for _ in range(spec.lines):
+        if produced and rng.random() < spec.duplicate_rate:
+            line = rng.choice(produced)
+            if rng.random() < 0.5:
+                line = f"{line} {rng.choice(FILLER_WORDS)}"
+        else:
+            words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(spec.min_words, spec.max_words))]
+            mode = rng.choices(modes, weights)[0]
+            if mode in _MARKERS:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(_MARKERS[mode]))
+            line = " ".join(words).capitalize() + rng.choice((".", ".", "?", "!", ""))
+        produced.append(line)
+        yield line
+
+
+def _corrupt(entry: Dict, kind: str) -> None:
+    if kind == "missing_intent":
+        entry.pop("intent")
+    elif kind == "bad_mode":
+        entry["mode"] = "poetry"
+    elif kind == "empty_content":
+        entry["content"] = "   "
+    elif kind == "bad_role":
+        entry["role"] = "robot"
+    else:
+        entry["entropy_class"] = "high"
+
+
+def iter_entries(spec: CorpusSpec, source: str = "synthetic") -> Iterator[Dict]:
+    """
+    Yield ``spec.lines`` NDRP entries built from the raw lines, with about
+    ``spec.invalid_rate`` of them corrupted.
+    """
+    rng = random.Random(spec.seed + 1)
+    for index, line in enumerate(iter_raw_lines(spec)):
+        entry = to_ndrp_entry({"content": line, "mode": detect_mode(line), "source": source})
+        if rng.random() < spec.invalid_rate:
+            _corrupt(entry, CORRUPTIONS[index % len(CORRUPTIONS)])
+        yield entry
+
+
+def write_raw(path: Path, spec: CorpusSpec) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for line in iter_raw_lines(spec):
+            f.write(line + "\n")
+
+
+def write_entries(path: Path, spec: CorpusSpec) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in iter_entries(spec):
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser, default_lines: int = CorpusSpec.lines) -> None:
+    parser.add_argument("--lines", type=int, default=default_lines, help=f"Corpus size (default: {default_lines})")
+    parser.add_argument("--seed", type=int, default=CorpusSpec.seed, help="Random seed (default: 0)")
+    parser.add_argument("--min-words", type=int, default=CorpusSpec.min_words)
+    parser.add_argument("--max-words", type=int, default=CorpusSpec.max_words)
+    parser.add_argument("--duplicate-rate", type=float, default=CorpusSpec.duplicate_rate)
+    parser.add_argument("--invalid-rate", type=float, default=CorpusSpec.invalid_rate)
+    parser.add_argument(
+        "--mode-mix",
+        type=json.loads,
+        help='Target mode weights as JSON, e.g. \'{"instruction": 3, "other": 1}\'',
+    )
+
+
+def spec_from_args(args: argparse.Namespace) -> CorpusSpec:
+    spec = CorpusSpec(
+        lines=args.lines,
+        seed=args.seed,
+        min_words=args.min_words,
+        max_words=args.max_words,
+        duplicate_rate=args.duplicate_rate,
+        invalid_rate=args.invalid_rate,
+    )
+    if args.mode_mix:
+        spec.mode_mix = {mode: float(weight) for mode, weight in args.mode_mix.items()}
+    return spec
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic NDRP corpus")
+    parser.add_argument("kind", choices=("raw", "entries"), help="Raw text lines or NDRP JSONL entries")
+    parser.add_argument("output", help="Output path")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+
+    spec = spec_from_args(args)
+    writer = write_raw if args.kind == "raw" else write_entries
+    writer(Path(args.output), spec)
+    label = "raw lines" if args.kind == "raw" else "entries"
+    print(f"Wrote {spec.lines} {label} to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
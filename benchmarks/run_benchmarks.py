@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+NDRP benchmark suite.
+
+Runs micro-benchmarks of the per-entry hot paths and end-to-end pipeline and
+validation benchmarks on a deterministic synthetic corpus (see
+``benchmarks/corpus.py``), writes the results as stable JSON and compares
+them against a stored baseline.
+
+Each benchmark is run ``--repeats`` times and its best time is kept, which is
+the least noisy estimate on a shared machine. A benchmark regresses when its
+throughput falls more than ``--tolerance`` below the baseline; the exit code
+is 1 if any does. Baselines hold absolute throughput and are
+machine-specific: the committed ``benchmarks/baseline.json`` was recorded on
+one development machine, so record a local one with ``--save-baseline``
+before reading anything into the comparison. A warning is printed when the
+baseline comes from a different environment.
+
+``detect_mode_sequential`` and ``validate_entry_jsonschema`` time the
+straightforward reference implementations, so the speedup of the optimized
+paths can be read off the same run on any machine.
+
+The ``startup_*`` benchmarks launch ``ndrpy.py`` in fresh interpreters (for
+``--help`` and for validating a tiny shard), the cost paid per invocation by
+job schedulers. ``--importtime`` prints the slowest imports of a module as
+reported by ``python -X importtime`` instead of running the suite.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--lines N] [--repeats N] [--only NAME,...]
+                                        [--output results.json] [--baseline PATH]
+                                        [--save-baseline] [--tolerance 0.2]
+    python benchmarks/run_benchmarks.py --importtime [ndrpy] [--top N]
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.corpus import CorpusSpec, add_spec_arguments, iter_entries, iter_raw_lines, spec_from_args
+from extraction.classifier import _detect_mode_sequential, detect_mode, detect_modes
+from standardization.rewrite import to_ndrp_entry
+from standardization.unify_style import normalize_text
+from validator.aggregation import aggregate_validator_results
+from validator.density_score import compute_density
+from validator.entropy_check import shannon_entropy
+from validator.validate import validate_entry
+
+BENCH_FORMAT = 1
+REPO_ROOT = Path(__file__).parent.parent
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_LINES = 10_000
+DEFAULT_REPEATS = 5
+DEFAULT_TOLERANCE = 0.20
+
+# Interpreter launches per startup benchmark run, and entries in its shard
+STARTUP_LAUNCHES = 5
+STARTUP_SHARD_ENTRIES = 10
+DEFAULT_IMPORTTIME_TOP = 20
+
+SEVERITIES = ("critical", "high", "medium", "low", "info")
+
+# A benchmark prepares its input and returns (work, items processed per run)
+Benchmark = Callable[["Corpus"], Tuple[Callable[[], Any], int]]
+
+
+class Corpus:
+    """
+    Benchmark inputs generated once from a ``CorpusSpec``; files for the
+    end-to-end benchmarks are written to ``workdir`` on first use.
+    """
+
+    def __init__(self, spec: CorpusSpec, workdir: Path):
+        self.spec = spec
+        self.workdir = workdir
+        self.lines = list(iter_raw_lines(spec))
+        self.entries = list(iter_entries(spec))
+        self._paths: Dict[str, Path] = {}
+
+    def raw_path(self) -> Path:
+        if "raw" not in self._paths:
+            path = self._paths["raw"] = self.workdir / "raw.txt"
+            path.write_text("".join(line + "\n" for line in self.lines), encoding="utf-8")
+        return self._paths["raw"]
+
+    def entries_path(self) -> Path:
+        if "entries" not in self._paths:
+            path = self._paths["entries"] = self.workdir / "entries.jsonl"
+            path.write_text(
+                "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in self.entries),
+                encoding="utf-8",
+            )
+        return self._paths["entries"]
+
+
+def bench_detect_mode(corpus: Corpus):
+    lines = corpus.lines
+    return lambda: [detect_mode(line) for line in lines], len(lines)
+
+
+def bench_detect_mode_sequential(corpus: Corpus):
+    # Reference classifier: one substring search per marker
+    lines = corpus.lines
+    return lambda: [_detect_mode_sequential(line) for line in lines], len(lines)
+
+
+def bench_detect_modes(corpus: Corpus):
+    lines = corpus.lines
+    return lambda: detect_modes(lines), len(lines)
+
+
+def bench_normalize_text(corpus: Corpus):
+    lines = corpus.lines
+    return lambda: [normalize_text(line) for line in lines], len(lines)
+
+
+def bench_to_ndrp_entry(corpus: Corpus):
+    pre_entries = [{"content": line, "mode": detect_mode(line), "source": "bench"} for line in corpus.lines]
+    return lambda: [to_ndrp_entry(pre_entry) for pre_entry in pre_entries], len(pre_entries)
+
+
+def bench_validate_entry(corpus: Corpus):
+    entries = corpus.entries
+    return lambda: [validate_entry(entry, i) for i, entry in enumerate(entries, start=1)], len(entries)
+
+
+def bench_validate_entry_jsonschema(corpus: Corpus):
+    # Reference validator: a plain ``jsonschema.validate`` call per entry
+    import jsonschema
+
+    from validator.engine import load_schema
+
+    schema = load_schema()
+    entries = corpus.entries
+
+    def run():
+        for entry in entries:
+            try:
+                jsonschema.validate(instance=entry, schema=schema)
+            except jsonschema.ValidationError:
+                pass
+
+    return run, len(entries)
+
+
+def bench_shannon_entropy(corpus: Corpus):
+    contents = [entry.get("content", "") for entry in corpus.entries]
+    return lambda: [shannon_entropy(content) for content in contents], len(contents)
+
+
+def bench_compute_density(corpus: Corpus):
+    contents = [entry.get("content", "") for entry in corpus.entries]
+    return lambda: [compute_density(content) for content in contents], len(contents)
+
+
+def bench_aggregate_validator_results(corpus: Corpus):
+    results = [{"severity": SEVERITIES[i % len(SEVERITIES)]} for i in range(len(corpus.entries))]
+    return lambda: aggregate_validator_results(results), len(results)
+
+
+def bench_pipeline(corpus: Corpus):
+    from scripts.run_pipeline import run_pipeline
+
+    input_path = corpus.raw_path()
+    output_path = corpus.workdir / "refined.jsonl"
+
+    def run():
+        with redirect_stdout(io.StringIO()):
+            run_pipeline(str(input_path), str(output_path))
+
+    return run, len(corpus.lines)
+
+
+def bench_validate(corpus: Corpus):
+    import ndrpy
+
+    input_path = corpus.entries_path()
+
+    def run():
+        with redirect_stdout(io.StringIO()):
+            ndrpy.main(["validate", str(input_path)])
+
+    return run, len(corpus.entries)
+
+
+def _launch_ndrpy(args: List[str], launches: int) -> Callable[[], None]:
+    command = [sys.executable, str(REPO_ROOT / "ndrpy.py"), *args]
+
+    def run():
+        for _ in range(launches):
+            subprocess.run(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    return run
+
+
+def bench_startup_help(corpus: Corpus):
+    return _launch_ndrpy(["--help"], STARTUP_LAUNCHES), STARTUP_LAUNCHES
+
+
+def bench_startup_validate_shard(corpus: Corpus):
+    shard_path = corpus.workdir / "shard.jsonl"
+    shard_path.write_text(
+        "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in corpus.entries[:STARTUP_SHARD_ENTRIES]),
+        encoding="utf-8",
+    )
+    return _launch_ndrpy(["validate", str(shard_path)], STARTUP_LAUNCHES), STARTUP_LAUNCHES
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "detect_mode": bench_detect_mode,
+    "detect_mode_sequential": bench_detect_mode_sequential,
+    "detect_modes": bench_detect_modes,
+    "normalize_text": bench_normalize_text,
+    "to_ndrp_entry": bench_to_ndrp_entry,
+    "validate_entry": bench_validate_entry,
+    "validate_entry_jsonschema": bench_validate_entry_jsonschema,
+    "shannon_entropy": bench_shannon_entropy,
+    "compute_density": bench_compute_density,
+    "aggregate_validator_results": bench_aggregate_validator_results,
+    "e2e_pipeline": bench_pipeline,
+    "e2e_validate": bench_validate,
+    "startup_help": bench_startup_help,
+    "startup_validate_shard": bench_startup_validate_shard,
+}
+
+
+def run_benchmark(benchmark: Benchmark, corpus: Corpus, repeats: int) -> Dict[str, Any]:
+    """
+    Time ``benchmark`` ``repeats`` times and keep the best run.
+    """
+    work, items = benchmark(corpus)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        work()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "items": items,
+        "repeats": repeats,
+        "seconds": round(best, 6),
+        "ops_per_sec": round(items / best, 1) if best > 0 else None,
+    }
+
+
+def run_suite(
+    spec: CorpusSpec,
+    names: Optional[List[str]] = None,
+    repeats: int = DEFAULT_REPEATS,
+    progress: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run the named benchmarks (all by default) and return the results
+    document.
+    """
+    names = names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        corpus = Corpus(spec, Path(tmpdir))
+        for name in names:
+            results[name] = run_benchmark(BENCHMARKS[name], corpus, repeats)
+            if progress:
+                print(f"{name:<28} {results[name]['ops_per_sec']:>14,.0f} items/sec")
+
+    return {
+        "format": BENCH_FORMAT,
+        "corpus": spec.to_dict(),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Dict[str, Any]]:
+    """
+    Compare throughput per benchmark. Each row has the baseline and current
+    items/sec, their ratio and a status: "regression" (ratio below
+    ``1 - tolerance``), "improved" (above ``1 + tolerance``), "ok", or "new"
+    when the baseline lacks the benchmark.
+    """
+    rows = []
+    baseline_results = baseline.get("results", {})
+    for name, result in current["results"].items():
+        old = baseline_results.get(name, {}).get("ops_per_sec")
+        new = result["ops_per_sec"]
+        if not old or not new:
+            rows.append({"name": name, "baseline": old, "current": new, "ratio": None, "status": "new"})
+            continue
+        ratio = new / old
+        if ratio < 1 - tolerance:
+            status = "regression"
+        elif ratio > 1 + tolerance:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({"name": name, "baseline": old, "current": new, "ratio": round(ratio, 3), "status": status})
+    return rows
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Parse ``python -X importtime`` output into rows of module, self and
+    cumulative microseconds, in import order.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        rows.append({
+            "module": module.strip(),
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return rows
+
+
+def import_times(module: str = "ndrpy") -> List[Dict[str, Any]]:
+    """
+    Import ``module`` in a fresh interpreter with ``-X importtime`` and
+    return the parsed rows.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise ValueError(f"Importing {module} failed:\n{completed.stderr.strip()}")
+    return parse_importtime(completed.stderr)
+
+
+def print_import_times(module: str, top: int) -> None:
+    rows = import_times(module)
+    total = next((row["cumulative_us"] for row in rows if row["module"] == module), 0)
+    print(f"import {module}: {total / 1000:.1f} ms; slowest imports (cumulative):")
+    print(f"  {'Module':<44} {'Self (ms)':>10} {'Total (ms)':>11}")
+    for row in sorted(rows, key=lambda row: row["cumulative_us"], reverse=True)[:top]:
+        print(f"  {row['module']:<44} {row['self_us'] / 1000:>10.2f} {row['cumulative_us'] / 1000:>11.2f}")
+
+
+def write_results(path: Path, document: Mapping[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the NDRP benchmark suite")
+    add_spec_arguments(parser, default_lines=DEFAULT_LINES)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Runs per benchmark; the best is kept")
+    parser.add_argument("--only", help=f"Comma-separated benchmarks to run ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--output", "-o", help="Write results JSON to this path")
+    parser.add_argument(
+        "--baseline",
+        default=str(BASELINE_PATH),
+        help="Baseline results to compare against (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed throughput drop before a benchmark counts as a regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--importtime",
+        nargs="?",
+        const="ndrpy",
+        metavar="MODULE",
+        help="Print the slowest imports of MODULE (default: ndrpy) and exit",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_IMPORTTIME_TOP,
+        help=f"Imports listed by --importtime (default: {DEFAULT_IMPORTTIME_TOP})",
+    )
+    args = parser.parse_args(argv)
+
+    if args.importtime:
+        try:
+            print_import_times(args.importtime, args.top)
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.repeats < 1 or args.lines < 1:
+        parser.error("--repeats and --lines must be positive")
+
+    names = args.only.split(",") if args.only else None
+    try:
+        document = run_suite(spec_from_args(args), names, args.repeats, progress=True)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.output:
+        write_results(Path(args.output), document)
+        print(f"\nResults written to: {args.output}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        write_results(baseline_path, document)
+        print(f"Baseline saved to: {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("corpus") != document["corpus"]:
+        print("Warning: baseline was recorded on a different corpus; ratios are not comparable")
+    if baseline.get("environment") != document["environment"]:
+        print(
+            "Warning: baseline was recorded in a different environment; "
+            "run with --save-baseline to record one for this machine"
+        )
+
+    rows = compare(document, baseline, args.tolerance)
+    print(f"\nCompared with {baseline_path} (tolerance {args.tolerance:.0%}):")
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        baseline_rate = f"{row['baseline']:,.0f}" if row["baseline"] else "-"
+        print(f"  {row['name']:<28} {baseline_rate:>14} -> {row['current']:>14,.0f}  {ratio:>7}  {row['status']}")
+
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\nRegressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
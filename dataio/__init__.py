@@ -0,0 +1,12 @@
+"""
+Data I/O - NDRP Pipeline
+
+Shared input/output helpers used by the pipeline runner, the validators and
+the ndrpy CLI:
+- Buffered, batched JSONL writing with optional fast serializers
+- Transparent gzip/bzip2/xz/zstd input and output
+- Memory-mapped JSONL access through a persisted line-offset index
+- Block manifests for incremental pipeline runs
+- Columnar table output (Parquet, NumPy .npz or CSV)
+- Per-stage timing and throughput profiling
+"""
@@ -0,0 +1,141 @@
+"""
+Columnar table output.
+
+Tables are given as a mapping of column name to equal-length sequences and
+written as Parquet (requires the optional ``pyarrow`` package), a NumPy
+``.npz`` archive (requires ``numpy``) or CSV (standard library; compressed
+when the name ends in e.g. ``.csv.gz``). The format follows the file
+extension unless given explicitly.
+
+The optional dependencies are imported when a table is first written (or
+``np`` / ``pyarrow`` is first accessed), not when this module is imported.
+"""
+import csv
+import io
+from pathlib import Path
+from typing import Any, Mapping, Optional, Sequence, Union
+
+from .compression import EXTENSIONS, open_output
+
+
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return numpy
+
+
+def _load_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return pyarrow
+
+
+# Module attribute -> loader returning the module, or None when missing
+_OPTIONAL_MODULES = {"np": _load_numpy, "pyarrow": _load_pyarrow}
+
+
+def _optional(name: str) -> Any:
+    module = globals()
+    if name not in module:
+        module[name] = _OPTIONAL_MODULES[name]()
+    return module[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _OPTIONAL_MODULES:
+        return _optional(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+COLUMNAR_FORMATS = ("parquet", "npz", "csv")
+
+_FORMAT_SUFFIXES = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".npz": "npz",
+    ".csv": "csv",
+}
+
+
+def columnar_format_from_path(path: Union[str, Path]) -> Optional[str]:
+    """
+    Table format named by the file extension (ignoring a trailing
+    compression extension), or None.
+    """
+    path = Path(path)
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if len(suffixes) > 1 and suffixes[-1] in EXTENSIONS:
+        suffixes.pop()
+    return _FORMAT_SUFFIXES.get(suffixes[-1]) if suffixes else None
+
+
+def resolve_columnar_format(path: Union[str, Path], table_format: Optional[str] = None) -> str:
+    """
+    ``table_format``, or the format named by the extension of ``path``.
+    Raises ValueError when neither gives a supported format.
+    """
+    path = Path(path)
+    table_format = table_format or columnar_format_from_path(path)
+    if table_format is None:
+        raise ValueError(
+            f"Cannot infer table format from '{path.name}'; use .parquet, .npz or .csv"
+        )
+    if table_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported table format: {table_format}")
+    return table_format
+
+
+def columnar_format_available(table_format: str) -> bool:
+    """
+    Whether the optional dependency of ``table_format`` is installed.
+    """
+    if table_format == "parquet":
+        return _optional("pyarrow") is not None
+    if table_format == "npz":
+        return _optional("np") is not None
+    return True
+
+
+def write_columns(
+    path: Union[str, Path],
+    columns: Mapping[str, Sequence[Any]],
+    table_format: Optional[str] = None,
+) -> str:
+    """
+    Write ``columns`` to ``path`` and return the format used.
+    """
+    path = Path(path)
+    table_format = resolve_columnar_format(path, table_format)
+
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("All columns must have the same length")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if table_format == "parquet":
+        pyarrow = _optional("pyarrow")
+        if pyarrow is None:
+            raise ValueError(
+                "Parquet output requires the 'pyarrow' package; write .npz or .csv instead"
+            )
+        table = pyarrow.table({name: list(values) for name, values in columns.items()})
+        pyarrow.parquet.write_table(table, str(path))
+    elif table_format == "npz":
+        np = _optional("np")
+        if np is None:
+            raise ValueError("NumPy .npz output requires the 'numpy' package; write .csv instead")
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **{name: np.asarray(values) for name, values in columns.items()})
+    else:
+        with io.TextIOWrapper(open_output(path), encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*columns.values()))
+
+    return table_format
@@ -0,0 +1,150 @@
+"""
+Transparent compressed file I/O.
+
+``open_input`` detects gzip, bzip2, xz and zstd input by file extension or,
+failing that, by magic bytes, and returns a stream that decodes on the fly
+through a large read buffer. ``open_output`` picks the compressor from the
+output file extension. gzip, bzip2 and xz use the standard library; zstd
+uses the stdlib ``compression.zstd`` module when available (Python 3.14+)
+and otherwise the optional ``zstandard`` package.
+"""
+import bz2
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import IO, Optional, Union
+
+try:
+    from compression import zstd as _stdlib_zstd
+except ImportError:  # pragma: no cover - Python < 3.14
+    _stdlib_zstd = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Read buffer for decoded input streams
+READ_BUFFER_SIZE = 1 << 20
+
+# gzip level for written output; level 9 costs a lot of CPU for little gain
+GZIP_COMPRESS_LEVEL = 6
+
+EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+MAGIC_BYTES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+
+def compression_from_extension(path: Union[str, Path]) -> Optional[str]:
+    """
+    Compression named by the file extension, or None.
+    """
+    return EXTENSIONS.get(Path(path).suffix.lower())
+
+
+def detect_compression(path: Union[str, Path]) -> Optional[str]:
+    """
+    Detect the compression of an existing file by extension, then by magic
+    bytes. Returns one of "gzip", "bz2", "xz", "zstd", or None for plain
+    files.
+    """
+    by_extension = compression_from_extension(path)
+    if by_extension is not None:
+        return by_extension
+
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for magic, compression in MAGIC_BYTES:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def is_compressed(path: Union[str, Path]) -> bool:
+    return detect_compression(path) is not None
+
+
+def _zstd_unavailable() -> ValueError:
+    return ValueError(
+        "zstd support requires Python 3.14+ or the 'zstandard' package"
+    )
+
+
+def _open_binary_reader(path: Union[str, Path], compression: Optional[str]) -> IO[bytes]:
+    if compression is None:
+        return open(path, "rb", buffering=READ_BUFFER_SIZE)
+
+    if compression == "gzip":
+        stream = gzip.open(path, "rb")
+    elif compression == "bz2":
+        stream = bz2.open(path, "rb")
+    elif compression == "xz":
+        stream = lzma.open(path, "rb")
+    elif compression == "zstd":
+        if _stdlib_zstd is not None:
+            stream = _stdlib_zstd.open(path, "rb")
+        elif zstandard is not None:
+            stream = zstandard.ZstdDecompressor().stream_reader(
+                open(path, "rb"), read_size=READ_BUFFER_SIZE, closefd=True
+            )
+        else:
+            raise _zstd_unavailable()
+    else:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+    return io.BufferedReader(stream, buffer_size=READ_BUFFER_SIZE)
+
+
+def open_input(path: Union[str, Path], mode: str = "rt", encoding: str = "utf-8") -> IO:
+    """
+    Open a possibly compressed file for streaming reads.
+
+    ``mode`` is "rt" for decoded text (universal newlines, like ``open``) or
+    "rb" for bytes.
+    """
+    if mode not in ("rt", "rb", "r"):
+        raise ValueError(f"Unsupported mode for open_input: {mode}")
+
+    stream = _open_binary_reader(path, detect_compression(path))
+    if mode == "rb":
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding)
+
+
+def open_output(path: Union[str, Path], compression: Optional[str] = None) -> IO[bytes]:
+    """
+    Open a binary writer, compressing according to ``compression`` or, when
+    omitted, the file extension.
+    """
+    if compression is None:
+        compression = compression_from_extension(path)
+
+    if compression is None:
+        return open(path, "wb", buffering=READ_BUFFER_SIZE)
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=GZIP_COMPRESS_LEVEL)
+    if compression == "bz2":
+        return bz2.open(path, "wb")
+    if compression == "xz":
+        return lzma.open(path, "wb")
+    if compression == "zstd":
+        if _stdlib_zstd is not None:
+            return _stdlib_zstd.open(path, "wb")
+        if zstandard is not None:
+            return zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+        raise _zstd_unavailable()
+
+    raise ValueError(f"Unsupported compression: {compression}")
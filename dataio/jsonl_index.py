@@ -0,0 +1,197 @@
+"""
+Random access to JSONL files through a memory map and a line-offset index.
+
+``IndexedJSONL`` maps the file read-only and keeps an ``array('Q')`` of line
+start offsets, so any line can be fetched in O(1) and any run of lines maps
+to a single byte range that worker processes can read on their own. The
+index is persisted in a sidecar file (``<data>.idx`` by default) and rebuilt
+automatically when the data file's size or modification time changes.
+
+Line numbers are 1-based physical line numbers, the same numbers the
+validators print as ``[Entry N]``.
+"""
+import json
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Iterator, Optional, Tuple, Union
+
+from .compression import is_compressed
+
+INDEX_MAGIC = b"NDRPIDX1"
+
+# magic, data size, data mtime (ns), line count
+_HEADER = struct.Struct("<8sQQQ")
+
+INDEX_SUFFIX = ".idx"
+
+
+def default_index_path(path: Union[str, Path]) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def build_line_offsets(data: Union[bytes, mmap.mmap]) -> array:
+    """
+    Start offset of every line in ``data``, plus a final entry for the end
+    of the data. A trailing newline does not start an extra line.
+    """
+    offsets = array("Q", [0])
+    size = len(data)
+    find = data.find
+    position = find(b"\n")
+    while position != -1 and position + 1 < size:
+        offsets.append(position + 1)
+        position = find(b"\n", position + 1)
+    if size:
+        offsets.append(size)
+    else:
+        offsets = array("Q", [0])
+    return offsets
+
+
+class IndexedJSONL:
+    """
+    Memory-mapped, line-indexed view of an uncompressed JSONL file.
+
+    ``len()`` is the number of physical lines. ``get(n)`` parses line ``n``,
+    ``line_bytes(n)`` returns it as a zero-copy ``memoryview`` and
+    ``byte_range(first, last)`` gives the ``(start, end)`` offsets covering
+    lines ``first..last`` inclusive.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        index_path: Optional[Union[str, Path]] = None,
+        persist: bool = True,
+    ) -> None:
+        self.path = Path(path)
+        if is_compressed(self.path):
+            raise ValueError(f"Indexed access requires an uncompressed file: {self.path}")
+
+        self.index_path = Path(index_path) if index_path else default_index_path(self.path)
+        self._file = open(self.path, "rb")
+        stat = os.fstat(self._file.fileno())
+        self._size = stat.st_size
+        self._mtime_ns = stat.st_mtime_ns
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else None
+        )
+
+        offsets = self._load_index()
+        if offsets is None:
+            offsets = build_line_offsets(self._mmap if self._mmap is not None else b"")
+            if persist:
+                self._save_index(offsets)
+        self.offsets = offsets
+
+    def __enter__(self) -> "IndexedJSONL":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views handed out are still alive; the map is released with them
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def _load_index(self) -> Optional[array]:
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if len(header) != _HEADER.size:
+                    return None
+                magic, size, mtime_ns, count = _HEADER.unpack(header)
+                if magic != INDEX_MAGIC or size != self._size or mtime_ns != self._mtime_ns:
+                    return None
+                offsets = array("Q")
+                offsets.fromfile(f, count + 1)
+        except (OSError, EOFError):
+            return None
+        return offsets
+
+    def _save_index(self, offsets: array) -> None:
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(INDEX_MAGIC, self._size, self._mtime_ns, len(offsets) - 1))
+                offsets.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # Read-only location: keep the in-memory index only
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _check_line(self, line_no: int) -> None:
+        if not 1 <= line_no <= len(self):
+            raise IndexError(f"Line {line_no} out of range (1-{len(self)})")
+
+    def byte_range(self, first: int, last: int) -> Tuple[int, int]:
+        """
+        Byte offsets ``(start, end)`` covering lines ``first..last`` inclusive.
+        """
+        self._check_line(first)
+        self._check_line(last)
+        if last < first:
+            raise ValueError(f"Empty line range {first}-{last}")
+        return self.offsets[first - 1], self.offsets[last]
+
+    def view(self, first: int, last: Optional[int] = None) -> memoryview:
+        """
+        Zero-copy view of lines ``first..last`` inclusive (just ``first``
+        when ``last`` is omitted), including line terminators.
+        """
+        start, end = self.byte_range(first, first if last is None else last)
+        assert self._mmap is not None
+        return memoryview(self._mmap)[start:end]
+
+    def line_bytes(self, line_no: int) -> memoryview:
+        """
+        Zero-copy view of one line without its line terminator.
+        """
+        view = self.view(line_no)
+        end = len(view)
+        if end and view[end - 1] == 0x0A:
+            end -= 1
+        if end and view[end - 1] == 0x0D:
+            end -= 1
+        return view[:end]
+
+    def get(self, line_no: int) -> Any:
+        """
+        Parse and return the JSON value on line ``line_no``.
+        """
+        return json.loads(bytes(self.line_bytes(line_no)))
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """
+        Python-style (0-based) access: ``reader[0]`` is line 1 and slices
+        return lists of parsed values.
+        """
+        if isinstance(key, slice):
+            return [self.get(i + 1) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        return self.get(key + 1)
+
+    def iter_lines(self, first: int = 1, last: Optional[int] = None) -> Iterator[memoryview]:
+        """
+        Yield zero-copy views of lines ``first..last`` inclusive.
+        """
+        last = len(self) if last is None else last
+        for line_no in range(first, last + 1):
+            yield self.line_bytes(line_no)
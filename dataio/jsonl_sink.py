@@ -0,0 +1,167 @@
+"""
+Batched JSONL writer for NDRP output.
+
+Entries are serialized with a reusable encoder, collected into batches and
+written to a binary file as large blocks instead of one small write per
+entry. orjson is used when requested and installed; the stdlib encoder is
+the default so output stays byte-identical to ``json.dumps``. Output is
+compressed when the path ends in a known compression extension.
+"""
+import json
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Union
+
+from .compression import open_output
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Entries buffered before a block is written
+DEFAULT_BATCH_SIZE = 1024
+
+SERIALIZERS = ("json", "orjson", "auto")
+
+_ENCODER = json.JSONEncoder()
+
+
+def _stdlib_dumps(entry: Any) -> bytes:
+    return _ENCODER.encode(entry).encode("utf-8")
+
+
+def get_serializer(name: str = "json") -> Callable[[Any], bytes]:
+    """
+    Return a function serializing one entry to compact UTF-8 JSON bytes.
+
+    ``"json"`` matches ``json.dumps`` output exactly, ``"orjson"`` requires
+    the orjson package, and ``"auto"`` picks orjson when it is installed.
+    """
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer: {name}")
+
+    if name == "orjson" and orjson is None:
+        raise ValueError("The orjson serializer requires the 'orjson' package")
+
+    if name == "orjson" or (name == "auto" and orjson is not None):
+        return orjson.dumps
+
+    return _stdlib_dumps
+
+
+def resolve_serializer(name: str = "json") -> str:
+    """
+    The concrete serializer, "json" or "orjson", that ``name`` selects.
+    """
+    get_serializer(name)
+    if name == "auto":
+        return "orjson" if orjson is not None else "json"
+    return name
+
+
+def dumps_lines(entries: Iterable[Any], serializer: str = "json") -> bytes:
+    """
+    Serialize entries to a single JSONL block.
+    """
+    dumps = get_serializer(serializer)
+    return b"".join(dumps(entry) + b"\n" for entry in entries)
+
+
+class JSONLSink:
+    """
+    Buffered JSONL writer over a binary file.
+
+    Tracks the number of entries and bytes written and the time spent
+    serializing and writing, exposed through ``stats``.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        serializer: str = "json",
+    ) -> None:
+        self.file = file
+        self.batch_size = batch_size
+        self._dumps = get_serializer(serializer)
+        self._pending: List[bytes] = []
+        self.entries_written = 0
+        self.bytes_written = 0
+        self.seconds = 0.0
+
+    def __enter__(self) -> "JSONLSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def write(self, entry: Any) -> None:
+        """
+        Queue one entry, flushing when a full batch is buffered.
+        """
+        start = time.perf_counter()
+        self._pending.append(self._dumps(entry))
+        self.entries_written += 1
+        self.seconds += time.perf_counter() - start
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, entries: Iterable[Any]) -> None:
+        for entry in entries:
+            self.write(entry)
+
+    def write_block(self, block: Union[bytes, str], entry_count: int = 0) -> None:
+        """
+        Write pre-rendered output (e.g. a JSONL block from a worker process)
+        after any queued entries.
+        """
+        self.flush()
+        start = time.perf_counter()
+        data = block.encode("utf-8") if isinstance(block, str) else block
+        self.file.write(data)
+        self.entries_written += entry_count
+        self.bytes_written += len(data)
+        self.seconds += time.perf_counter() - start
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        start = time.perf_counter()
+        self._pending.append(b"")
+        data = b"\n".join(self._pending)
+        self._pending.clear()
+        self.file.write(data)
+        self.bytes_written += len(data)
+        self.seconds += time.perf_counter() - start
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Entries, bytes, seconds spent writing and bytes/sec so far.
+        """
+        return {
+            "entries": self.entries_written,
+            "bytes": self.bytes_written,
+            "seconds": self.seconds,
+            "bytes_per_sec": self.bytes_written / self.seconds if self.seconds else 0.0,
+        }
+
+
+def open_jsonl_sink(
+    path: Union[str, Path],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    serializer: str = "json",
+    compression: Optional[str] = None,
+) -> JSONLSink:
+    """
+    Open ``path`` for writing and wrap it in a ``JSONLSink``.
+
+    ``compression`` defaults to the one implied by the file extension
+    (e.g. ``.jsonl.gz``); see ``dataio.compression.open_output``.
+    """
+    file = open_output(path, compression)
+    return JSONLSink(file, batch_size=batch_size, serializer=serializer)
@@ -0,0 +1,122 @@
+"""
+Manifest of processed input for incremental pipeline runs.
+
+The raw input is split into blocks of a fixed number of physical lines. For
+every block the manifest stores a content hash, its size in input bytes and
+the number of entries and bytes it produced in the output, so block ``i``
+maps to a known byte range of both files. Together with the stage versions
+used to build the output, this is enough to tell which blocks of a later run
+can be kept as they are and which must be reprocessed.
+
+The manifest is a JSON sidecar (``<output>.manifest.json`` by default) and is
+replaced atomically after the output has been written.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+MANIFEST_FORMAT = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def default_manifest_path(output_path: Union[str, Path]) -> Path:
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + MANIFEST_SUFFIX)
+
+
+def block_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass
+class BlockRecord:
+    """
+    One block of raw input and the output it produced.
+
+    Attributes:
+        digest: Hash of the block's raw bytes
+        input_bytes: Size of the block in the (decoded) input
+        entries: Number of output entries produced
+        output_bytes: Size of those entries in the output file
+    """
+    digest: str
+    input_bytes: int
+    entries: int
+    output_bytes: int
+
+
+@dataclass
+class PipelineManifest:
+    """
+    Processed-input record for one output file.
+
+    Attributes:
+        versions: Pipeline and stage versions the output was built with
+        source: Source name written into entry metadata
+        block_lines: Physical input lines per block
+        blocks: Per-block records in input order
+    """
+    versions: Dict[str, Any]
+    source: str
+    block_lines: int
+    blocks: List[BlockRecord] = field(default_factory=list)
+
+    @property
+    def input_bytes(self) -> int:
+        return sum(block.input_bytes for block in self.blocks)
+
+    @property
+    def output_bytes(self) -> int:
+        return sum(block.output_bytes for block in self.blocks)
+
+    @property
+    def entries(self) -> int:
+        return sum(block.entries for block in self.blocks)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format": MANIFEST_FORMAT,
+            "versions": self.versions,
+            "source": self.source,
+            "block_lines": self.block_lines,
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "entries": self.entries,
+            "blocks": [
+                [block.digest, block.input_bytes, block.entries, block.output_bytes]
+                for block in self.blocks
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PipelineManifest":
+        if data.get("format") != MANIFEST_FORMAT:
+            raise ValueError(f"Unsupported manifest format: {data.get('format')}")
+        return cls(
+            versions=data["versions"],
+            source=data["source"],
+            block_lines=data["block_lines"],
+            blocks=[BlockRecord(*block) for block in data["blocks"]],
+        )
+
+
+def load_manifest(path: Union[str, Path]) -> Optional[PipelineManifest]:
+    """
+    Read a manifest, returning None if it is missing or unreadable.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return PipelineManifest.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_manifest(manifest: PipelineManifest, path: Union[str, Path]) -> None:
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest.to_dict(), f, separators=(",", ":"))
+    os.replace(tmp_path, path)
@@ -0,0 +1,243 @@
+"""
+Per-stage timing and throughput instrumentation.
+
+A ``StageProfiler`` accumulates, per named stage, cumulative time, call
+counts, entries and bytes, from which entries/sec and bytes/sec follow.
+Stages are timed with the ``stage`` context manager or by wrapping an
+iterator with ``iter``. Times are exclusive: when a stage runs inside another
+(e.g. a lazy loader consumed by a validation loop), the inner time is
+subtracted from the outer stage, so the table adds up to the measured total.
+
+Hooks registered with ``add_hook`` are called with ``(stage, seconds,
+entries, nbytes)`` for every recorded sample, for live dashboards or custom
+logging. Profilers filled in worker processes are plain picklable objects
+whose counters can be ``merge``d into the parent's.
+
+Stage times from worker processes add up across workers, so with several
+workers the total can exceed wall-clock time.
+
+Instrumentation is per chunk or per item handed between stages, never per
+character, and code paths pass ``profiler=None`` when profiling is off.
+"""
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
+
+PROFILE_FORMAT = 1
+
+Hook = Callable[[str, float, int, int], None]
+T = TypeVar("T")
+
+_clock = time.perf_counter
+
+
+@dataclass
+class StageStats:
+    """
+    Cumulative counters of one stage.
+    """
+    calls: int = 0
+    seconds: float = 0.0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def entries_per_sec(self) -> float:
+        return self.entries / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+class StageSample:
+    """
+    Entries and bytes handled by one timed block; set them inside
+    ``StageProfiler.stage`` once they are known.
+    """
+    __slots__ = ("entries", "nbytes")
+
+    def __init__(self, entries: int = 0, nbytes: int = 0):
+        self.entries = entries
+        self.nbytes = nbytes
+
+
+class StageProfiler:
+    """
+    Collects per-stage timings in stage order of first use.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, StageStats] = {}
+        self._hooks: List[Hook] = []
+        self._nested: List[float] = []
+        self._started = _clock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Hooks may not pickle and the nesting stack is process-local
+        return {"stages": self.stages, "_started": self._started}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._hooks = []
+        self._nested = []
+
+    def add_hook(self, hook: Hook) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        self._hooks.remove(hook)
+
+    def record(
+        self,
+        name: str,
+        seconds: float = 0.0,
+        entries: int = 0,
+        nbytes: int = 0,
+        calls: int = 1,
+    ) -> None:
+        """
+        Add one sample to stage ``name``.
+        """
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        stats.calls += calls
+        stats.seconds += seconds
+        stats.entries += entries
+        stats.bytes += nbytes
+        for hook in self._hooks:
+            hook(name, seconds, entries, nbytes)
+
+    def _finish(self, name: str, started: float, entries: int, nbytes: int, calls: int = 1) -> None:
+        elapsed = _clock() - started
+        inner = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += elapsed
+        self.record(name, elapsed - inner, entries, nbytes, calls)
+
+    @contextmanager
+    def stage(self, name: str, entries: int = 0, nbytes: int = 0) -> Iterator[StageSample]:
+        """
+        Time the enclosed block as one call of stage ``name``.
+        """
+        sample = StageSample(entries, nbytes)
+        self._nested.append(0.0)
+        started = _clock()
+        try:
+            yield sample
+        finally:
+            self._finish(name, started, sample.entries, sample.nbytes)
+
+    def iter(
+        self,
+        name: str,
+        iterable: Iterable[T],
+        size: Optional[Callable[[T], int]] = None,
+        count: Optional[Callable[[T], int]] = None,
+    ) -> Iterator[T]:
+        """
+        Yield from ``iterable``, timing each item's production as one call of
+        stage ``name``. Each item counts as ``count(item)`` entries (default
+        1) and ``size(item)`` bytes (default 0); the time spent finding the
+        end of ``iterable`` is added without counting a call.
+        """
+        iterator = iter(iterable)
+        while True:
+            self._nested.append(0.0)
+            started = _clock()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self._finish(name, started, 0, 0, calls=0)
+                return
+            except BaseException:
+                self._finish(name, started, 0, 0)
+                raise
+            self._finish(
+                name,
+                started,
+                1 if count is None else count(item),
+                0 if size is None else size(item),
+            )
+            yield item
+
+    def merge(self, other: "StageProfiler") -> None:
+        """
+        Add the counters of ``other`` (e.g. from a worker process).
+        """
+        for name, stats in other.stages.items():
+            self.record(name, stats.seconds, stats.entries, stats.bytes, stats.calls)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stats.seconds for stats in self.stages.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable snapshot, for regression tracking.
+        """
+        return {
+            "format": PROFILE_FORMAT,
+            "wall_seconds": _clock() - self._started,
+            "total_seconds": self.total_seconds,
+            "stages": {
+                name: dict(
+                    asdict(stats),
+                    entries_per_sec=stats.entries_per_sec,
+                    bytes_per_sec=stats.bytes_per_sec,
+                )
+                for name, stats in self.stages.items()
+            },
+        }
+
+    def dump(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def format_table(self) -> List[str]:
+        """
+        The stage table, one line per stage plus a total.
+        """
+        total = self.total_seconds
+        lines = [
+            f"{'Stage':<14} {'Calls':>9} {'Time (s)':>10} {'Share':>7} "
+            f"{'Entries':>10} {'Entries/s':>12} {'MB':>9} {'MB/s':>9}"
+        ]
+        for name, stats in self.stages.items():
+            share = stats.seconds / total * 100 if total > 0 else 0.0
+            lines.append(
+                f"{name:<14} {stats.calls:>9} {stats.seconds:>10.3f} {share:>6.1f}% "
+                f"{stats.entries:>10} {stats.entries_per_sec:>12,.0f} "
+                f"{stats.bytes / 1e6:>9.2f} {stats.bytes_per_sec / 1e6:>9.2f}"
+            )
+        lines.append(f"{'total':<14} {'':>9} {total:>10.3f} {'100.0%' if total > 0 else '':>7}")
+        return lines
+
+
+def profile_stage(profiler: Optional[StageProfiler], name: str, entries: int = 0, nbytes: int = 0):
+    """
+    ``profiler.stage(...)``, or a no-op context yielding a throwaway sample
+    when ``profiler`` is None.
+    """
+    if profiler is None:
+        return nullcontext(StageSample(entries, nbytes))
+    return profiler.stage(name, entries, nbytes)
+
+
+def print_profile(profiler: StageProfiler, json_path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Print the stage table and optionally dump it as JSON.
+    """
+    print("\n--- PROFILE ---")
+    for line in profiler.format_table():
+        print(line)
+    if json_path is not None:
+        profiler.dump(json_path)
+        print(f"Profile written to: {json_path}")
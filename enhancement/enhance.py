@@ -5,6 +5,10 @@ Provides utilities for improving entry quality, clarity, and density.
 """
 from typing import Mapping, Any
 
+# Bump whenever enhance_entry output changes; incremental pipeline runs
+# reprocess everything when it changes.
+ENHANCE_VERSION = 1
+
 
 def enhance_entry(entry: Mapping[str, Any]) -> dict:
     """
@@ -3,6 +3,7 @@ Extraction Stage - NDRP Pipeline
 
 The extraction stage is responsible for:
 - Loading raw text data from files
+- Dropping exact and near-duplicate lines
 - Detecting the mode/type of each entry (instruction, conversation, narrative, etc.)
 - Creating preliminary NDRP entries with basic metadata
 - Isolating meaningful content from noise
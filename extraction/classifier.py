@@ -2,79 +2,211 @@
 Mode classifier for NDRP extraction stage.
 
 Detects the mode/type of text entries using simple heuristics.
+
+All marker lists are compiled once into a single trie-shaped regular
+expression, so each text is scanned in one pass instead of one substring
+search per marker.
 """
-from typing import Literal
+import re
+from typing import Dict, Iterable, List, Literal, Pattern, Tuple, Union, get_args
 
 
 ModeType = Literal["instruction", "conversation", "narrative", "reasoning", "context", "meta", "emotion", "other"]
 
+# Every mode, in a fixed order; a mode's index is its compact (uint8) code
+MODES: Tuple[ModeType, ...] = get_args(ModeType)
+MODE_CODES: Dict[str, int] = {mode: code for code, mode in enumerate(MODES)}
 
-def detect_mode(text: str) -> ModeType:
-    """
-    Detect the mode of a text entry using simple heuristics.
-    
-    This is a basic classifier that uses text patterns to determine
-    the likely mode of the entry. More sophisticated classification
-    can be added in future versions.
-    
-    Args:
-        text: The text to classify
-        
-    Returns:
-        One of: "instruction", "conversation", "narrative", "reasoning",
-                "context", "meta", "emotion", "other"
-    """
-    text_lower = text.lower()
-    
+
+# Marker tables in priority order: the first mode with any marker present wins.
+MODE_MARKERS: Tuple[Tuple[ModeType, Tuple[str, ...]], ...] = (
     # Reasoning patterns (check first - more specific)
-    reasoning_markers = [
+    ("reasoning", (
         "because", "therefore", "thus", "hence",
         "consequently", "as a result", "this means",
-        "let's think", "step by step", "first,", "second,"
-    ]
-    if any(marker in text_lower for marker in reasoning_markers):
-        return "reasoning"
-    
+        "let's think", "step by step", "first,", "second,",
+    )),
     # Instruction patterns
-    instruction_markers = [
+    ("instruction", (
         "how to", "please", "can you", "could you", "would you",
         "tell me", "show me", "explain", "describe", "define",
-        "what is", "what are", "why", "when", "where"
-    ]
-    if any(marker in text_lower for marker in instruction_markers):
-        return "instruction"
-    
+        "what is", "what are", "why", "when", "where",
+    )),
     # Narrative patterns (check before conversation - more specific)
-    narrative_markers = [
+    ("narrative", (
         "once upon", "story", "tale", "long ago",
-        "there was", "there were", "in the beginning"
-    ]
-    if any(marker in text_lower for marker in narrative_markers):
-        return "narrative"
-    
+        "there was", "there were", "in the beginning",
+    )),
     # Conversation patterns
-    conversation_markers = [
+    ("conversation", (
         "hello", "hi ", " hey ", "thanks", "thank you",
-        "goodbye", "bye", "see you", "nice to"
-    ]
-    if any(marker in text_lower for marker in conversation_markers):
-        return "conversation"
-    
+        "goodbye", "bye", "see you", "nice to",
+    )),
     # Emotion patterns
-    emotion_markers = [
+    ("emotion", (
         "feel", "feeling", "felt", "emotion", "happy", "sad",
-        "angry", "excited", "worried", "anxious", "love", "hate"
-    ]
-    if any(marker in text_lower for marker in emotion_markers):
-        return "emotion"
-    
+        "angry", "excited", "worried", "anxious", "love", "hate",
+    )),
     # Meta patterns (discussing the conversation itself)
-    meta_markers = [
+    ("meta", (
         "this conversation", "our discussion", "what we're talking about",
-        "the topic", "let's change", "back to"
-    ]
-    if any(marker in text_lower for marker in meta_markers):
-        return "meta"
-    
-    # Default to "other" if no clear pattern is detected
-    return "other"
+        "the topic", "let's change", "back to",
+    )),
+)
+
+# Default to "other" if no clear pattern is detected
+DEFAULT_MODE: ModeType = "other"
+
+# Bump whenever marker tables or matching rules change detected modes;
+# incremental pipeline runs reprocess everything when it changes.
+CLASSIFIER_VERSION = 1
+
+
+def _trie_pattern(markers: Iterable[str]) -> str:
+    """
+    Build a regex matching any of ``markers`` with shared prefixes factored
+    out. At each trie node the branches start with distinct characters, so a
+    match is always the longest marker starting at that position.
+    """
+    trie: Dict[str, dict] = {}
+    for marker in markers:
+        node = trie
+        for char in marker:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+def _compile_markers(
+    mode_markers: Tuple[Tuple[ModeType, Tuple[str, ...]], ...],
+) -> Tuple[Pattern[str], Dict[str, Tuple[int, ...]]]:
+    """
+    Compile marker tables into one lookahead pattern that reports every
+    position where some marker starts, plus a marker -> priorities map.
+
+    A matched marker also implies a hit for every marker that is a prefix of
+    it, so each marker maps to the priorities of all its prefixes (itself
+    included), best first.
+    """
+    priority_by_marker: Dict[str, int] = {}
+    for priority, (_mode, markers) in enumerate(mode_markers):
+        for marker in markers:
+            priority_by_marker.setdefault(marker, priority)
+
+    priorities: Dict[str, Tuple[int, ...]] = {}
+    for marker in priority_by_marker:
+        priorities[marker] = tuple(sorted({
+            priority
+            for other, priority in priority_by_marker.items()
+            if marker.startswith(other)
+        }))
+
+    pattern = re.compile("(?=(" + _trie_pattern(priority_by_marker) + "))")
+    return pattern, priorities
+
+
+_MARKER_PATTERN, _MARKER_PRIORITIES = _compile_markers(MODE_MARKERS)
+_MARKER_PRIORITY: Dict[str, int] = {
+    marker: priorities[0] for marker, priorities in _MARKER_PRIORITIES.items()
+}
+_MODES_BY_PRIORITY: List[ModeType] = [mode for mode, _markers in MODE_MARKERS]
+
+
+def _best_priority(text_lower: str) -> int:
+    """
+    Priority of the best-ranked marker found in ``text_lower``, or
+    ``len(MODE_MARKERS)`` when no marker matches.
+    """
+    best = len(_MODES_BY_PRIORITY)
+    for match in _MARKER_PATTERN.finditer(text_lower):
+        priority = _MARKER_PRIORITY[match.group(1)]
+        if priority < best:
+            best = priority
+            if best == 0:
+                break
+    return best
+
+
+def _mode_for_priority(priority: int) -> ModeType:
+    if priority < len(_MODES_BY_PRIORITY):
+        return _MODES_BY_PRIORITY[priority]
+    return DEFAULT_MODE
+
+
+def detect_mode(text: str) -> ModeType:
+    """
+    Detect the mode of a text entry using simple heuristics.
+
+    This is a basic classifier that uses text patterns to determine
+    the likely mode of the entry. More sophisticated classification
+    can be added in future versions.
+
+    Args:
+        text: The text to classify
+
+    Returns:
+        One of: "instruction", "conversation", "narrative", "reasoning",
+                "context", "meta", "emotion", "other"
+    """
+    return _mode_for_priority(_best_priority(text.lower()))
+
+
+def detect_modes(
+    texts: Iterable[str],
+    with_counts: bool = False,
+) -> Union[List[ModeType], Tuple[List[ModeType], List[List[int]]]]:
+    """
+    Classify a batch of texts; equivalent to ``[detect_mode(t) for t in texts]``.
+
+    This is a convenience wrapper: each text is matched on its own, so it
+    costs the same as that loop. With ``with_counts`` the full text is scanned and per-mode hit counts are
+    returned as well: one row per text, one column per mode in
+    ``MODE_MARKERS`` order, counting positions where a marker of that mode
+    starts.
+
+    Args:
+        texts: The texts to classify
+        with_counts: Also return per-mode hit counts
+
+    Returns:
+        The list of modes, or ``(modes, counts)`` when ``with_counts`` is set
+    """
+    if not with_counts:
+        return [_mode_for_priority(_best_priority(text.lower())) for text in texts]
+
+    finditer = _MARKER_PATTERN.finditer
+    priorities_of = _MARKER_PRIORITIES
+    no_match = len(_MODES_BY_PRIORITY)
+    modes: List[ModeType] = []
+    counts: List[List[int]] = []
+    for text in texts:
+        row = [0] * no_match
+        for match in finditer(text.lower()):
+            for priority in priorities_of[match.group(1)]:
+                row[priority] += 1
+        best = next((priority for priority, hits in enumerate(row) if hits), no_match)
+        modes.append(_mode_for_priority(best))
+        counts.append(row)
+    return modes, counts
+
+
+def _detect_mode_sequential(text: str) -> ModeType:
+    """
+    Reference implementation: one substring search per marker, in priority
+    order. Kept for differential tests and benchmarks of ``detect_mode``.
+    """
+    text_lower = text.lower()
+    for mode, markers in MODE_MARKERS:
+        if any(marker in text_lower for marker in markers):
+            return mode
+    return DEFAULT_MODE
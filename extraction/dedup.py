@@ -0,0 +1,415 @@
+"""
+Duplicate line elimination for the NDRP extraction stage.
+
+``Deduplicator`` sits between ``load_raw_lines`` and ``extract_entries`` and
+drops lines already seen, keeping the first copy:
+
+- Exact duplicates are caught by a 64-bit digest of the line.
+- Near duplicates are caught by MinHash signatures over character shingles
+  of the lowercased, whitespace-collapsed line, split into LSH bands. A line
+  whose band matches a band of any kept line is a near duplicate; pairs with
+  Jaccard similarity above roughly ``(1 / bands) ** (1 / rows)`` are caught
+  with high probability.
+
+Seen digests and band keys are kept in a ``DigestSet`` (exact, grows with the
+input) or, when a capacity is given, in fixed-size ``BloomFilter``s whose
+memory is bounded at the cost of a small false positive rate (a unique line
+wrongly dropped). MinHash uses NumPy when installed; the pure Python path
+computes identical signatures.
+"""
+import math
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from itertools import islice, repeat
+from random import Random
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+DEDUP_MODES = ("exact", "near")
+
+# MinHash defaults: 16 bands of 8 rows flag pairs above ~0.71 Jaccard
+NUM_PERM = 128
+BANDS = 16
+SHINGLE_SIZE = 5
+
+DEFAULT_ERROR_RATE = 0.001
+
+# Lines whose MinHash signatures are computed together by Deduplicator.filter
+DEDUP_BATCH_SIZE = 128
+
+# Fixed seed so signatures (and so dedup decisions) are reproducible
+MINHASH_SEED = 1
+
+# Multipliers folding shingle code points and band rows into one hash
+SHINGLE_MULT = 0x01000193
+BAND_MULT = 0x100000001B3
+
+_MASK32 = 0xFFFFFFFF
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def line_digest(text: str, salt: bytes = b"") -> int:
+    """
+    Stable 64-bit digest of ``text``.
+    """
+    return int.from_bytes(blake2b(salt + text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class DigestSet:
+    """
+    Exact set of 64-bit digests.
+    """
+
+    def __init__(self):
+        self._digests = set()
+
+    def add(self, key: int) -> bool:
+        """
+        Add ``key``; returns True if it was already present.
+        """
+        if key in self._digests:
+            return True
+        self._digests.add(key)
+        return False
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over 64-bit digests.
+
+    Sized for ``capacity`` keys at ``error_rate`` false positives; bit
+    positions come from double hashing of the two 32-bit halves of a key.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_ERROR_RATE):
+        if capacity < 1:
+            raise ValueError("Bloom filter capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1")
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, key: int) -> range:
+        # low + i * high for i < hash_count, taken modulo size by the caller
+        high = (key >> 32) | 1
+        low = key & _MASK32
+        return range(low, low + self.hash_count * high, high)
+
+    def add(self, key: int) -> bool:
+        """
+        Add ``key``; returns True if it was (probably) already present.
+        """
+        bits = self._bits
+        size = self.size
+        present = True
+        for position in self._positions(key):
+            position %= size
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        if not present:
+            self._count += 1
+        return present
+
+    def __contains__(self, key: int) -> bool:
+        bits = self._bits
+        size = self.size
+        for position in self._positions(key):
+            position %= size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """
+        Number of keys added that were not already (probably) present.
+        """
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+def _seen_set(capacity: Optional[int], error_rate: float):
+    return DigestSet() if capacity is None else BloomFilter(capacity, error_rate)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[int]:
+    """
+    Distinct 32-bit hashes of the character ``size``-grams of ``text`` after
+    lowercasing and collapsing whitespace (one shingle for shorter texts,
+    hashed as 0 for empty ones).
+
+    A shingle's hash is the polynomial ``sum(c[i] * SHINGLE_MULT ** (size - 1 - i))``
+    of its code points, modulo 2**32.
+    """
+    code_points = [ord(char) for char in _normalize(text)]
+    size = max(1, min(size, len(code_points)))
+    hashes = set()
+    for start in range(len(code_points) - size + 1):
+        value = 0
+        for code_point in code_points[start:start + size]:
+            value = (value * SHINGLE_MULT + code_point) & _MASK32
+        hashes.add(value)
+    return sorted(hashes) or [0]
+
+
+def _mix64(value: int) -> int:
+    # splitmix64 finalizer
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class MinHasher:
+    """
+    MinHash signatures and LSH band keys.
+
+    Signatures use ``num_perm`` hash functions ``(a * x + b) mod 2**32`` with
+    odd ``a``. Each band's rows are folded into one 64-bit key (seeded by the
+    band index) and finalized with splitmix64. The NumPy path shingles,
+    hashes and bands a whole batch of lines in a handful of array
+    operations and returns exactly what the pure Python path does.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = NUM_PERM,
+        bands: int = BANDS,
+        shingle_size: int = SHINGLE_SIZE,
+        seed: int = MINHASH_SEED,
+    ):
+        if bands < 1 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        rng = Random(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.multipliers = [rng.getrandbits(32) | 1 for _ in range(num_perm)]
+        self.increments = [rng.getrandbits(32) for _ in range(num_perm)]
+        if np is not None:
+            self._a = np.array(self.multipliers, dtype=np.uint64)[:, None]
+            self._b = np.array(self.increments, dtype=np.uint64)[:, None]
+            self._band_seeds = np.arange(1, bands + 1, dtype=np.uint64)
+
+    def signatures(self, texts: Sequence[str]) -> List[List[int]]:
+        """
+        MinHash signature of each text's shingles.
+        """
+        if np is not None and texts:
+            return self._signatures_numpy(texts).tolist()
+        return [self._signature_python(text) for text in texts]
+
+    def band_keys(self, texts: Sequence[str]) -> List[List[int]]:
+        """
+        One 64-bit LSH key per band of each text's signature.
+        """
+        if np is not None and texts:
+            return self._band_keys_numpy(self._signatures_numpy(texts)).tolist()
+        return [self._band_keys_python(self._signature_python(text)) for text in texts]
+
+    def _signature_python(self, text: str) -> List[int]:
+        hashes = shingles(text, self.shingle_size)
+        return [
+            min(((a * x + b) & _MASK32) for x in hashes)
+            for a, b in zip(self.multipliers, self.increments)
+        ]
+
+    def _band_keys_python(self, signature: List[int]) -> List[int]:
+        keys = []
+        rows = self.rows
+        for band in range(self.bands):
+            key = band + 1
+            for value in signature[band * rows:(band + 1) * rows]:
+                key = (key * BAND_MULT + value) & _MASK64
+            keys.append(_mix64(key))
+        return keys
+
+    def _shingle_hashes_numpy(self, texts: Sequence[str]):
+        """
+        Shingle hashes of all texts (duplicates included, which cannot change
+        a minimum) and the index of each text's first one.
+        """
+        normalized = [_normalize(text) for text in texts]
+        lengths = np.fromiter(map(len, normalized), dtype=np.int64, count=len(normalized))
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        code_points = np.frombuffer("".join(normalized).encode("utf-32-le"), dtype="<u4").astype(np.uint64)
+        size = self.shingle_size
+
+        # Rolling hash of every window of the concatenated text; keep those
+        # that start and end inside one text
+        count = max(0, len(code_points) - size + 1)
+        hashes = np.zeros(count, dtype=np.uint64)
+        for offset in range(size):
+            hashes = (hashes * SHINGLE_MULT + code_points[offset:offset + count]) & _MASK32
+        owners = np.repeat(np.arange(len(texts)), lengths)[:count]
+        valid = np.arange(count) - offsets[owners] <= lengths[owners] - size
+        hashes, owners = hashes[valid], owners[valid]
+
+        # Texts shorter than a shingle are one shingle each
+        short = np.flatnonzero(lengths < size)
+        if len(short):
+            short_hashes = [shingles(normalized[i], size)[0] for i in short]
+            hashes = np.concatenate((hashes, np.array(short_hashes, dtype=np.uint64)))
+            owners = np.concatenate((owners, short))
+            order = np.argsort(owners, kind="stable")
+            hashes, owners = hashes[order], owners[order]
+
+        return hashes, np.searchsorted(owners, np.arange(len(texts)))
+
+    def _signatures_numpy(self, texts: Sequence[str]):
+        hashes, starts = self._shingle_hashes_numpy(texts)
+        values = (self._a * hashes[None, :] + self._b) & _MASK32
+        return np.minimum.reduceat(values, starts, axis=1).T
+
+    def _band_keys_numpy(self, signatures):
+        rows = signatures.reshape(len(signatures), self.bands, self.rows)
+        keys = np.broadcast_to(self._band_seeds, rows.shape[:2]).copy()
+        for row in range(self.rows):
+            keys = keys * BAND_MULT + rows[:, :, row]
+        keys ^= keys >> 30
+        keys *= 0xBF58476D1CE4E5B9
+        keys ^= keys >> 27
+        keys *= 0x94D049BB133111EB
+        keys ^= keys >> 31
+        return keys
+
+
+@dataclass
+class DedupCounts:
+    """
+    Duplicate counts for one source.
+    """
+    lines: int = 0
+    exact: int = 0
+    near: int = 0
+
+    @property
+    def kept(self) -> int:
+        return self.lines - self.exact - self.near
+
+
+@dataclass
+class Deduplicator:
+    """
+    Streaming exact and near-duplicate filter shared across sources.
+
+    Attributes:
+        near: Also drop near duplicates (MinHash LSH), not just exact ones
+        num_perm: MinHash signature length
+        bands: LSH bands; ``num_perm`` must be a multiple of it
+        shingle_size: Character shingle length
+        capacity: Expected number of distinct lines; when set, seen keys are
+            kept in Bloom filters of bounded size instead of exact sets
+        error_rate: Chance that a unique line is dropped by a Bloom filter
+            false positive, per filter (the line filter and, in near mode,
+            the band filter)
+    """
+    near: bool = True
+    num_perm: int = NUM_PERM
+    bands: int = BANDS
+    shingle_size: int = SHINGLE_SIZE
+    capacity: Optional[int] = None
+    error_rate: float = DEFAULT_ERROR_RATE
+    counts: Dict[Optional[str], DedupCounts] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self._hasher = (
+            MinHasher(self.num_perm, self.bands, self.shingle_size) if self.near else None
+        )
+        self._lines = _seen_set(self.capacity, self.error_rate)
+        # A line is dropped if any one of its band keys is a false positive,
+        # so the band filter gets 1/bands of the error budget
+        self._band_keys = None
+        if self.near:
+            self._band_keys = _seen_set(
+                None if self.capacity is None else self.capacity * self.bands,
+                self.error_rate / self.bands,
+            )
+
+    @property
+    def threshold(self) -> float:
+        """
+        Approximate Jaccard similarity above which near duplicates are caught.
+        """
+        rows = self.num_perm // self.bands
+        return (1 / self.bands) ** (1 / rows)
+
+    def classify(self, text: str) -> Optional[str]:
+        """
+        Record ``text`` and return "exact" or "near" if it duplicates an
+        earlier line, else None.
+        """
+        return self._classify(text, None)
+
+    def _classify(self, text: str, band_keys: Optional[List[int]]) -> Optional[str]:
+        if self._lines.add(line_digest(text)):
+            return "exact"
+        if self._hasher is None:
+            return None
+
+        if band_keys is None:
+            band_keys = self._hasher.band_keys([text])[0]
+        seen = self._band_keys
+        if any(key in seen for key in band_keys):
+            return "near"
+        for key in band_keys:
+            seen.add(key)
+        return None
+
+    def filter(self, lines: Iterable[str], source: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the lines of ``source`` that are not duplicates, counting the
+        dropped ones in ``counts[source]``. Band keys are computed for
+        ``DEDUP_BATCH_SIZE`` lines at a time.
+        """
+        counts = self.counts.setdefault(source, DedupCounts())
+        line_iter = iter(lines)
+        while True:
+            batch = list(islice(line_iter, DEDUP_BATCH_SIZE))
+            if not batch:
+                return
+            if self._hasher is None:
+                batch_keys = repeat(None)
+            else:
+                batch_keys = self._hasher.band_keys(batch)
+
+            for line, band_keys in zip(batch, batch_keys):
+                counts.lines += 1
+                kind = self._classify(line, band_keys)
+                if kind is None:
+                    yield line
+                elif kind == "exact":
+                    counts.exact += 1
+                else:
+                    counts.near += 1
+
+
+def format_dedup_counts(counts: Dict[Optional[str], DedupCounts]) -> List[str]:
+    """
+    One summary line per source.
+    """
+    return [
+        f"{source or '<unknown>'}: {c.lines} lines, {c.exact} exact and "
+        f"{c.near} near duplicates removed, {c.kept} kept"
+        for source, c in counts.items()
+    ]
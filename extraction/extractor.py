@@ -2,15 +2,25 @@
 Entry extractor for NDRP extraction stage.
 
 Converts raw text lines into preliminary NDRP entries with metadata.
+
+Entries are slotted dataclasses. For large batches ``extract_batch`` returns
+an ``ExtractedBatch`` instead: a struct-of-arrays container holding the
+contents, one uint8 mode code per entry and interned source ids, which
+``standardization.rewrite.to_ndrp_entries`` consumes directly.
 """
-from dataclasses import dataclass, asdict
-from typing import Iterable, Optional, Any, Mapping
+from array import array
+from dataclasses import dataclass, field
+from itertools import islice, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Mapping
 
-from .classifier import detect_mode
+from .classifier import MODE_CODES, MODES, ModeType, detect_modes
 from .metadata import ExtractionMetadata
 
+# Lines are classified in batches of this size
+EXTRACT_BATCH_SIZE = 1024
+
 
-@dataclass
+@dataclass(slots=True)
 class PreNDRPEntry:
     """
     A preliminary NDRP entry created during extraction.
@@ -26,6 +36,100 @@ class PreNDRPEntry:
     metadata: ExtractionMetadata
 
 
+@dataclass(slots=True)
+class ExtractedBatch:
+    """
+    Struct-of-arrays form of a run of preliminary entries.
+
+    Attributes:
+        contents: Raw text of each entry
+        mode_codes: Each entry's mode as an index into ``MODES`` (uint8)
+        source_ids: Each entry's source as an index into ``sources`` (uint32)
+        sources: Interned source identifiers
+    """
+    contents: List[str] = field(default_factory=list)
+    mode_codes: array = field(default_factory=lambda: array("B"))
+    source_ids: array = field(default_factory=lambda: array("I"))
+    sources: List[Optional[str]] = field(default_factory=list)
+    _source_lookup: Dict[Optional[str], int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def intern_source(self, source: Optional[str]) -> int:
+        """
+        Id of ``source`` in ``sources``, adding it on first use.
+        """
+        source_id = self._source_lookup.get(source)
+        if source_id is None:
+            source_id = len(self.sources)
+            self.sources.append(source)
+            self._source_lookup[source] = source_id
+        return source_id
+
+    def append(self, content: str, mode: ModeType, source: Optional[str] = None) -> None:
+        self.contents.append(content)
+        self.mode_codes.append(MODE_CODES[mode])
+        self.source_ids.append(self.intern_source(source))
+
+    def extend(
+        self,
+        contents: List[str],
+        modes: Iterable[ModeType],
+        source: Optional[str] = None,
+    ) -> None:
+        """
+        Add entries that share one source.
+        """
+        self.contents.extend(contents)
+        self.mode_codes.extend(map(MODE_CODES.__getitem__, modes))
+        self.source_ids.extend(repeat(self.intern_source(source), len(contents)))
+
+    def mode(self, index: int) -> ModeType:
+        return MODES[self.mode_codes[index]]
+
+    def source(self, index: int) -> Optional[str]:
+        return self.sources[self.source_ids[index]]
+
+    def __getitem__(self, index: int) -> PreNDRPEntry:
+        return PreNDRPEntry(
+            content=self.contents[index],
+            metadata=ExtractionMetadata(source=self.source(index), mode=self.mode(index)),
+        )
+
+    def __iter__(self) -> Iterator[PreNDRPEntry]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def iter_dicts(self) -> Iterator[dict]:
+        """
+        Flat dictionaries, as ``extract_entries_as_dicts`` yields them.
+        """
+        sources = self.sources
+        for content, mode_code, source_id in zip(self.contents, self.mode_codes, self.source_ids):
+            yield {"content": content, "source": sources[source_id], "mode": MODES[mode_code]}
+
+
+def extract_batch(lines: Iterable[str], source: Optional[str] = None) -> ExtractedBatch:
+    """
+    Extract preliminary entries for ``lines`` into one ``ExtractedBatch``.
+
+    Args:
+        lines: Iterable of raw text lines
+        source: Optional source identifier for metadata
+
+    Returns:
+        The batch, in input order
+    """
+    batch = ExtractedBatch()
+    line_iter = iter(lines)
+    while True:
+        chunk = list(islice(line_iter, EXTRACT_BATCH_SIZE))
+        if not chunk:
+            return batch
+        batch.extend(chunk, detect_modes(chunk), source)
+
+
 def extract_entries(
     lines: Iterable[str],
     source: Optional[str] = None
@@ -40,21 +144,25 @@ def extract_entries(
     Yields:
         PreNDRPEntry objects with detected mode and metadata
     """
-    for line in lines:
-        # Detect mode using classifier
-        mode = detect_mode(line)
-        
-        # Create metadata
-        metadata = ExtractionMetadata(
-            source=source,
-            mode=mode
-        )
-        
-        # Create preliminary entry
-        yield PreNDRPEntry(
-            content=line,
-            metadata=metadata
-        )
+    line_iter = iter(lines)
+    while True:
+        batch = list(islice(line_iter, EXTRACT_BATCH_SIZE))
+        if not batch:
+            return
+
+        # Detect modes for the whole batch using classifier
+        for line, mode in zip(batch, detect_modes(batch)):
+            # Create metadata
+            metadata = ExtractionMetadata(
+                source=source,
+                mode=mode
+            )
+            
+            # Create preliminary entry
+            yield PreNDRPEntry(
+                content=line,
+                metadata=metadata
+            )
 
 
 def extract_entries_as_dicts(
@@ -2,11 +2,14 @@
 Raw data loader for NDRP extraction stage.
 
 Provides utilities for loading raw text files and preparing them
-for entry extraction.
+for entry extraction. Compressed inputs (gzip, bzip2, xz, zstd) are
+decoded on the fly.
 """
 from pathlib import Path
 from typing import Iterable, Union
 
+from dataio.compression import open_input
+
 
 def load_raw_lines(path: Union[str, Path]) -> Iterable[str]:
     """
@@ -20,7 +23,7 @@ def load_raw_lines(path: Union[str, Path]) -> Iterable[str]:
     """
     path = Path(path)
     
-    with open(path, "r", encoding="utf-8") as f:
+    with open_input(path) as f:
         for line in f:
             line = line.strip()
             if line:  # Only yield non-empty lines
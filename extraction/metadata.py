@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionMetadata:
     """
     Metadata collected during the extraction stage.
@@ -3,158 +3,746 @@
 NDRP CLI wrapper (v1)
 
 Thin orchestration layer to validate NDRP data, compute hygiene scores, and
-optionally emit a JSON report.
+optionally emit a JSON report. The ``metrics`` command writes per-entry text
+metrics as a columnar table and prints distribution summaries. Both commands
+accept ``--profile`` to print per-stage timings (see dataio/profiling.py).
+
+Modules used by only one command are imported when that command runs, so
+``--help``, argument errors and short runs from job schedulers start fast.
 """
 import argparse
 import json
+import os
 import sys
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+from dataio.compression import compression_from_extension, is_compressed, open_input
+from validator.aggregation import HygieneAggregator
 
-from validator.aggregation import aggregate_validator_results
-from validator.validate import validate_entry
+if TYPE_CHECKING:
+    from dataio.jsonl_sink import JSONLSink
+    from dataio.profiling import StageProfiler
+    from validator.cache import ValidationCache
 
-# Validation errors do not currently expose severities; map them to "high"
+# Validation errors do not expose severities themselves; derive one from the
+# failing schema keyword (or semantic check) and fall back to "high"
 # (10-point weight) for deterministic scoring.
 DEFAULT_ERROR_SEVERITY = "high"
+KEYWORD_SEVERITIES: Mapping[str, str] = {
+    "required": "high",
+    "type": "high",
+    "non_empty": "high",
+    "enum": "medium",
+    "coherence": "medium",
+}
 REDACTED_PLACEHOLDER = "[REDACTED]"
 
+# Width of histogram bars printed by the metrics command
+HISTOGRAM_WIDTH = 30
+
+# Input is read in chunks of this many characters when streaming JSON arrays.
+READ_CHUNK_SIZE = 1 << 20
+JSON_WHITESPACE = " \t\n\r"
+# A decode error this close to the end of the buffer (or an unterminated
+# string) may only mean the entry is cut off at the chunk boundary; any other
+# error is reported without reading further.
+TRUNCATION_MARGIN = 16
+
+# Table formats of the metrics command, as in dataio.columnar.COLUMNAR_FORMATS
+# (not imported so that building the parser stays cheap)
+METRICS_FORMATS = ("parquet", "npz", "csv")
 
-def _load_entries(input_path: Path) -> List[Dict[str, Any]]:
+
+def _iter_entries(input_path: Path) -> Iterator[Dict[str, Any]]:
     """
-    Load entries from a JSON or JSONL file.
+    Lazily yield entries from a JSON or JSONL file.
+
+    The format is sniffed from the first non-whitespace character:
+    - ``[``: JSON array of objects, decoded incrementally element by element
+    - anything else: JSONL where each non-empty line is an object; a single
+      (possibly pretty-printed) JSON object is also accepted
 
-    Accepts:
-    - JSON object (treated as single entry)
-    - JSON array of objects
-    - JSONL where each non-empty line is an object
+    Memory use is bounded by the largest single entry, not the file size.
+    Compressed input (gzip, bzip2, xz, zstd) is decoded on the fly.
     """
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    with input_path.open("r", encoding="utf-8") as f:
-        raw_content = f.read()
+    # Sniff on a separate handle: compressed streams cannot always rewind.
+    with open_input(input_path) as f:
+        first_char = f.read(READ_CHUNK_SIZE).lstrip()[:1]
+
+    with open_input(input_path) as f:
+        if first_char == "[":
+            yield from _iter_json_array(f)
+        elif first_char in ("{", ""):
+            yield from _iter_jsonl(f, input_path)
+        else:
+            raise ValueError("Input JSON must be an object or array of objects")
+
 
+def _iter_jsonl(f: TextIO, input_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one object per non-empty line. If the first non-empty line is not
+    valid JSON on its own, the file is retried as one multi-line JSON object.
+    """
+    found = False
+    for line_no, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            parsed_line = json.loads(line)
+        except json.JSONDecodeError as exc:
+            if not found:
+                single = _parse_single_object(input_path)
+                if single is not None:
+                    yield single
+                    return
+            raise ValueError(f"Invalid JSON on line {line_no}: {exc.msg}") from exc
+        if not isinstance(parsed_line, dict):
+            raise ValueError(f"Entry on line {line_no} must be a JSON object")
+        found = True
+        yield parsed_line
+
+    if not found:
+        raise ValueError("No entries found in input file")
+
+
+def _parse_single_object(input_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Parse the whole file as one JSON object, returning None if it is not one.
+    """
     try:
-        parsed = json.loads(raw_content)
+        with open_input(input_path) as f:
+            parsed = json.loads(f.read())
     except json.JSONDecodeError:
-        entries: List[Dict[str, Any]] = []
-        for line_no, line in enumerate(raw_content.splitlines(), start=1):
-            if not line.strip():
-                continue
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _iter_json_array(f: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Incrementally decode a top-level JSON array, holding at most one chunk
+    plus the entry being decoded in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def next_token() -> str:
+        # Skip whitespace, reading more input as needed; "" means end of file.
+        nonlocal buffer, pos, eof
+        while True:
+            while pos < len(buffer) and buffer[pos] in JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return buffer[pos:pos + 1]
+            buffer = f.read(READ_CHUNK_SIZE)
+            pos = 0
+            eof = not buffer
+
+    if next_token() != "[":
+        raise ValueError("Input JSON must be an object or array of objects")
+    pos += 1
+
+    index = 0
+    while True:
+        token = next_token()
+        if token == "]" and index == 0:
+            raise ValueError("Input JSON array is empty")
+        if token == "]":
+            pos += 1
+            break
+        if index > 0:
+            if token != ",":
+                raise ValueError(f"Invalid JSON in array after entry {index}: expected ',' or ']'")
+            pos += 1
+            next_token()
+
+        index += 1
+        while True:
             try:
-                parsed_line = json.loads(line)
+                item, pos = decoder.raw_decode(buffer, pos)
+                break
             except json.JSONDecodeError as exc:
-                raise ValueError(f"Invalid JSON on line {line_no}: {exc.msg}") from exc
-            if not isinstance(parsed_line, dict):
-                raise ValueError(f"Entry on line {line_no} must be a JSON object")
-            entries.append(parsed_line)
-        if not entries:
-            raise ValueError("No entries found in input file")
-        return entries
-    else:
-        if isinstance(parsed, dict):
-            return [parsed]
-        if isinstance(parsed, list):
-            entries = []
-            for idx, item in enumerate(parsed, start=1):
-                if not isinstance(item, dict):
-                    raise ValueError(f"Entry {idx} in array must be a JSON object")
-                entries.append(item)
-            if not entries:
-                raise ValueError("Input JSON array is empty")
-            return entries
-        raise ValueError("Input JSON must be an object or array of objects")
+                truncated = (
+                    exc.pos >= len(buffer) - TRUNCATION_MARGIN
+                    or exc.msg.startswith("Unterminated string")
+                )
+                if eof or not truncated:
+                    raise ValueError(f"Invalid JSON in array entry {index}: {exc.msg}") from exc
+                # Entry straddles the chunk boundary; drop consumed input and read more.
+                more = f.read(max(READ_CHUNK_SIZE, len(buffer)))
+                eof = not more
+                buffer = buffer[pos:] + more
+                pos = 0
+
+        if not isinstance(item, dict):
+            raise ValueError(f"Entry {index} in array must be a JSON object")
+        yield item
+
+        if pos > READ_CHUNK_SIZE:
+            buffer = buffer[pos:]
+            pos = 0
+
+    if next_token():
+        raise ValueError("Unexpected content after JSON array")
+
+
+def _iter_validation_results(
+    entries: Iterable[Mapping[str, Any]],
+    cache: Optional["ValidationCache"] = None,
+    profiler: Optional["StageProfiler"] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validate entries and yield structured results annotated with
+    severities. Every schema violation of an entry is collected in one
+    pass; each result carries the JSON pointer ``path`` and failing
+    ``keyword``, which select the severity via ``KEYWORD_SEVERITIES``.
 
+    With ``cache``, entries whose canonical content was validated before
+    reuse the stored findings instead of being checked again.
 
-def _collect_validation_results(entries: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Run existing validation logic on provided entries and return structured
-    results annotated with severities. All findings are tagged as "high" to
-    align with deterministic hygiene scoring until validators emit severity.
+    With ``profiler``, loading and validating each entry are timed as the
+    "load" and "validate" stages.
     """
-    results: List[Dict[str, Any]] = []
+    from dataio.profiling import profile_stage
+    from validator.engine import get_validator
+    from validator.validate import SCHEMA_PATH, collect_findings, format_findings
+
+    schema_validator = get_validator(SCHEMA_PATH)
+    if profiler is not None:
+        entries = profiler.iter("load", entries)
 
     for index, entry in enumerate(entries, start=1):
-        errors = validate_entry(entry, index)
-        for err in errors:
-            results.append({"entry": index, "severity": DEFAULT_ERROR_SEVERITY, "message": err})
+        with profile_stage(profiler, "validate", 1):
+            if cache is None:
+                findings = collect_findings(entry, index, schema_validator, all_errors=True)
+            else:
+                findings = format_findings(
+                    cache.check(entry, schema_validator, all_errors=True), index
+                )
+        yield from _annotate_findings(findings)
 
-    return results
 
+def _iter_validation_results_parallel(
+    input_path: Path,
+    workers: int,
+    line_range: Optional[Tuple[int, int]] = None,
+    cache_path: Optional[Path] = None,
+    cache_counts: Optional[Counter] = None,
+    profiler: Optional["StageProfiler"] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validate a JSONL file across ``workers`` processes. Results, and the
+    first load error raised, are identical to the serial path.
+    ``line_range`` restricts the run to lines ``first..last`` inclusive.
+    With ``cache_path`` each worker uses the findings cache; per-chunk hit,
+    miss and time-saved totals are added to ``cache_counts``. With
+    ``profiler``, time spent waiting for chunk results counts as the
+    "validate" stage.
+    """
+    from validator.parallel import iter_chunk_results
+    from validator.validate import format_findings
 
-def _redact_entries(entries: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    entry_count = 0
+
+    chunks = iter_chunk_results(
+        input_path,
+        workers=workers,
+        all_errors=True,
+        line_range=line_range,
+        cache_path=cache_path,
+    )
+    if profiler is not None:
+        chunks = profiler.iter("validate", chunks, count=lambda chunk: chunk.entry_count)
+    for chunk in chunks:
+        entry_count += chunk.entry_count
+        if cache_counts is not None:
+            cache_counts["hits"] += chunk.cache_hits
+            cache_counts["misses"] += chunk.cache_misses
+            cache_counts["seconds_saved"] += chunk.cache_seconds_saved
+        for problem in chunk.problems:
+            if problem.kind == "json":
+                raise ValueError(f"Invalid JSON on line {problem.line}: {problem.detail}")
+            if problem.kind == "not_object":
+                raise ValueError(f"Entry on line {problem.line} must be a JSON object")
+            if problem.kind == "findings":
+                yield from _annotate_findings(format_findings(problem.detail, problem.entry))
+
+    if not entry_count:
+        raise ValueError("No entries found in input file")
+
+
+def _annotate_findings(findings: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "entry": finding["entry"],
+            "severity": KEYWORD_SEVERITIES.get(finding["keyword"], DEFAULT_ERROR_SEVERITY),
+            "message": finding["message"],
+            "path": finding["path"],
+            "keyword": finding["keyword"],
+        }
+        for finding in findings
+    ]
+
+
+def _iter_entries_in_range(input_path: Path, line_range: Tuple[int, int]) -> Iterator[Dict[str, Any]]:
     """
-    Apply a simple redaction pass to sensitive free-text fields.
+    Yield the entries on lines ``first..last`` through the line index.
     """
-    redacted: List[Dict[str, Any]] = []
-    for entry in entries:
-        sanitized = dict(entry)
-        for field in ("content", "context", "reasoning_expanded"):
-            if field in sanitized:
-                sanitized[field] = REDACTED_PLACEHOLDER
-        redacted.append(sanitized)
-    return redacted
+    first, last = line_range
+    from dataio.jsonl_index import IndexedJSONL
 
+    with IndexedJSONL(input_path) as reader:
+        for line in reader.iter_lines(first, last):
+            if bytes(line).strip():
+                yield json.loads(bytes(line))
 
-def _print_summary(aggregation: Mapping[str, Any], finding_count: int) -> None:
+
+def _is_jsonl(input_path: Path) -> bool:
+    """
+    True when the first non-empty line is a complete JSON object, i.e. the
+    file can be split on newlines for parallel validation.
+    """
+    with open_input(input_path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                return isinstance(json.loads(line), dict)
+            except json.JSONDecodeError:
+                return False
+    return False
+
+
+def _redact_entry(entry: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of ``entry`` with sensitive free-text fields replaced.
+    """
+    sanitized = dict(entry)
+    for field in ("content", "context", "reasoning_expanded"):
+        if field in sanitized:
+            sanitized[field] = REDACTED_PLACEHOLDER
+    return sanitized
+
+
+def _print_summary(
+    aggregation: Mapping[str, Any],
+    finding_count: int,
+    field_counts: Optional[Mapping[str, int]] = None,
+) -> None:
     print(f"Hygiene Score: {aggregation['hygiene_score']}")
     print(f"Rating: {aggregation['rating']}")
     print(f"Findings: {finding_count}")
+    if field_counts:
+        print("Findings by field:")
+        for path, count in sorted(field_counts.items()):
+            print(f"- {path}: {count}")
     print("Summary:")
     for line in aggregation.get("summary", []):
         print(f"- {line}")
 
 
-def _write_report(
-    report_path: Path,
-    input_path: Path,
-    entries: List[Dict[str, Any]],
-    validator_results: List[Dict[str, Any]],
-    aggregation: Mapping[str, Any],
-    redacted: bool,
-) -> None:
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-
-    payload = _redact_entries(entries) if redacted else entries
-    report = {
-        "input_path": str(input_path),
-        "validator_results": validator_results,
-        "aggregation": dict(aggregation),
-        "summary": aggregation.get("summary", []),
-        "payload": payload,
-        "redacted": redacted,
-    }
+class _ReportWriter(ABC):
+    """
+    Streams a validation report to disk one finding and one entry at a time,
+    so report generation runs in bounded memory.
+
+    The report is written to a temporary sibling file that replaces
+    ``report_path`` only when the writer exits cleanly; a failed run leaves
+    no partial report behind.
+    """
+
+    def __init__(self, report_path: Path, input_path: Path, redacted: bool) -> None:
+        self.report_path = report_path
+        self.input_path = input_path
+        self.redacted = redacted
+        self._tmp_path = report_path.with_name(report_path.name + ".tmp")
+        self._sink: Optional["JSONLSink"] = None
+
+    def __enter__(self) -> "_ReportWriter":
+        from dataio.jsonl_sink import open_jsonl_sink
+
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        # Compression follows the final name, not the temporary ".tmp" one
+        self._sink = open_jsonl_sink(
+            self._tmp_path, compression=compression_from_extension(self.report_path)
+        )
+        self._write_header()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        assert self._sink is not None
+        self._sink.close()
+        if exc_type is None:
+            os.replace(self._tmp_path, self.report_path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+    def _write(self, text: str) -> None:
+        assert self._sink is not None
+        self._sink.write_block(text)
+
+    @abstractmethod
+    def _write_header(self) -> None:
+        """
+        Write everything that precedes the first finding.
+        """
+
+    @abstractmethod
+    def add_result(self, result: Mapping[str, Any]) -> None:
+        """
+        Write one annotated finding.
+        """
+
+    @abstractmethod
+    def finish(self, aggregation: Mapping[str, Any], entries: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Write the aggregation and the (optionally redacted) payload.
+        """
+
+    def _payload(self, entries: Iterable[Mapping[str, Any]]) -> Iterator[Mapping[str, Any]]:
+        for entry in entries:
+            yield _redact_entry(entry) if self.redacted else entry
+
+
+def _indented(value: Any, level: int) -> str:
+    """
+    ``json.dumps(value, indent=2)`` as it would appear nested ``level`` deep.
+    """
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * level)
+
+
+class _JSONReportWriter(_ReportWriter):
+    """
+    Single JSON document, byte-identical to ``json.dump(report, indent=2)``.
+    """
+
+    def _write_header(self) -> None:
+        self._write('{\n  "input_path": ' + json.dumps(str(self.input_path)))
+        self._write(',\n  "validator_results": [')
+        self._result_count = 0
+
+    def add_result(self, result: Mapping[str, Any]) -> None:
+        self._write("," if self._result_count else "")
+        self._write("\n    " + _indented(result, 2))
+        self._result_count += 1
+
+    def finish(self, aggregation: Mapping[str, Any], entries: Iterable[Mapping[str, Any]]) -> None:
+        self._write("\n  ]" if self._result_count else "]")
+        self._write(',\n  "aggregation": ' + _indented(dict(aggregation), 1))
+        self._write(',\n  "summary": ' + _indented(aggregation.get("summary", []), 1))
+        self._write(',\n  "payload": [')
+
+        entry_count = 0
+        for entry in self._payload(entries):
+            self._write("," if entry_count else "")
+            self._write("\n    " + _indented(entry, 2))
+            entry_count += 1
+
+        self._write("\n  ]" if entry_count else "]")
+        self._write(',\n  "redacted": ' + json.dumps(self.redacted) + "\n}")
 
-    with report_path.open("w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+
+class _JSONLReportWriter(_ReportWriter):
+    """
+    Compact JSONL report: one ``header`` record, then ``finding`` records,
+    one ``aggregation`` record and finally one ``entry`` record per payload
+    entry.
+    """
+
+    def _write_record(self, record: Mapping[str, Any]) -> None:
+        assert self._sink is not None
+        self._sink.write(record)
+
+    def _write_header(self) -> None:
+        self._write_record(
+            {"type": "header", "input_path": str(self.input_path), "redacted": self.redacted}
+        )
+
+    def add_result(self, result: Mapping[str, Any]) -> None:
+        self._write_record({"type": "finding", **result})
+
+    def finish(self, aggregation: Mapping[str, Any], entries: Iterable[Mapping[str, Any]]) -> None:
+        self._write_record(
+            {
+                "type": "aggregation",
+                "aggregation": dict(aggregation),
+                "summary": aggregation.get("summary", []),
+            }
+        )
+        for entry in self._payload(entries):
+            self._write_record({"type": "entry", "entry": entry})
+
+
+REPORT_WRITERS = {
+    "json": _JSONReportWriter,
+    "jsonl": _JSONLReportWriter,
+}
 
 
 def handle_validate(args: argparse.Namespace) -> int:
+    from dataio.profiling import print_profile, profile_stage
+    from validator.cache import ValidationCache, cache_stats, format_cache_stats
+    from validator.parallel import resolve_line_range
+
     try:
         input_path = Path(args.path)
-        entries = _load_entries(input_path)
-        validator_results = _collect_validation_results(entries)
-        aggregation = aggregate_validator_results(validator_results)
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+
+        line_range = None
+        payload_entries: Callable[[], Iterator[Dict[str, Any]]]
+        if args.lines or args.shard:
+            if is_compressed(input_path) or not _is_jsonl(input_path):
+                raise ValueError("--lines and --shard require an uncompressed JSONL file")
+            line_range = resolve_line_range(input_path, args.lines, args.shard)
+
+        cache_path = Path(args.cache) if args.cache else None
+        cache: Optional["ValidationCache"] = None
+        cache_counts: Counter[str] = Counter()
+        profiler = _make_profiler(args)
+
+        with ExitStack() as stack:
+            if line_range is not None:
+                results = _iter_validation_results_parallel(
+                    input_path, args.workers, line_range, cache_path, cache_counts, profiler
+                )
+                payload_entries = partial(_iter_entries_in_range, input_path, line_range)
+            elif args.workers > 1 and _is_jsonl(input_path):
+                results = _iter_validation_results_parallel(
+                    input_path, args.workers, None, cache_path, cache_counts, profiler
+                )
+                payload_entries = partial(_iter_entries, input_path)
+            else:
+                if cache_path is not None:
+                    cache = stack.enter_context(ValidationCache(cache_path))
+                results = _iter_validation_results(_iter_entries(input_path), cache, profiler)
+                payload_entries = partial(_iter_entries, input_path)
+
+            writer: Optional[_ReportWriter] = None
+            if args.output:
+                writer_class = REPORT_WRITERS[args.report_format]
+                writer = stack.enter_context(writer_class(Path(args.output), input_path, args.redact))
+
+            # Score and report findings as they stream in; nothing is retained.
+            aggregator = HygieneAggregator()
+            field_counts: Counter[str] = Counter()
+            for result in results:
+                aggregator.add(result)
+                field_counts[result.get("path") or "/"] += 1
+                if writer is not None:
+                    writer.add_result(result)
+
+            aggregation = aggregator.snapshot()
+            finding_count = len(aggregator)
+
+            _print_summary(aggregation, finding_count, field_counts)
+            if cache is not None:
+                print(format_cache_stats(cache.stats()))
+            elif cache_path is not None:
+                print(format_cache_stats(cache_stats(
+                    cache_counts["hits"], cache_counts["misses"], cache_counts["seconds_saved"]
+                )))
+
+            if writer is not None:
+                # Second streaming pass over the input for the report payload
+                with profile_stage(profiler, "report"):
+                    writer.finish(aggregation, payload_entries())
+
+        if profiler is not None:
+            if "load" in profiler.stages:
+                profiler.record("load", nbytes=input_path.stat().st_size, calls=0)
+            print_profile(profiler, args.profile_json)
+        return 0 if not finding_count else 1
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
 
-        _print_summary(aggregation, len(validator_results))
 
+def _collect_metric_columns(entries: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+    """
+    Per-entry metrics as columns. Numeric columns are typed arrays, so a
+    table of millions of entries stays compact in memory.
+    """
+    from validator.entropy_check import classify_entropy
+    from validator.metrics import compute_metrics
+
+    columns: Dict[str, Any] = {
+        "entry": array("q"),
+        "mode": [],
+        "chars": array("q"),
+        "words": array("q"),
+        "density": array("d"),
+        "entropy": array("d"),
+        "declared_entropy_class": [],
+        "measured_entropy_class": [],
+        "entropy_class_match": [],
+    }
+
+    for index, entry in enumerate(entries, start=1):
+        content = entry.get("content")
+        metrics = compute_metrics(content if isinstance(content, str) else "")
+        declared_class = entry.get("entropy_class") or "undefined"
+        measured_class = classify_entropy(metrics.entropy)
+
+        columns["entry"].append(index)
+        columns["mode"].append(str(entry.get("mode") or ""))
+        columns["chars"].append(metrics.chars)
+        columns["words"].append(metrics.words)
+        columns["density"].append(metrics.density)
+        columns["entropy"].append(metrics.entropy)
+        columns["declared_entropy_class"].append(str(declared_class))
+        columns["measured_entropy_class"].append(measured_class)
+        columns["entropy_class_match"].append(declared_class == measured_class)
+
+    return columns
+
+
+def _print_distribution(
+    label: str,
+    values: Iterable[float],
+    bins: int,
+    low: Optional[float] = None,
+    high: Optional[float] = None,
+) -> None:
+    from validator.metrics import histogram, summarize_values
+
+    values = list(values)
+    summary = summarize_values(values)
+    print(
+        f"{label}: min {summary['min']:.4g} | p50 {summary['p50']:.4g} | "
+        f"p90 {summary['p90']:.4g} | p99 {summary['p99']:.4g} | "
+        f"max {summary['max']:.4g} | mean {summary['mean']:.4g}"
+    )
+    rows = histogram(values, bins, low, high)
+    peak = max((count for _start, _end, count in rows), default=0)
+    for start, end, count in rows:
+        bar = "█" * round(count / peak * HISTOGRAM_WIDTH) if peak else ""
+        print(f"  [{start:8.3f}, {end:8.3f})  {bar:<{HISTOGRAM_WIDTH}}  {count}")
+
+
+def _print_metrics_summary(columns: Mapping[str, Any], bins: int) -> None:
+    total = len(columns["entry"])
+    matches = sum(columns["entropy_class_match"])
+    print(f"Entries: {total}")
+    print(f"Entropy class match rate: {matches / total * 100:.2f}% (declared vs measured)")
+    print("Modes:")
+    for mode, count in sorted(Counter(columns["mode"]).items()):
+        print(f"- {mode or '(none)'}: {count}")
+    _print_distribution("Density", columns["density"], bins, 0.0, 1.0)
+    _print_distribution("Entropy", columns["entropy"], bins, 0.0)
+    _print_distribution("Length (chars)", columns["chars"], bins, 0)
+
+
+def handle_metrics(args: argparse.Namespace) -> int:
+    from dataio.columnar import write_columns
+    from dataio.profiling import print_profile, profile_stage
+
+    try:
+        input_path = Path(args.path)
+        if args.bins < 1:
+            raise ValueError("--bins must be positive")
+
+        # The output format is settled before the input is scanned
+        output = None
         if args.output:
-            _write_report(
-                Path(args.output),
-                input_path,
-                entries,
-                validator_results,
-                aggregation,
-                args.redact,
-            )
-
-        return 0 if not validator_results else 1
+            output, table_format = _resolve_metrics_output(Path(args.output), args.format)
+
+        profiler = _make_profiler(args)
+        entries: Iterable[Dict[str, Any]] = _iter_entries(input_path)
+        if profiler is not None:
+            entries = profiler.iter("load", entries)
+
+        with profile_stage(profiler, "metrics") as sample:
+            columns = _collect_metric_columns(entries)
+            sample.entries = len(columns["entry"])
+        _print_metrics_summary(columns, args.bins)
+
+        if output is not None:
+            with profile_stage(profiler, "write", len(columns["entry"])) as sample:
+                write_columns(output, columns, table_format)
+                sample.nbytes = output.stat().st_size
+            print(f"Metrics written to: {output} ({table_format})")
+
+        if profiler is not None:
+            profiler.record("load", nbytes=input_path.stat().st_size, calls=0)
+            print_profile(profiler, args.profile_json)
+        return 0
     except (FileNotFoundError, ValueError) as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
 
+def _resolve_metrics_output(path: Path, table_format: Optional[str]) -> Tuple[Path, str]:
+    """
+    Output path and table format for ``metrics --output``. When the optional
+    dependency of the requested format is missing, the next format in
+    ``METRICS_FORMATS`` that is available is written next to ``path`` instead.
+    """
+    from dataio.columnar import columnar_format_available, resolve_columnar_format
+
+    requested = resolve_columnar_format(path, table_format)
+    fallbacks = METRICS_FORMATS[METRICS_FORMATS.index(requested):]
+    resolved = next(name for name in fallbacks if columnar_format_available(name))
+    if resolved != requested:
+        fallback_path = path.with_suffix(f".{resolved}")
+        print(
+            f"Note: {requested} output needs a package that is not installed; "
+            f"writing {fallback_path} ({resolved}) instead",
+            file=sys.stderr,
+        )
+        path = fallback_path
+    return path, resolved
+
+
+def _make_profiler(args: argparse.Namespace) -> Optional["StageProfiler"]:
+    if not (args.profile or args.profile_json):
+        return None
+    from dataio.profiling import StageProfiler
+
+    return StageProfiler()
+
+
+def _line_spec(spec: str) -> Tuple[int, int]:
+    from validator.parallel import parse_line_spec
+
+    try:
+        return parse_line_spec(spec)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _shard_spec(spec: str) -> Tuple[int, int]:
+    from validator.parallel import parse_shard_spec
+
+    try:
+        return parse_shard_spec(spec)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage time, call counts and throughput at the end",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="PATH",
+        help="Also write the stage profile as JSON to PATH (implies --profile)",
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="ndrpy", description="NDRP CLI wrapper")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -167,8 +755,59 @@ def build_parser() -> argparse.ArgumentParser:
         "-o",
         help="Write JSON report to the provided path",
     )
+    validate_parser.add_argument(
+        "--report-format",
+        choices=sorted(REPORT_WRITERS),
+        default="json",
+        help="Report layout: a single JSON document or compact JSONL records (default: json)",
+    )
+    validate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Validate JSONL input across N processes (default: 1)",
+    )
+    validate_parser.add_argument(
+        "--lines",
+        type=_line_spec,
+        help="Only validate JSONL lines FIRST:LAST (1-based, inclusive)",
+    )
+    validate_parser.add_argument(
+        "--shard",
+        type=_shard_spec,
+        help="Only validate JSONL shard K of N, e.g. 3/8",
+    )
+    validate_parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="Reuse findings for unchanged entries from this cache file (SQLite)",
+    )
+    _add_profile_arguments(validate_parser)
     validate_parser.set_defaults(func=handle_validate)
 
+    metrics_parser = subparsers.add_parser(
+        "metrics", help="Compute per-entry text metrics and distribution summaries"
+    )
+    metrics_parser.add_argument("path", help="Path to JSON/JSONL input")
+    metrics_parser.add_argument(
+        "--output",
+        "-o",
+        help="Write the metrics table to this path (.parquet, .npz or .csv)",
+    )
+    metrics_parser.add_argument(
+        "--format",
+        choices=METRICS_FORMATS,
+        help="Table format; inferred from the output extension by default",
+    )
+    metrics_parser.add_argument(
+        "--bins",
+        type=int,
+        default=10,
+        help="Histogram bins per metric (default: 10)",
+    )
+    _add_profile_arguments(metrics_parser)
+    metrics_parser.set_defaults(func=handle_metrics)
+
     return parser
 
 
@@ -5,37 +5,376 @@ NDRP Pipeline Runner
 This script runs the complete NDRP pipeline from raw text to refined JSONL.
 
 Usage:
-    python scripts/run_pipeline.py <input.txt> <output.jsonl>
+    python scripts/run_pipeline.py <input.txt> <output.jsonl> [--workers N] [--chunk-size N] [--incremental]
+                                   [--dedup {exact,near}] [--dedup-capacity N]
+                                   [--profile] [--profile-json PATH]
 
 The pipeline consists of three stages:
 1. Extraction - Load raw text and extract preliminary entries
 2. Standardization - Transform into NDRP schema with unified formatting
 3. Enhancement - Improve clarity, density, and coherence
 
+Raw lines are read in chunks; with --workers > 1 the chunks are processed by a
+process pool and written back in their original order.
+
+With --incremental a manifest of processed input is kept next to the output
+(see dataio/manifest.py). Later runs reuse the output of unchanged blocks of
+raw lines, append output for new ones and patch only blocks whose content
+changed; a change in any stage version rebuilds the whole output.
+
+With --dedup exact (or near) duplicate raw lines are dropped before
+extraction (see extraction/dedup.py) and counted per source.
+
+With --profile a table of per-stage time, calls and throughput is printed at
+the end (see dataio/profiling.py); --profile-json also saves it as JSON.
+
 Output:
     A JSONL file where each line is a complete NDRP entry conforming to
     the schema defined in schema/entry_schema.json
 """
+import argparse
+import io
+import os
+import shutil
 import sys
-import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from dataio.compression import compression_from_extension, open_input
+from dataio.jsonl_sink import SERIALIZERS, dumps_lines, open_jsonl_sink, resolve_serializer
+from dataio.manifest import (
+    BlockRecord,
+    PipelineManifest,
+    block_digest,
+    default_manifest_path,
+    load_manifest,
+    save_manifest,
+)
+from dataio.profiling import StageProfiler, print_profile, profile_stage
+from extraction.classifier import CLASSIFIER_VERSION
+from extraction.dedup import DEDUP_MODES, Deduplicator, format_dedup_counts
 from extraction.loader import load_raw_lines
-from extraction.extractor import extract_entries_as_dicts
-from standardization.rewrite import to_ndrp_entry
-from enhancement.enhance import enhance_entry
+from extraction.extractor import extract_batch
+from standardization.rewrite import REWRITE_VERSION, standardize_batch
+from enhancement.enhance import ENHANCE_VERSION, enhance_entry
+
+
+# Raw lines per unit of work handed to a worker
+DEFAULT_CHUNK_SIZE = 2048
+
+# Chunks allowed in flight per worker; bounds the reorder buffer
+MAX_PENDING_PER_WORKER = 2
+
+# Bump whenever the way stages are wired together changes the output
+PIPELINE_VERSION = 1
+
+
+def stage_versions(serializer: str = "json") -> Dict[str, Any]:
+    """
+    Versions recorded in the incremental manifest; any difference from the
+    manifest of a previous run invalidates all of its output.
+    """
+    return {
+        "pipeline": PIPELINE_VERSION,
+        "classifier": CLASSIFIER_VERSION,
+        "standardization": REWRITE_VERSION,
+        "enhancement": ENHANCE_VERSION,
+        "serializer": resolve_serializer(serializer),
+    }
+
+
+def process_chunk(
+    lines: List[str],
+    source: str,
+    serializer: str = "json",
+    profiler: Optional[StageProfiler] = None,
+) -> Tuple[int, bytes]:
+    """
+    Run extraction, standardization and enhancement over one chunk of raw
+    lines, timing each stage in ``profiler`` when given.
+
+    Returns:
+        The number of entries produced and their serialized JSONL block
+    """
+    count = len(lines)
+
+    # Stages 1-2: extraction and standardization on columnar batches, with
+    # categorical fields held as integer codes
+    with profile_stage(profiler, "extract", count):
+        pre_batch = extract_batch(lines, source=source)
+    with profile_stage(profiler, "standardize", count):
+        ndrp_batch = standardize_batch(pre_batch)
+
+    # Stage 3: Enhancement; entries only become string-valued dicts here,
+    # right before serialization
+    with profile_stage(profiler, "enhance", count):
+        enhanced_entries = [enhance_entry(ndrp_entry) for ndrp_entry in ndrp_batch.iter_entries()]
+
+    with profile_stage(profiler, "serialize", count) as sample:
+        block = dumps_lines(enhanced_entries, serializer)
+        sample.nbytes = len(block)
+
+    return count, block
+
+
+def _process_chunk_profiled(
+    lines: List[str], source: str, serializer: str
+) -> Tuple[int, bytes, StageProfiler]:
+    # Worker-side profiling; the parent merges the returned counters
+    profiler = StageProfiler()
+    count, block = process_chunk(lines, source, serializer, profiler)
+    return count, block, profiler
+
+
+def _iter_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    line_iter = iter(lines)
+    while True:
+        chunk = list(islice(line_iter, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_deduplicated(
+    chunks: Iterable[List[str]],
+    deduplicator: Deduplicator,
+    source: str,
+    profiler: Optional[StageProfiler] = None,
+) -> Iterator[List[str]]:
+    """
+    Drop duplicate lines chunk by chunk, timing each chunk as the ``dedup``
+    stage. Chunks left empty are skipped.
+    """
+    for chunk in chunks:
+        with profile_stage(profiler, "dedup", len(chunk)):
+            kept = list(deduplicator.filter(chunk, source=source))
+        if kept:
+            yield kept
+
+
+def _iter_processed(
+    chunks: Iterable[List[str]],
+    source: str,
+    workers: int,
+    serializer: str = "json",
+    profiler: Optional[StageProfiler] = None,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Process chunks and yield results in input order.
+
+    With several workers, at most ``workers * MAX_PENDING_PER_WORKER`` chunks
+    are in flight; results are released strictly in submission order, so
+    memory stays bounded even when a slow chunk holds up later ones.
+
+    A ``None`` chunk is not processed; it yields ``None`` in its place, which
+    lets callers interleave chunks whose output they already have.
+
+    With ``profiler``, stage timings of every chunk (including those
+    processed by workers) are added to it.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield process_chunk(chunk, source, serializer, profiler) if chunk is not None else None
+        return
+
+    def result(future):
+        if future is None:
+            return None
+        if profiler is None:
+            return future.result()
+        count, block, chunk_profiler = future.result()
+        profiler.merge(chunk_profiler)
+        return count, block
+
+    task = process_chunk if profiler is None else _process_chunk_profiled
+    max_pending = workers * MAX_PENDING_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque = deque()
+        for chunk in chunks:
+            if chunk is None:
+                pending.append(None)
+            else:
+                pending.append(executor.submit(task, chunk, source, serializer))
+            if len(pending) >= max_pending:
+                yield result(pending.popleft())
+        while pending:
+            yield result(pending.popleft())
 
 
-def run_pipeline(input_path: str, output_path: str):
+def _iter_input_blocks(input_path: Path, block_lines: int) -> Iterator[Tuple[bytes, List[str]]]:
+    """
+    Yield the raw bytes of each block of ``block_lines`` physical lines with
+    its non-empty stripped lines, as ``load_raw_lines`` would produce them.
+    """
+    with open_input(input_path, "rb") as f:
+        while True:
+            raw_lines = list(islice(f, block_lines))
+            if not raw_lines:
+                return
+            data = b"".join(raw_lines)
+            text = io.StringIO(data.decode("utf-8"), newline=None)
+            yield data, [line.strip() for line in text if line.strip()]
+
+
+def _read_range(f: BinaryIO, start: int, size: int) -> bytes:
+    f.seek(start)
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Output file is shorter than its manifest")
+    return data
+
+
+def run_incremental(
+    input_path: Path,
+    output_path: Path,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    serializer: str = "json",
+    manifest_path: Optional[Path] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> Dict[str, int]:
+    """
+    Bring ``output_path`` up to date with ``input_path`` using its manifest.
+
+    Input is hashed block by block and compared with the previous run. The
+    output of the leading run of unchanged blocks is kept in place; from the
+    first difference on, changed and new blocks are processed and unchanged
+    ones are copied from the old output into a tail file that then replaces
+    the rest of the output. The result is identical to a full run. Without a
+    usable manifest, or when versions, source or block size (``chunk_size``)
+    differ, every block is processed.
+
+    Returns:
+        Counts of reused and processed blocks and of entries written
+    """
+    if compression_from_extension(output_path) is not None:
+        raise ValueError("Incremental mode requires an uncompressed output file")
+
+    manifest_path = manifest_path or default_manifest_path(output_path)
+    source_name = input_path.name
+    versions = stage_versions(serializer)
+
+    previous = load_manifest(manifest_path)
+    if (
+        previous is None
+        or previous.versions != versions
+        or previous.source != source_name
+        or previous.block_lines != chunk_size
+        or not output_path.exists()
+        or output_path.stat().st_size != previous.output_bytes
+    ):
+        previous = PipelineManifest(versions, source_name, chunk_size)
+    block_lines = previous.block_lines
+    old_blocks = previous.blocks
+
+    manifest = PipelineManifest(versions, source_name, block_lines)
+    plan: Deque[Tuple[int, str, int]] = deque()
+
+    def pending_chunks() -> Iterator[Optional[List[str]]]:
+        # Reuse is only decided here; ``plan`` tells the writer what each
+        # yielded chunk stands for.
+        for index, (data, lines) in enumerate(_iter_input_blocks(input_path, block_lines)):
+            digest = block_digest(data)
+            old = old_blocks[index] if index < len(old_blocks) else None
+            reusable = old is not None and old.digest == digest and old.input_bytes == len(data)
+            plan.append((index, digest, len(data)))
+            yield None if reusable else lines
+
+    stats = {"reused_blocks": 0, "processed_blocks": 0, "entries": 0}
+    keep_bytes = 0  # Output prefix kept in place
+    old_offset = 0  # Start of the current block in the old output
+    tail_path = output_path.with_name(output_path.name + ".tail.tmp")
+    tail = None
+
+    try:
+        with open(output_path, "rb") if old_blocks else open(os.devnull, "rb") as old_output:
+            chunks = pending_chunks()
+            if profiler is not None:
+                chunks = profiler.iter("load", chunks, count=lambda chunk: len(chunk or ()))
+            for result in _iter_processed(chunks, source_name, workers, serializer, profiler):
+                index, digest, input_bytes = plan.popleft()
+                if result is None:
+                    old = old_blocks[index]
+                    count, size = old.entries, old.output_bytes
+                    if tail is None:
+                        keep_bytes += size
+                    else:
+                        tail.write_block(_read_range(old_output, old_offset, size), count)
+                    stats["reused_blocks"] += 1
+                else:
+                    count, block = result
+                    if tail is None:
+                        tail = open_jsonl_sink(tail_path, serializer=serializer)
+                    with profile_stage(profiler, "write", count, len(block)):
+                        tail.write_block(block, count)
+                    size = len(block)
+                    stats["processed_blocks"] += 1
+
+                manifest.blocks.append(BlockRecord(digest, input_bytes, count, size))
+                stats["entries"] += count
+                if index < len(old_blocks):
+                    old_offset += old_blocks[index].output_bytes
+
+        if tail is not None:
+            tail.close()
+        if keep_bytes == 0:
+            # Nothing kept in place: the tail is the whole output
+            if tail is not None:
+                os.replace(tail_path, output_path)
+            else:
+                open(output_path, "wb").close()
+        elif tail is not None or keep_bytes < previous.output_bytes:
+            with open(output_path, "r+b") as out:
+                out.truncate(keep_bytes)
+                out.seek(keep_bytes)
+                if tail is not None:
+                    with open(tail_path, "rb") as tail_file:
+                        shutil.copyfileobj(tail_file, out, 1 << 20)
+    finally:
+        if tail is not None:
+            tail.close()
+        tail_path.unlink(missing_ok=True)
+
+    save_manifest(manifest, manifest_path)
+    if profiler is not None:
+        profiler.record("load", nbytes=manifest.input_bytes, calls=0)
+    return stats
+
+
+def run_pipeline(
+    input_path: str,
+    output_path: str,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    serializer: str = "json",
+    incremental: bool = False,
+    dedup: Optional[str] = None,
+    dedup_capacity: Optional[int] = None,
+    profiler: Optional[StageProfiler] = None,
+):
     """
     Run the complete NDRP pipeline.
     
     Args:
         input_path: Path to raw text file
         output_path: Path to output JSONL file
+        workers: Number of worker processes (1 processes in-line)
+        chunk_size: Raw lines per unit of work
+        serializer: JSON serializer ("json", "orjson" or "auto")
+        incremental: Only reprocess raw lines that are new or changed since
+                     the last incremental run (see ``run_incremental``)
+        dedup: Drop "exact" duplicate raw lines, or "near" duplicates too
+               (see ``extraction.dedup``); None keeps every line
+        dedup_capacity: Expected distinct lines; bounds dedup memory with
+                        Bloom filters instead of exact sets
+        profiler: Collects per-stage timings and throughput (see
+                  ``dataio.profiling``); None disables instrumentation
     """
     input_path = Path(input_path)
     output_path = Path(output_path)
@@ -53,37 +392,75 @@ def run_pipeline(input_path: str, output_path: str):
     print(f"Output: {output_path}")
     print()
     
+    if incremental and dedup:
+        print("Error: --dedup cannot be combined with --incremental")
+        sys.exit(1)
+
+    if incremental:
+        try:
+            stats = run_incremental(
+                input_path, output_path, workers, chunk_size, serializer, profiler=profiler
+            )
+        except ValueError as exc:
+            print(f"Error: {exc}")
+            sys.exit(1)
+        print(f"✨ Incremental update complete!")
+        print(
+            f"Reused {stats['reused_blocks']} blocks, "
+            f"processed {stats['processed_blocks']} blocks"
+        )
+        print(f"Output holds {stats['entries']} entries")
+        print(f"Output written to: {output_path}")
+        return
+
+    # A full run invalidates any incremental manifest for this output
+    default_manifest_path(output_path).unlink(missing_ok=True)
+
     # Extract source name from input path
     source_name = input_path.name
     
     entries_processed = 0
     
-    with open(output_path, "w", encoding="utf-8") as out_file:
+    with open_jsonl_sink(output_path, serializer=serializer) as sink:
         print("Stage 1: Extraction...")
         
         # Load raw lines
         raw_lines = load_raw_lines(input_path)
-        
-        # Extract preliminary entries
-        pre_entries = extract_entries_as_dicts(raw_lines, source=source_name)
-        
+
         print("Stage 2: Standardization...")
         
-        for pre_entry in pre_entries:
-            # Standardize to NDRP format
-            ndrp_entry = to_ndrp_entry(pre_entry)
-            
-            # Stage 3: Enhancement
-            enhanced_entry = enhance_entry(ndrp_entry)
-            
+        # Extraction, standardization and enhancement run per chunk
+        chunks = _iter_chunks(raw_lines, chunk_size)
+        if profiler is not None:
+            # Loading is timed per chunk; per line would cost more than it reads
+            chunks = profiler.iter("load", chunks, count=len)
+
+        # Drop duplicate lines before any per-entry work
+        deduplicator = None
+        if dedup:
+            deduplicator = Deduplicator(near=dedup == "near", capacity=dedup_capacity)
+            chunks = _iter_deduplicated(chunks, deduplicator, source_name, profiler)
+        for count, block in _iter_processed(chunks, source_name, workers, serializer, profiler):
             # Write to output file
-            json.dump(enhanced_entry, out_file)
-            out_file.write("\n")
+            with profile_stage(profiler, "write", count, len(block)):
+                sink.write_block(block, count)
             
-            entries_processed += 1
+            entries_processed += count
+
+    if profiler is not None:
+        profiler.record("load", nbytes=input_path.stat().st_size, calls=0)
     
+    write_stats = sink.stats()
     print(f"\n✨ Pipeline complete!")
     print(f"Processed {entries_processed} entries")
+    if deduplicator is not None:
+        print("Duplicates:")
+        for line in format_dedup_counts(deduplicator.counts):
+            print(f"  {line}")
+    print(
+        f"Wrote {write_stats['bytes'] / 1e6:.1f} MB "
+        f"({write_stats['bytes_per_sec'] / 1e6:.1f} MB/s)"
+    )
     print(f"Output written to: {output_path}")
     print()
     print(f"To validate the output, run:")
@@ -91,17 +468,76 @@ def run_pipeline(input_path: str, output_path: str):
 
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python scripts/run_pipeline.py <input.txt> <output.jsonl>")
-        print()
-        print("Example:")
-        print("  python scripts/run_pipeline.py examples/sample_raw.txt output/refined.jsonl")
-        sys.exit(1)
-    
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
-    
-    run_pipeline(input_file, output_file)
+    parser = argparse.ArgumentParser(
+        description="Run the NDRP pipeline from raw text to refined JSONL",
+        epilog="Example: python scripts/run_pipeline.py examples/sample_raw.txt output/refined.jsonl",
+    )
+    parser.add_argument("input", help="Raw text input file")
+    parser.add_argument("output", help="Output JSONL file")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for extraction, standardization and enhancement (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Raw lines per unit of work (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--serializer",
+        choices=SERIALIZERS,
+        default="json",
+        help="JSON serializer; 'auto' uses orjson when installed (default: json)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only reprocess new or changed raw lines, tracked in <output>.manifest.json",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage time, call counts and throughput at the end",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="PATH",
+        help="Also write the stage profile as JSON to PATH (implies --profile)",
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=DEDUP_MODES,
+        help="Drop exact duplicate raw lines, or near duplicates as well (MinHash LSH)",
+    )
+    parser.add_argument(
+        "--dedup-capacity",
+        type=int,
+        help="Expected number of distinct lines; keeps dedup memory bounded with Bloom filters",
+    )
+    args = parser.parse_args()
+
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size must be positive")
+    if args.dedup_capacity is not None and args.dedup_capacity < 1:
+        parser.error("--dedup-capacity must be positive")
+
+    profiler = StageProfiler() if args.profile or args.profile_json else None
+    run_pipeline(
+        args.input,
+        args.output,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        serializer=args.serializer,
+        incremental=args.incremental,
+        dedup=args.dedup,
+        dedup_capacity=args.dedup_capacity,
+        profiler=profiler,
+    )
+    if profiler is not None:
+        print_profile(profiler, args.profile_json)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,42 @@
 NDRP entry rewriter for standardization stage.
 
 Converts preliminary entries into full NDRP-compliant entries.
+
+``standardize_batch`` converts a whole ``extraction.extractor.ExtractedBatch``
+into an ``NDRPBatch`` whose categorical fields are small integer codes (see
+``standardization.vocabulary``); strings are only produced when entries are
+read back out for enhancement and serialization.
 """
-from typing import Mapping, Any
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Mapping, Optional
 
 from .unify_style import normalize_text
+from .vocabulary import (
+    DENSITY_GOAL_CODES,
+    DENSITY_GOALS,
+    ENTROPY_CLASS_CODES,
+    ENTROPY_CLASSES,
+    FALLBACK_INTENT,
+    FALLBACK_MODE,
+    INTENT_BY_MODE,
+    INTENTS,
+    NDRP_MODE_CODES,
+    NDRP_MODES,
+    ROLE_CODES,
+    ROLES,
+)
+
+# Bump whenever to_ndrp_entry (or normalize_text) output changes; incremental
+# pipeline runs reprocess everything when it changes.
+REWRITE_VERSION = 1
+
+# Defaults given to every standardized entry
+DEFAULT_ROLE = "user"  # Can be overridden by caller
+DEFAULT_DENSITY_GOAL = "high"  # NDRP aims for high density
+DEFAULT_ENTROPY_CLASS = "low"  # NDRP aims for low entropy
+
+FALLBACK_MODE_CODE = NDRP_MODE_CODES[FALLBACK_MODE]
 
 
 def to_ndrp_entry(pre_entry: Mapping[str, Any]) -> dict:
@@ -29,34 +61,23 @@ def to_ndrp_entry(pre_entry: Mapping[str, Any]) -> dict:
     # Get mode from extraction
     mode = pre_entry.get("mode", "other")
     
-    # Map mode to a valid schema mode if needed
-    # The schema allows: instruction, conversation, narrative, reasoning, context, meta, emotion
-    valid_modes = ["instruction", "conversation", "narrative", "reasoning", "context", "meta", "emotion"]
-    if mode not in valid_modes:
-        mode = "context"  # Default fallback
+    # Map mode to a valid schema mode if needed; the tables hold the one
+    # shared string per value
+    mode = NDRP_MODES[NDRP_MODE_CODES[mode]] if mode in NDRP_MODES else FALLBACK_MODE
     
     # Determine intent based on mode
-    intent_map = {
-        "instruction": "request information or action",
-        "conversation": "engage in dialogue",
-        "narrative": "tell a story or describe events",
-        "reasoning": "explain logic or reasoning",
-        "context": "provide contextual information",
-        "meta": "discuss the conversation itself",
-        "emotion": "express feelings or emotions"
-    }
-    intent = intent_map.get(mode, "provide information")
+    intent = INTENT_BY_MODE.get(mode, FALLBACK_INTENT)
     
     # Build the NDRP entry with required fields
     ndrp_entry = {
-        "role": "user",  # Default to user; can be overridden by caller
+        "role": DEFAULT_ROLE,
         "content": content,
         "intent": intent,
         "mode": mode,
         "context": None,  # Can be populated in enhancement stage
         "meaning_preserved": True,  # Assumed true for v1
-        "density_goal": "high",  # NDRP aims for high density
-        "entropy_class": "low",  # NDRP aims for low entropy
+        "density_goal": DEFAULT_DENSITY_GOAL,
+        "entropy_class": DEFAULT_ENTROPY_CLASS,
     }
     
     # Add optional metadata if present
@@ -66,3 +87,93 @@ def to_ndrp_entry(pre_entry: Mapping[str, Any]) -> dict:
         }
     
     return ndrp_entry
+
+
+@dataclass(slots=True)
+class NDRPBatch:
+    """
+    Struct-of-arrays form of a run of standardized NDRP entries.
+
+    Categorical fields are uint8 codes into the ``standardization.vocabulary``
+    tuples (``intents`` into ``INTENTS``, and so on); entries are rebuilt as
+    dictionaries by ``iter_entries``.
+    """
+    contents: List[str] = field(default_factory=list)
+    roles: array = field(default_factory=lambda: array("B"))
+    modes: array = field(default_factory=lambda: array("B"))
+    intents: array = field(default_factory=lambda: array("B"))
+    density_goals: array = field(default_factory=lambda: array("B"))
+    entropy_classes: array = field(default_factory=lambda: array("B"))
+    source_ids: array = field(default_factory=lambda: array("I"))
+    sources: List[Optional[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def iter_entries(self) -> Iterator[dict]:
+        """
+        Yield each entry as the dictionary ``to_ndrp_entry`` would build.
+        """
+        sources = self.sources
+        rows = zip(
+            self.contents,
+            self.roles,
+            self.modes,
+            self.intents,
+            self.density_goals,
+            self.entropy_classes,
+            self.source_ids,
+        )
+        for content, role, mode, intent, density_goal, entropy_class, source_id in rows:
+            entry = {
+                "role": ROLES[role],
+                "content": content,
+                "intent": INTENTS[intent],
+                "mode": NDRP_MODES[mode],
+                "context": None,
+                "meaning_preserved": True,
+                "density_goal": DENSITY_GOALS[density_goal],
+                "entropy_class": ENTROPY_CLASSES[entropy_class],
+            }
+            source = sources[source_id]
+            if source:
+                entry["metadata"] = {"source_id": source}
+            yield entry
+
+
+def standardize_batch(batch: Any) -> NDRPBatch:
+    """
+    Standardize a struct-of-arrays batch of preliminary entries (see
+    ``extraction.extractor.ExtractedBatch``) without building per-entry
+    dictionaries.
+
+    Modes are remapped code-to-code through a byte translation table; the
+    default role, density goal and entropy class are filled as constant
+    code columns.
+    """
+    from extraction.classifier import MODES
+
+    # Extraction mode code -> NDRP mode code (also the intent code)
+    mode_table = bytes(NDRP_MODE_CODES.get(mode, FALLBACK_MODE_CODE) for mode in MODES).ljust(256, b"\0")
+    modes = array("B", batch.mode_codes.tobytes().translate(mode_table))
+    count = len(modes)
+
+    return NDRPBatch(
+        contents=list(map(normalize_text, batch.contents)),
+        roles=array("B", bytes([ROLE_CODES[DEFAULT_ROLE]]) * count),
+        modes=modes,
+        intents=array("B", modes),
+        density_goals=array("B", bytes([DENSITY_GOAL_CODES[DEFAULT_DENSITY_GOAL]]) * count),
+        entropy_classes=array("B", bytes([ENTROPY_CLASS_CODES[DEFAULT_ENTROPY_CLASS]]) * count),
+        source_ids=array("I", batch.source_ids),
+        sources=list(batch.sources),
+    )
+
+
+def to_ndrp_entries(batch: Any) -> List[dict]:
+    """
+    Convert a struct-of-arrays batch of preliminary entries to full NDRP
+    entries; equivalent to calling ``to_ndrp_entry`` on each row's
+    dictionary.
+    """
+    return list(standardize_batch(batch).iter_entries())
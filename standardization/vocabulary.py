@@ -0,0 +1,57 @@
+"""
+Enumerated NDRP field values.
+
+Frozen lookup tables for the categorical fields of an NDRP entry (``role``,
+``mode``, ``intent``, ``density_goal``, ``entropy_class``). A value's index in
+its tuple is its compact integer code; batch containers store these codes
+and turn them back into strings only when entries are serialized.
+"""
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+ROLES: Tuple[str, ...] = ("user", "assistant", "system")
+
+# Modes allowed by schema/entry_schema.json
+NDRP_MODES: Tuple[str, ...] = (
+    "instruction",
+    "conversation",
+    "narrative",
+    "reasoning",
+    "context",
+    "meta",
+    "emotion",
+)
+
+# Used for extraction modes the schema does not allow (e.g. "other")
+FALLBACK_MODE = "context"
+
+# One intent per NDRP mode, in NDRP_MODES order, so a mode's code is also its
+# intent's code; FALLBACK_INTENT is the last entry.
+FALLBACK_INTENT = "provide information"
+INTENTS: Tuple[str, ...] = (
+    "request information or action",
+    "engage in dialogue",
+    "tell a story or describe events",
+    "explain logic or reasoning",
+    "provide contextual information",
+    "discuss the conversation itself",
+    "express feelings or emotions",
+    FALLBACK_INTENT,
+)
+
+LEVELS: Tuple[str, ...] = ("low", "medium", "high")
+DENSITY_GOALS = LEVELS
+ENTROPY_CLASSES = LEVELS
+
+
+def _codes(values: Tuple[str, ...]) -> Mapping[str, int]:
+    return MappingProxyType({value: code for code, value in enumerate(values)})
+
+
+ROLE_CODES = _codes(ROLES)
+NDRP_MODE_CODES = _codes(NDRP_MODES)
+INTENT_CODES = _codes(INTENTS)
+DENSITY_GOAL_CODES = _codes(DENSITY_GOALS)
+ENTROPY_CLASS_CODES = _codes(ENTROPY_CLASSES)
+
+INTENT_BY_MODE: Mapping[str, str] = MappingProxyType(dict(zip(NDRP_MODES, INTENTS)))
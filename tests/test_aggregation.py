@@ -3,6 +3,7 @@ import unittest
 from validator.aggregation import (
     DEFAULT_SEVERITY_WEIGHTS,
     UNKNOWN_SEVERITY_WEIGHT,
+    HygieneAggregator,
     aggregate_validator_results,
 )
 
@@ -61,5 +62,39 @@ class AggregationTests(unittest.TestCase):
         )
 
 
+class HygieneAggregatorTests(unittest.TestCase):
+    RESULTS = ["high", {"severity": "medium"}, "custom", "low", "high", "critical"]
+
+    def test_snapshot_matches_batch_aggregation(self):
+        aggregator = HygieneAggregator()
+        for result in self.RESULTS:
+            aggregator.add(result)
+
+        self.assertEqual(aggregator.snapshot(), aggregate_validator_results(self.RESULTS))
+        self.assertEqual(len(aggregator), len(self.RESULTS))
+
+    def test_merged_shards_match_single_pass(self):
+        left = HygieneAggregator()
+        right = HygieneAggregator()
+        left.update(self.RESULTS[:2])
+        right.update(self.RESULTS[2:])
+
+        merged = left.merge(right)
+
+        self.assertEqual(merged.snapshot(), aggregate_validator_results(self.RESULTS))
+
+    def test_snapshot_reflects_progress(self):
+        aggregator = HygieneAggregator()
+        aggregator.add("high")
+        self.assertEqual(aggregator.snapshot()["hygiene_score"], 90)
+
+        aggregator.add("critical")
+        self.assertEqual(aggregator.snapshot()["hygiene_score"], 65)
+
+    def test_merge_rejects_different_weights(self):
+        with self.assertRaises(ValueError):
+            HygieneAggregator().merge(HygieneAggregator({"high": 50}))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from benchmarks.corpus import CorpusSpec, iter_entries, iter_raw_lines
+from benchmarks.run_benchmarks import compare, parse_importtime, run_suite
+from validator.validate import validate_entry
+
+
+class CorpusTests(unittest.TestCase):
+    def test_corpus_is_deterministic(self):
+        spec = CorpusSpec(lines=200, seed=3)
+        self.assertEqual(list(iter_raw_lines(spec)), list(iter_raw_lines(CorpusSpec(lines=200, seed=3))))
+        self.assertNotEqual(list(iter_raw_lines(spec)), list(iter_raw_lines(CorpusSpec(lines=200, seed=4))))
+
+    def test_rates_and_mode_mix_are_applied(self):
+        lines = list(iter_raw_lines(CorpusSpec(lines=500, duplicate_rate=0.5)))
+        self.assertLess(len(set(lines)), 450)
+
+        only_other = CorpusSpec(lines=50, mode_mix={"other": 1.0}, duplicate_rate=0.0, invalid_rate=0.0)
+        entries = list(iter_entries(only_other))
+        self.assertEqual({entry["mode"] for entry in entries}, {"context"})
+        self.assertFalse(any(validate_entry(entry, i) for i, entry in enumerate(entries)))
+
+        invalid = list(iter_entries(CorpusSpec(lines=50, invalid_rate=1.0)))
+        self.assertTrue(all(validate_entry(entry, i) for i, entry in enumerate(invalid)))
+
+
+class CompareTests(unittest.TestCase):
+    def test_statuses_follow_tolerance(self):
+        baseline = {"results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}, "c": {"ops_per_sec": 100.0}}}
+        current = {
+            "results": {
+                "a": {"ops_per_sec": 70.0},
+                "b": {"ops_per_sec": 95.0},
+                "c": {"ops_per_sec": 130.0},
+                "d": {"ops_per_sec": 1.0},
+            }
+        }
+        statuses = {row["name"]: row["status"] for row in compare(current, baseline, tolerance=0.2)}
+        self.assertEqual(statuses, {"a": "regression", "b": "ok", "c": "improved", "d": "new"})
+
+    def test_suite_results_document(self):
+        document = run_suite(CorpusSpec(lines=20), ["detect_mode", "aggregate_validator_results"], repeats=1)
+        self.assertEqual(list(document["results"]), ["detect_mode", "aggregate_validator_results"])
+        self.assertEqual(document["results"]["detect_mode"]["items"], 20)
+        self.assertEqual(document["corpus"]["lines"], 20)
+        with self.assertRaises(ValueError):
+            run_suite(CorpusSpec(lines=5), ["nope"])
+
+    def test_reference_benchmarks_run(self):
+        names = ["detect_mode_sequential", "detect_modes", "validate_entry_jsonschema"]
+        document = run_suite(CorpusSpec(lines=20), names, repeats=1)
+        self.assertEqual([document["results"][name]["items"] for name in names], [20, 20, 20])
+
+    def test_parses_importtime_output(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   jsonschema._utils\n"
+            "import time:       300 |        420 | jsonschema\n"
+            "unrelated warning\n"
+        )
+        self.assertEqual(
+            parse_importtime(stderr),
+            [
+                {"module": "jsonschema._utils", "self_us": 120, "cumulative_us": 120},
+                {"module": "jsonschema", "self_us": 300, "cumulative_us": 420},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
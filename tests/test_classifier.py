@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from extraction.classifier import MODE_MARKERS, _detect_mode_sequential, detect_mode, detect_modes
+
+
+class DetectModeTests(unittest.TestCase):
+    def test_examples_cover_priority_order(self):
+        cases = {
+            "Why? Because the sky scatters light.": "reasoning",
+            "Can you explain photosynthesis?": "instruction",
+            "Once upon a time there was a fox.": "narrative",
+            "Hello, nice to meet you": "conversation",
+            "I feel excited today": "emotion",
+            "Back to the topic": "meta",
+            "Plain statement": "other",
+            "": "other",
+        }
+        for text, mode in cases.items():
+            self.assertEqual(detect_mode(text), mode, text)
+
+    def test_matches_sequential_reference(self):
+        rng = random.Random(7)
+        fragments = [marker for _mode, markers in MODE_MARKERS for marker in markers]
+        fragments += ["the", "data", "  ", "HI", "Thus", "İ", "what", "there", ",", "x"]
+
+        for _ in range(5000):
+            text = "".join(rng.choice(fragments) + rng.choice(["", " "]) for _ in range(rng.randint(0, 8)))
+            self.assertEqual(detect_mode(text), _detect_mode_sequential(text), repr(text))
+
+
+class DetectModesTests(unittest.TestCase):
+    TEXTS = [
+        "Because of this, we can explain it. Therefore, done.",
+        "Hello! I feel happy, thanks",
+        "Nothing to see",
+    ]
+
+    def test_batch_matches_single_text_classifier(self):
+        self.assertEqual(detect_modes(self.TEXTS), [detect_mode(text) for text in self.TEXTS])
+        self.assertEqual(detect_modes([]), [])
+
+    def test_counts_report_hits_per_mode(self):
+        modes, counts = detect_modes(self.TEXTS, with_counts=True)
+        mode_names = [mode for mode, _markers in MODE_MARKERS]
+
+        self.assertEqual(modes, ["reasoning", "conversation", "other"])
+        self.assertEqual(counts[0][mode_names.index("reasoning")], 2)
+        self.assertEqual(counts[0][mode_names.index("instruction")], 1)
+        self.assertEqual(counts[1][mode_names.index("conversation")], 2)
+        self.assertEqual(counts[1][mode_names.index("emotion")], 2)
+        self.assertEqual(counts[2], [0] * len(MODE_MARKERS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
 import io
 import json
+import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
 from contextlib import redirect_stdout
+from unittest import mock
 
 import ndrpy
 
@@ -79,6 +82,258 @@ class CLITests(unittest.TestCase):
             self.assertIn("Hygiene Score: 90", output)
             self.assertIn("Findings: 1", output)
 
+    def test_cli_reports_every_schema_error_per_field(self):
+        invalid_entry = dict(VALID_ENTRY)
+        invalid_entry.pop("intent")
+        invalid_entry["mode"] = "poetry"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.json"
+            report_path = Path(tmpdir) / "report.json"
+            with data_path.open("w", encoding="utf-8") as f:
+                json.dump([invalid_entry], f)
+
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                exit_code = ndrpy.main(["validate", str(data_path), "--output", str(report_path)])
+
+            output = buf.getvalue()
+            self.assertEqual(exit_code, 1)
+            self.assertIn("Findings: 2", output)
+            self.assertIn("- /intent: 1", output)
+            self.assertIn("- /mode: 1", output)
+
+            with report_path.open("r", encoding="utf-8") as f:
+                report = json.load(f)
+            severities = {r["path"]: r["severity"] for r in report["validator_results"]}
+            self.assertEqual(severities, {"/intent": "high", "/mode": "medium"})
+
+    def test_cli_writes_jsonl_report(self):
+        invalid_entry = dict(VALID_ENTRY)
+        invalid_entry.pop("intent")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            report_path = Path(tmpdir) / "report.jsonl"
+            data_path.write_text(
+                json.dumps(VALID_ENTRY) + "\n" + json.dumps(invalid_entry) + "\n",
+                encoding="utf-8",
+            )
+
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                exit_code = ndrpy.main(
+                    [
+                        "validate",
+                        str(data_path),
+                        "--redact",
+                        "--output",
+                        str(report_path),
+                        "--report-format",
+                        "jsonl",
+                    ]
+                )
+
+            self.assertEqual(exit_code, 1)
+            with report_path.open("r", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+
+            self.assertEqual(
+                [record["type"] for record in records],
+                ["header", "finding", "aggregation", "entry", "entry"],
+            )
+            self.assertTrue(records[0]["redacted"])
+            self.assertEqual(records[1]["entry"], 2)
+            self.assertEqual(records[2]["aggregation"]["hygiene_score"], 90)
+            self.assertEqual(records[3]["entry"]["content"], "[REDACTED]")
+
+    def test_cache_reuses_findings_on_rerun(self):
+        invalid_entry = dict(VALID_ENTRY)
+        invalid_entry.pop("intent")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            cache_path = Path(tmpdir) / "cache.sqlite"
+            data_path.write_text(
+                json.dumps(VALID_ENTRY) + "\n" + json.dumps(invalid_entry) + "\n",
+                encoding="utf-8",
+            )
+
+            outputs = []
+            for workers in ("1", "1", "2"):
+                buf = io.StringIO()
+                with redirect_stdout(buf):
+                    exit_code = ndrpy.main(
+                        ["validate", str(data_path), "--cache", str(cache_path), "--workers", workers]
+                    )
+                self.assertEqual(exit_code, 1)
+                outputs.append(buf.getvalue())
+
+            self.assertIn("Cache: 0 hits, 2 misses", outputs[0])
+            self.assertIn("Cache: 2 hits, 0 misses (100.0% hit rate)", outputs[1])
+            self.assertIn("Cache: 2 hits, 0 misses (100.0% hit rate)", outputs[2])
+            self.assertEqual(
+                outputs[0].split("Cache:")[0], outputs[1].split("Cache:")[0]
+            )
+
+    def test_metrics_command_writes_table_and_summary(self):
+        entries = [
+            dict(VALID_ENTRY, entropy_class="medium"),
+            dict(VALID_ENTRY, content="aaaa bbbb", mode="narrative", entropy_class="high"),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            table_path = Path(tmpdir) / "metrics.csv"
+            data_path.write_text("\n".join(json.dumps(e) for e in entries) + "\n", encoding="utf-8")
+
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                exit_code = ndrpy.main(["metrics", str(data_path), "-o", str(table_path)])
+
+            self.assertEqual(exit_code, 0)
+            lines = table_path.read_text(encoding="utf-8").splitlines()
+
+        output = buf.getvalue()
+        self.assertIn("Entries: 2", output)
+        self.assertIn("Entropy class match rate: 50.00%", output)
+        self.assertIn("- narrative: 1", output)
+        self.assertIn("Density: min", output)
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("entry,mode,chars,words,density,entropy"))
+        self.assertTrue(lines[2].startswith("2,narrative,9,2,"))
+
+    def test_metrics_parquet_falls_back_without_pyarrow(self):
+        from dataio import columnar
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            data_path.write_text(json.dumps(VALID_ENTRY) + "\n", encoding="utf-8")
+            table_path = Path(tmpdir) / "metrics.parquet"
+
+            stderr = io.StringIO()
+            with mock.patch.dict(columnar.__dict__, {"pyarrow": None, "np": None}), \
+                    redirect_stdout(io.StringIO()), mock.patch("sys.stderr", stderr):
+                exit_code = ndrpy.main(["metrics", str(data_path), "-o", str(table_path)])
+
+            self.assertEqual(exit_code, 0)
+            self.assertFalse(table_path.exists())
+            lines = (Path(tmpdir) / "metrics.csv").read_text(encoding="utf-8").splitlines()
+
+        self.assertIn("writing", stderr.getvalue())
+        self.assertEqual(len(lines), 2)
+
+    def test_metrics_rejects_unknown_format_before_scanning(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            data_path.write_text(json.dumps(VALID_ENTRY) + "\n", encoding="utf-8")
+
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with mock.patch.object(ndrpy, "_iter_entries") as iter_entries, \
+                    redirect_stdout(stdout), mock.patch("sys.stderr", stderr):
+                exit_code = ndrpy.main(["metrics", str(data_path), "-o", str(Path(tmpdir) / "m.json")])
+
+        self.assertEqual(exit_code, 1)
+        iter_entries.assert_not_called()
+        self.assertIn("Cannot infer table format", stderr.getvalue())
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_profile_reports_stages(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            profile_path = Path(tmpdir) / "profile.json"
+            data_path.write_text(json.dumps(VALID_ENTRY) + "\n" + json.dumps(VALID_ENTRY) + "\n", encoding="utf-8")
+
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                exit_code = ndrpy.main(["validate", str(data_path), "--profile-json", str(profile_path)])
+
+            self.assertEqual(exit_code, 0)
+            profile = json.loads(profile_path.read_text(encoding="utf-8"))
+
+        self.assertIn("--- PROFILE ---", buf.getvalue())
+        self.assertEqual(profile["stages"]["load"]["entries"], 2)
+        self.assertEqual(profile["stages"]["validate"]["calls"], 2)
+
+    def test_failed_run_leaves_no_report(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            report_path = Path(tmpdir) / "report.json"
+            data_path.write_text(json.dumps(VALID_ENTRY) + "\n{broken\n", encoding="utf-8")
+
+            with redirect_stdout(io.StringIO()):
+                exit_code = ndrpy.main(["validate", str(data_path), "--output", str(report_path)])
+
+            self.assertEqual(exit_code, 1)
+            self.assertEqual(list(Path(tmpdir).iterdir()), [data_path])
+
+    def test_streaming_loader_reads_jsonl_and_chunked_arrays(self):
+        entries = [dict(VALID_ENTRY, content=f"Entry {i}") for i in range(5)]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jsonl_path = Path(tmpdir) / "dataset.jsonl"
+            array_path = Path(tmpdir) / "dataset.json"
+            jsonl_path.write_text("\n".join(json.dumps(e) for e in entries) + "\n", encoding="utf-8")
+            array_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+
+            original_chunk_size = ndrpy.READ_CHUNK_SIZE
+            ndrpy.READ_CHUNK_SIZE = 16
+            try:
+                self.assertEqual(list(ndrpy._iter_entries(array_path)), entries)
+            finally:
+                ndrpy.READ_CHUNK_SIZE = original_chunk_size
+            self.assertEqual(list(ndrpy._iter_entries(jsonl_path)), entries)
+
+    def test_streaming_loader_rejects_non_object_array_items(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.json"
+            data_path.write_text(json.dumps([VALID_ENTRY, 3]), encoding="utf-8")
+
+            with self.assertRaisesRegex(ValueError, "Entry 2 in array must be a JSON object"):
+                list(ndrpy._iter_entries(data_path))
+
+    def test_streaming_loader_stops_at_malformed_array_item(self):
+        items = [json.dumps(dict(VALID_ENTRY, content=f"Entry {i}")) for i in range(200)]
+        items[2] = '{"role": "user", "content": oops}'
+        f = io.StringIO("[" + ",\n".join(items) + "]")
+
+        with mock.patch.object(ndrpy, "READ_CHUNK_SIZE", 64):
+            with self.assertRaisesRegex(ValueError, "Invalid JSON in array entry 3"):
+                list(ndrpy._iter_json_array(f))
+        self.assertLess(f.tell(), 2048)
+
+    def test_streaming_loader_reads_items_split_at_any_point(self):
+        entries = [dict(VALID_ENTRY, content="x" * 40, score=-1.5e3, flag=True, none=None)] * 3
+        text = json.dumps(entries)
+        for chunk_size in range(1, 40):
+            with self.subTest(chunk_size=chunk_size), mock.patch.object(ndrpy, "READ_CHUNK_SIZE", chunk_size):
+                self.assertEqual(list(ndrpy._iter_json_array(io.StringIO(text))), entries)
+
+    def test_import_defers_heavy_dependencies(self):
+        # ndrpy --help and argument errors must not pay for the subcommand
+        # modules or their dependencies; they load when a command needs them
+        deferred = (
+            "jsonschema", "numpy", "multiprocessing", "sqlite3", "orjson",
+            "validator.validate", "validator.cache", "validator.parallel",
+            "dataio.columnar", "dataio.jsonl_index", "dataio.jsonl_sink", "dataio.profiling",
+        )
+        code = (
+            "import sys, ndrpy; "
+            f"print(sorted(m for m in {deferred!r} if m in sys.modules))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(ndrpy.__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(completed.stdout.strip(), "[]")
+
+    def test_metrics_formats_match_columnar_writer(self):
+        from dataio.columnar import COLUMNAR_FORMATS
+
+        self.assertEqual(ndrpy.METRICS_FORMATS, COLUMNAR_FORMATS)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+import csv
+import gzip
+import tempfile
+import unittest
+from array import array
+from pathlib import Path
+from unittest import mock
+
+from dataio import columnar
+from dataio.columnar import (
+    columnar_format_available,
+    columnar_format_from_path,
+    resolve_columnar_format,
+    write_columns,
+)
+
+
+COLUMNS = {
+    "entry": array("q", [1, 2, 3]),
+    "mode": ["instruction", "", "narrative"],
+    "density": array("d", [0.5, 0.0, 0.25]),
+    "match": [True, False, True],
+}
+
+
+class ColumnarOutputTests(unittest.TestCase):
+    def test_format_follows_extension(self):
+        self.assertEqual(columnar_format_from_path("m.parquet"), "parquet")
+        self.assertEqual(columnar_format_from_path("m.npz"), "npz")
+        self.assertEqual(columnar_format_from_path("m.csv.gz"), "csv")
+        self.assertIsNone(columnar_format_from_path("m.json"))
+
+    def test_resolves_format_before_writing(self):
+        self.assertEqual(resolve_columnar_format("m.json", "npz"), "npz")
+        with self.assertRaises(ValueError):
+            resolve_columnar_format("m.json")
+        with mock.patch.dict(columnar.__dict__, {"pyarrow": None}):
+            self.assertFalse(columnar_format_available("parquet"))
+        self.assertTrue(columnar_format_available("csv"))
+
+    def test_writes_compressed_csv(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "metrics.csv.gz"
+            self.assertEqual(write_columns(path, COLUMNS), "csv")
+            with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(rows[0], list(COLUMNS))
+        self.assertEqual(rows[2], ["2", "", "0.0", "False"])
+
+    def test_writes_npz(self):
+        if columnar.np is None:
+            self.skipTest("NumPy not installed")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "metrics.npz"
+            write_columns(path, COLUMNS)
+            with columnar.np.load(path) as data:
+                self.assertEqual(data["density"].tolist(), [0.5, 0.0, 0.25])
+                self.assertEqual(data["mode"].tolist(), ["instruction", "", "narrative"])
+                self.assertEqual(data["match"].dtype, bool)
+
+    def test_parquet_requires_pyarrow(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "metrics.parquet"
+            if columnar.pyarrow is None:
+                with self.assertRaises(ValueError):
+                    write_columns(path, COLUMNS)
+            else:
+                write_columns(path, COLUMNS)
+                table = columnar.pyarrow.parquet.read_table(str(path))
+                self.assertEqual(table.column("entry").to_pylist(), [1, 2, 3])
+
+    def test_rejects_ragged_columns(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                write_columns(Path(tmpdir) / "m.csv", {"a": [1, 2], "b": [1]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import ndrpy
+from dataio import compression
+from dataio.compression import detect_compression, open_input, open_output
+from extraction.loader import load_raw_lines
+from validator.validate import validate_file
+
+
+VALID_ENTRY = {
+    "role": "user",
+    "content": "Example content",
+    "intent": "instruction",
+    "mode": "instruction",
+    "context": None,
+    "meaning_preserved": True,
+    "density_goal": "medium",
+    "entropy_class": "low",
+}
+
+
+class CompressionTests(unittest.TestCase):
+    def test_round_trip_for_each_format(self):
+        formats = [".gz", ".bz2", ".xz"]
+        if compression._stdlib_zstd is not None or compression.zstandard is not None:
+            formats.append(".zst")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for suffix in formats:
+                path = Path(tmpdir) / f"raw.txt{suffix}"
+                with open_output(path) as f:
+                    f.write("first line\n\n  second line  \n".encode("utf-8"))
+
+                self.assertIsNotNone(detect_compression(path))
+                self.assertEqual(list(load_raw_lines(path)), ["first line", "second line"])
+
+    def test_magic_bytes_detected_without_extension(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "dataset.jsonl"
+            path.write_bytes(gzip.compress(b'{"a": 1}\n'))
+
+            self.assertEqual(detect_compression(path), "gzip")
+            with open_input(path) as f:
+                self.assertEqual(f.read(), '{"a": 1}\n')
+
+    def test_validators_read_compressed_jsonl(self):
+        invalid_entry = dict(VALID_ENTRY)
+        invalid_entry.pop("intent")
+        lines = [json.dumps(VALID_ENTRY), json.dumps(invalid_entry)] * 3
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain_path = Path(tmpdir) / "dataset.jsonl"
+            gz_path = Path(tmpdir) / "dataset.jsonl.gz"
+            plain_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            gz_path.write_bytes(gzip.compress(plain_path.read_bytes()))
+
+            outputs = []
+            for path, workers in ((plain_path, 1), (gz_path, 1), (gz_path, 2)):
+                buf = io.StringIO()
+                with redirect_stdout(buf):
+                    validate_file(path, workers=workers)
+                outputs.append(buf.getvalue().split("\n", 1)[1])
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertEqual(outputs[0], outputs[2])
+
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                exit_code = ndrpy.main(["validate", str(gz_path)])
+            self.assertEqual(exit_code, 1)
+            self.assertIn("Findings: 3", buf.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
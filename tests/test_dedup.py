@@ -0,0 +1,72 @@
+import unittest
+
+from extraction import dedup
+from extraction.dedup import BloomFilter, Deduplicator, MinHasher, shingles
+
+
+LINES = [
+    "The quick brown fox jumps over the lazy dog near the river bank.",
+    "Can you explain how photosynthesis works in simple terms?",
+    "The quick brown fox jumps over the lazy dog near the river bank!",
+    "the quick  brown fox jumps over the lazy dog near the river bank.",
+    "Can you explain how photosynthesis works in simple terms?",
+    "A completely different sentence about databases and indexes.",
+    "x",
+]
+
+
+class DeduplicatorTests(unittest.TestCase):
+    def test_counts_exact_and_near_duplicates_per_source(self):
+        deduplicator = Deduplicator()
+        kept = list(deduplicator.filter(LINES, source="a.txt"))
+        kept += list(deduplicator.filter(LINES[:2], source="b.txt"))
+
+        self.assertEqual(kept, [LINES[0], LINES[1], LINES[5], LINES[6]])
+        counts = deduplicator.counts
+        self.assertEqual((counts["a.txt"].exact, counts["a.txt"].near, counts["a.txt"].kept), (1, 2, 4))
+        self.assertEqual((counts["b.txt"].exact, counts["b.txt"].near, counts["b.txt"].kept), (2, 0, 0))
+
+    def test_exact_mode_keeps_near_duplicates(self):
+        deduplicator = Deduplicator(near=False)
+        self.assertEqual(list(deduplicator.filter(LINES)), LINES[:4] + LINES[5:])
+
+    def test_bloom_filter_mode_matches_exact_sets(self):
+        lines = [f"line number {i % 300} of the corpus" for i in range(1000)]
+        expected = list(Deduplicator().filter(lines))
+        self.assertEqual(list(Deduplicator(capacity=1000).filter(lines)), expected)
+
+    def test_exact_mode_allocates_no_band_filter(self):
+        exact = Deduplicator(near=False, capacity=100_000)
+        self.assertIsNone(exact._band_keys)
+        near = Deduplicator(capacity=100_000)
+        # Split error budget: a line has ``bands`` chances to false-positive
+        expected = BloomFilter(100_000 * near.bands, near.error_rate / near.bands)
+        self.assertEqual(near._band_keys.size, expected.size)
+
+    def test_numpy_and_python_signatures_match(self):
+        if dedup.np is None:
+            self.skipTest("numpy not installed")
+        hasher = MinHasher()
+        texts = LINES + ["", "  ", "abcd", "abcde", "Héllo 中文 😀 text"]
+        python_keys = [hasher._band_keys_python(hasher._signature_python(t)) for t in texts]
+        self.assertEqual(hasher.band_keys(texts), python_keys)
+        self.assertEqual(
+            hasher.signatures(texts), [hasher._signature_python(t) for t in texts]
+        )
+
+    def test_shingles_ignore_case_and_spacing(self):
+        self.assertEqual(shingles("Hello   World"), shingles("hello world"))
+        self.assertEqual(len(shingles("abc")), 1)
+
+    def test_bloom_filter_reports_seen_keys(self):
+        bloom = BloomFilter(100)
+        self.assertFalse(bloom.add(12345))
+        self.assertTrue(bloom.add(12345))
+        self.assertIn(12345, bloom)
+        self.assertEqual(len(bloom), 1)
+        with self.assertRaises(ValueError):
+            BloomFilter(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
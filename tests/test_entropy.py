@@ -0,0 +1,83 @@
+import io
+import json
+import random
+import string
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from validator import entropy_check
+from validator.entropy_check import (
+    _shannon_entropy_reference,
+    check_file,
+    shannon_entropies,
+    shannon_entropy,
+)
+
+
+def build_texts(count=500, seed=7):
+    rng = random.Random(seed)
+    alphabet = string.printable + "éü中😀"
+    texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 300))) for _ in range(count)]
+    # Uniform texts sit exactly on the 3.0 class boundary
+    texts += [string.ascii_letters[:8] * repeat for repeat in range(1, 50)]
+    texts += ["", "a", "\ud800 lone surrogate"]
+    return texts
+
+
+class ShannonEntropyTests(unittest.TestCase):
+    def test_scalar_matches_reference_exactly(self):
+        for text in build_texts():
+            self.assertEqual(shannon_entropy(text), _shannon_entropy_reference(text))
+
+    def test_batch_matches_reference_with_and_without_numpy(self):
+        texts = build_texts()
+        expected = [_shannon_entropy_reference(text) for text in texts]
+
+        with mock.patch.object(entropy_check, "NUMPY_MIN_CHARS", 0):
+            batch = shannon_entropies(texts)
+        for value, reference in zip(batch, expected):
+            self.assertAlmostEqual(value, reference, places=9)
+
+        with mock.patch.object(entropy_check, "np", None):
+            self.assertEqual(shannon_entropies(texts), expected)
+
+    def test_numpy_path_splits_wide_alphabets(self):
+        if entropy_check.np is None:
+            self.skipTest("NumPy not installed")
+        texts = build_texts(count=50)
+        with mock.patch.object(entropy_check, "NUMPY_MAX_CELLS", 64):
+            batch = entropy_check._shannon_entropies_numpy(texts)
+        for value, text in zip(batch, texts):
+            self.assertAlmostEqual(value, _shannon_entropy_reference(text), places=9)
+
+    def test_check_file_classifies_boundary_values_like_reference(self):
+        texts = build_texts(count=100)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.jsonl"
+            with path.open("w", encoding="utf-8") as f:
+                for text in texts:
+                    f.write(json.dumps({"content": text, "entropy_class": "medium"}) + "\n")
+                f.write("{broken\n")
+
+            buf = io.StringIO()
+            with mock.patch.object(entropy_check, "NUMPY_MIN_CHARS", 0), \
+                    mock.patch.object(entropy_check, "CHECK_CHUNK_SIZE", 64), \
+                    redirect_stdout(buf):
+                check_file(path)
+
+        output = buf.getvalue()
+        expected = sum(
+            entropy_check.classify_entropy(_shannon_entropy_reference(text)) != "medium"
+            for text in texts
+        )
+        self.assertIn(f"Total entries: {len(texts) + 1}", output)
+        self.assertIn(f"Mismatches: {expected}", output)
+        self.assertIn(f"[Entry {len(texts) + 1}] JSON ERROR", output)
+        self.assertNotIn("entropy=-0.00", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from extraction.extractor import (
+    ExtractedBatch,
+    PreNDRPEntry,
+    extract_batch,
+    extract_entries,
+    extract_entries_as_dicts,
+)
+from standardization.rewrite import standardize_batch, to_ndrp_entries, to_ndrp_entry
+from standardization.vocabulary import INTENT_BY_MODE, NDRP_MODES, ROLES
+
+
+LINES = [
+    "Why? Because the sky scatters light.",
+    "Can you explain photosynthesis?",
+    "Once upon a time there was a fox.",
+    "Plain   statement ",
+    "I feel excited today",
+]
+
+
+class ExtractedBatchTests(unittest.TestCase):
+    def test_batch_matches_entry_extraction(self):
+        for source in ("notes.txt", None, ""):
+            batch = extract_batch(LINES, source=source)
+            self.assertEqual(list(batch), list(extract_entries(LINES, source=source)))
+            self.assertEqual(list(batch.iter_dicts()), list(extract_entries_as_dicts(LINES, source=source)))
+            self.assertEqual(batch.sources, [source])
+
+    def test_standardizes_like_single_entries(self):
+        for source in ("notes.txt", None):
+            expected = [to_ndrp_entry(e) for e in extract_entries_as_dicts(LINES, source=source)]
+            actual = to_ndrp_entries(extract_batch(LINES, source=source))
+            self.assertEqual(actual, expected)
+            self.assertEqual([list(e) for e in actual], [list(e) for e in expected])
+
+    def test_interns_sources_and_codes_modes(self):
+        batch = ExtractedBatch()
+        batch.append("a", "meta", "x")
+        batch.append("b", "other", "y")
+        batch.append("c", "meta", "x")
+        self.assertEqual(list(batch.source_ids), [0, 1, 0])
+        self.assertEqual(batch.sources, ["x", "y"])
+        self.assertEqual(batch.mode_codes.typecode, "B")
+        self.assertEqual([batch.mode(i) for i in range(3)], ["meta", "other", "meta"])
+
+    def test_entries_are_slotted(self):
+        entry = extract_batch(LINES[:1], source="s")[0]
+        self.assertIsInstance(entry, PreNDRPEntry)
+        self.assertFalse(hasattr(entry, "__dict__"))
+        self.assertFalse(hasattr(entry.metadata, "__dict__"))
+
+    def test_standardized_batch_stores_codes(self):
+        batch = standardize_batch(extract_batch(LINES, source="notes.txt"))
+        self.assertEqual(len(batch), len(LINES))
+        self.assertEqual(batch.modes.typecode, "B")
+        self.assertEqual(list(batch.roles), [ROLES.index("user")] * len(LINES))
+        self.assertEqual(NDRP_MODES[batch.modes[3]], "context")
+
+    def test_categorical_strings_are_shared(self):
+        entry = to_ndrp_entry({"content": "x", "mode": "".join(["me", "ta"])})
+        self.assertIs(entry["mode"], NDRP_MODES[NDRP_MODES.index("meta")])
+        self.assertIs(entry["intent"], INTENT_BY_MODE["meta"])
+        self.assertEqual(to_ndrp_entry({"content": "x", "mode": ["meta"]})["mode"], "context")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from dataio.manifest import default_manifest_path, load_manifest
+from dataio.profiling import StageProfiler
+from scripts import run_pipeline
+
+
+LINES = [
+    "Please explain how the pipeline works.",
+    "Once upon a time there was a dataset.",
+    "",
+    "I feel happy about this result.",
+    "Hello there, nice to meet you.",
+    "We should change the topic.",
+    "This works because the checks run first.",
+] * 5
+
+
+class IncrementalPipelineTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmpdir = Path(self._tmpdir.name)
+        self.input_path = self.tmpdir / "raw.txt"
+        self.output_path = self.tmpdir / "refined.jsonl"
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def write_input(self, lines):
+        self.input_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def update(self):
+        return run_pipeline.run_incremental(self.input_path, self.output_path, chunk_size=4)
+
+    def full_output(self):
+        full_path = self.tmpdir / "full.jsonl"
+        with redirect_stdout(io.StringIO()):
+            run_pipeline.run_pipeline(str(self.input_path), str(full_path), chunk_size=4)
+        return full_path.read_bytes()
+
+    def test_first_run_processes_everything_and_writes_manifest(self):
+        self.write_input(LINES)
+        stats = self.update()
+
+        manifest = load_manifest(default_manifest_path(self.output_path))
+        self.assertEqual(stats["reused_blocks"], 0)
+        self.assertEqual(stats["processed_blocks"], len(manifest.blocks))
+        self.assertEqual(manifest.output_bytes, self.output_path.stat().st_size)
+        self.assertEqual(self.output_path.read_bytes(), self.full_output())
+
+    def test_append_and_edit_only_reprocess_affected_blocks(self):
+        lines = list(LINES)
+        self.write_input(lines)
+        self.update()
+
+        lines += ["Thank you, goodbye!", "Why is the sky blue?"]
+        self.write_input(lines)
+        stats = self.update()
+        # The partial last block is refilled, plus one new block
+        self.assertEqual(stats["processed_blocks"], 2)
+        self.assertEqual(self.output_path.read_bytes(), self.full_output())
+
+        lines[9] = "A brand new line in the middle."
+        self.write_input(lines)
+        stats = self.update()
+        self.assertEqual(stats["processed_blocks"], 1)
+        self.assertEqual(self.output_path.read_bytes(), self.full_output())
+
+        self.write_input(lines[:12])
+        stats = self.update()
+        self.assertEqual(stats["processed_blocks"], 0)
+        self.assertEqual(self.output_path.read_bytes(), self.full_output())
+
+    def test_stage_version_change_invalidates_everything(self):
+        self.write_input(LINES)
+        self.update()
+
+        with mock.patch.object(run_pipeline, "ENHANCE_VERSION", 999):
+            stats = self.update()
+
+        self.assertEqual(stats["reused_blocks"], 0)
+        self.assertEqual(self.output_path.read_bytes(), self.full_output())
+
+    def test_chunk_size_change_invalidates_everything(self):
+        self.write_input(LINES)
+        self.update()
+
+        stats = run_pipeline.run_incremental(self.input_path, self.output_path, chunk_size=3)
+
+        self.assertEqual(stats["reused_blocks"], 0)
+        self.assertEqual(load_manifest(default_manifest_path(self.output_path)).block_lines, 3)
+        self.assertEqual(self.output_path.read_bytes(), self.full_output())
+
+    def test_modified_output_is_rebuilt(self):
+        self.write_input(LINES)
+        self.update()
+        with self.output_path.open("ab") as f:
+            f.write(b"{}\n")
+
+        stats = self.update()
+        self.assertEqual(stats["reused_blocks"], 0)
+        self.assertEqual(self.output_path.read_bytes(), self.full_output())
+
+    def test_compressed_output_is_rejected(self):
+        self.write_input(LINES)
+        with self.assertRaises(ValueError):
+            run_pipeline.run_incremental(self.input_path, self.tmpdir / "refined.jsonl.gz")
+
+    def test_dedup_is_profiled_per_chunk(self):
+        self.write_input(LINES)
+        profiler = StageProfiler()
+        with redirect_stdout(io.StringIO()):
+            run_pipeline.run_pipeline(
+                str(self.input_path), str(self.output_path), chunk_size=4,
+                dedup="exact", profiler=profiler,
+            )
+        load, dedup = profiler.stages["load"], profiler.stages["dedup"]
+        self.assertEqual((dedup.calls, dedup.entries), (load.calls, load.entries))
+        self.assertLess(dedup.calls, dedup.entries)
+        self.assertEqual(len(self.output_path.read_text(encoding="utf-8").splitlines()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
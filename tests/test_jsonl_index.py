@@ -0,0 +1,138 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from dataio.jsonl_index import IndexedJSONL, build_line_offsets, default_index_path
+from validator.parallel import parse_line_spec, parse_shard_spec
+from validator import parallel
+from validator.validate import main as validate_main, validate_file
+
+
+class LineOffsetTests(unittest.TestCase):
+    def test_offsets_follow_file_iteration(self):
+        for data in (b"", b"\n", b"a\nb", b"a\nb\n", b"a\n\nb\n"):
+            offsets = build_line_offsets(data)
+            lines = io.BytesIO(data).readlines()
+            self.assertEqual(len(offsets) - 1, len(lines), data)
+            self.assertEqual(
+                [data[offsets[i]:offsets[i + 1]] for i in range(len(lines))], lines
+            )
+
+
+class IndexedJSONLTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "dataset.jsonl"
+        self.entries = [{"n": i, "content": f"entry {i}"} for i in range(50)]
+        self.path.write_text(
+            "".join(json.dumps(entry) + "\r\n" for entry in self.entries), encoding="utf-8"
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_random_access_and_slices(self):
+        with IndexedJSONL(self.path) as reader:
+            self.assertEqual(len(reader), 50)
+            self.assertEqual(reader.get(1), self.entries[0])
+            self.assertEqual(reader.get(50), self.entries[49])
+            self.assertEqual(reader[-1], self.entries[-1])
+            self.assertEqual(reader[10:13], self.entries[10:13])
+            self.assertEqual(bytes(reader.line_bytes(3)), json.dumps(self.entries[2]).encode())
+            start, end = reader.byte_range(2, 4)
+            self.assertEqual(bytes(reader.view(2, 4)), self.path.read_bytes()[start:end])
+            with self.assertRaises(IndexError):
+                reader.get(51)
+
+    def test_index_is_persisted_and_invalidated(self):
+        with IndexedJSONL(self.path):
+            pass
+        index_path = default_index_path(self.path)
+        self.assertTrue(index_path.exists())
+
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"n": 50}) + "\n")
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with IndexedJSONL(self.path) as reader:
+            self.assertEqual(len(reader), 51)
+            self.assertEqual(reader.get(51), {"n": 50})
+
+    def test_partial_runs_report_file_line_numbers(self):
+        lines = [json.dumps({"role": "user"})] * 10
+        self.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            validate_file(self.path, lines=(4, 6))
+        output = buf.getvalue()
+
+        self.assertIn("[Entry 4]", output)
+        self.assertIn("[Entry 6]", output)
+        self.assertNotIn("[Entry 3]", output)
+        self.assertNotIn("[Entry 7]", output)
+        self.assertIn("Total entries: 3", output)
+
+    def test_partial_runs_number_entries_by_physical_line(self):
+        lines = [json.dumps({"role": "user"}), "", json.dumps({"role": "user"}), "", json.dumps({"role": "user"})]
+        self.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        entries = [
+            problem.entry
+            for chunk in parallel.iter_chunk_results(self.path, line_range=(2, 5))
+            for problem in chunk.problems
+            if problem.kind == "findings"
+        ]
+        self.assertEqual(entries, [3, 5])
+
+    def test_partial_runs_reject_compressed_input(self):
+        gz_path = Path(str(self.path) + ".gz")
+        with gzip.open(gz_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"role": "user"}) + "\n")
+
+        stderr = io.StringIO()
+        with redirect_stdout(io.StringIO()), mock.patch("sys.stderr", stderr):
+            self.assertEqual(validate_main([str(gz_path), "--lines", "1:1"]), 1)
+        self.assertIn("require an uncompressed JSONL file", stderr.getvalue())
+
+    def test_partial_runs_report_missing_file(self):
+        missing = str(self.path) + ".missing"
+        for option in (["--lines", "1:5"], ["--shard", "1/2"]):
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                self.assertEqual(validate_main([missing, *option]), 1)
+            self.assertIn("Error: File not found", buf.getvalue())
+
+    def test_shards_cover_the_file_once(self):
+        lines = [json.dumps({"role": "user"})] * 10
+        self.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        totals = []
+        for k in range(1, 4):
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                validate_file(self.path, shard=(k, 3))
+            totals.append(int(buf.getvalue().split("Total entries: ")[1].split()[0]))
+
+        self.assertEqual(totals, [3, 3, 4])
+
+    def test_spec_parsing(self):
+        self.assertEqual(parse_line_spec("5:9"), (5, 9))
+        self.assertEqual(parse_line_spec("5:"), (5, 0))
+        self.assertEqual(parse_shard_spec("2/8"), (2, 8))
+        for bad in ("5", "0:3", "9:5"):
+            with self.assertRaises(ValueError):
+                parse_line_spec(bad)
+        with self.assertRaises(ValueError):
+            parse_shard_spec("9/8")
+
+
+if __name__ == "__main__":
+    unittest.main()
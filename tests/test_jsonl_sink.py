@@ -0,0 +1,56 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from dataio import jsonl_sink
+from dataio.jsonl_sink import JSONLSink, dumps_lines, get_serializer, open_jsonl_sink
+
+
+ENTRIES = [
+    {"role": "user", "content": "Héllo", "context": None, "n": i, "metadata": {"source_id": "demo"}}
+    for i in range(5)
+]
+
+
+class JSONLSinkTests(unittest.TestCase):
+    def test_output_matches_json_dumps(self):
+        buf = io.BytesIO()
+        sink = JSONLSink(buf, batch_size=2)
+        sink.write_many(ENTRIES)
+        sink.flush()
+
+        expected = "".join(json.dumps(entry) + "\n" for entry in ENTRIES).encode("utf-8")
+        self.assertEqual(buf.getvalue(), expected)
+        self.assertEqual(dumps_lines(ENTRIES), expected)
+
+    def test_blocks_and_entries_keep_order_and_stats(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "out.jsonl"
+            with open_jsonl_sink(out_path) as sink:
+                sink.write(ENTRIES[0])
+                sink.write_block(dumps_lines(ENTRIES[1:3]), entry_count=2)
+                sink.write(ENTRIES[3])
+
+            with out_path.open("r", encoding="utf-8") as f:
+                written = [json.loads(line) for line in f]
+
+            self.assertEqual(written, ENTRIES[:4])
+            stats = sink.stats()
+            self.assertEqual(stats["entries"], 4)
+            self.assertEqual(stats["bytes"], out_path.stat().st_size)
+
+    def test_unknown_serializer_is_rejected(self):
+        with self.assertRaises(ValueError):
+            get_serializer("yaml")
+
+    @unittest.skipIf(jsonl_sink.orjson is None, "orjson not installed")
+    def test_orjson_output_round_trips(self):
+        block = dumps_lines(ENTRIES, serializer="orjson")
+
+        self.assertEqual([json.loads(line) for line in block.splitlines()], ENTRIES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import io
+import json
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from validator.density_score import compute_density
+from validator.entropy_check import shannon_entropy
+from validator.metrics import (
+    compute_metrics,
+    compute_metrics_batch,
+    histogram,
+    main,
+    percentile,
+    summarize_values,
+)
+
+
+def build_texts(count=500, seed=11):
+    rng = random.Random(seed)
+    words = "because please story, hello! feel the topic; data: model. why? é 中 end".split(" ")
+    texts = [
+        rng.choice(["", " ", "\t"]).join(rng.choice(words) for _ in range(rng.randint(0, 40)))
+        + rng.choice(["", "  ", "\n"])
+        for _ in range(count)
+    ]
+    texts += ["", "   ", "a", "...", "  x y "]
+    return texts
+
+
+class TextMetricsTests(unittest.TestCase):
+    def test_matches_density_and_entropy_functions_exactly(self):
+        for text in build_texts():
+            metrics = compute_metrics(text)
+            self.assertEqual(metrics.density, compute_density(text))
+            self.assertEqual(metrics.entropy, shannon_entropy(text))
+            self.assertEqual(metrics.words, len(text.split()))
+            self.assertEqual(metrics.punctuation, sum(text.count(p) for p in ".,;:!?"))
+
+    def test_batch_matches_single(self):
+        texts = build_texts(count=50)
+        self.assertEqual(compute_metrics_batch(texts), [compute_metrics(t) for t in texts])
+
+    def test_main_reports_density_and_entropy(self):
+        entries = [
+            {"content": "Hello there, friend.", "entropy_class": "medium"},
+            {"content": "aaaa", "entropy_class": "high"},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.jsonl"
+            path.write_text("\n".join(json.dumps(e) for e in entries) + "\n", encoding="utf-8")
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                self.assertEqual(main([str(path)]), 0)
+
+        output = buf.getvalue()
+        self.assertIn(f"[Entry 1] Density: {compute_density(entries[0]['content'])}", output)
+        self.assertIn("Entropy: 0.00 (low) | Words: 1 | ENTROPY MISMATCH (declared: high)", output)
+        self.assertIn("Entropy mismatches: 1", output)
+
+    def test_percentiles_interpolate_between_ranks(self):
+        values = [1.0, 2.0, 3.0, 4.0]
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertEqual(percentile(values, 100), 4.0)
+        summary = summarize_values([3.0, 1.0, 2.0])
+        self.assertEqual((summary["min"], summary["p50"], summary["max"]), (1.0, 2.0, 3.0))
+
+    def test_histogram_clamps_to_range(self):
+        rows = histogram([0.0, 0.5, 1.0, 1.5], bins=2, low=0.0, high=1.0)
+        self.assertEqual([count for _start, _end, count in rows], [1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
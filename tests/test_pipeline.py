@@ -0,0 +1,78 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from dataio.profiling import StageProfiler
+from scripts import run_pipeline
+
+
+LINES = [
+    f"{text} (line {i})"
+    for i, text in enumerate(
+        [
+            "Please explain how the pipeline works.",
+            "Once upon a time there was a dataset.",
+            "I feel happy about this result.",
+            "Hello there, nice to meet you.",
+            "We should change the topic.",
+            "This works because the checks run first.",
+        ] * 6
+    )
+]
+
+
+class ParallelPipelineTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmpdir = Path(self._tmpdir.name)
+        self.input_path = self.tmpdir / "raw.txt"
+        self.input_path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def run_pipeline(self, name, workers, profiler=None):
+        output_path = self.tmpdir / name
+        with redirect_stdout(io.StringIO()):
+            run_pipeline.run_pipeline(
+                str(self.input_path), str(output_path), workers=workers, chunk_size=4,
+                profiler=profiler,
+            )
+        return output_path.read_bytes()
+
+    def test_workers_match_serial_output(self):
+        serial = self.run_pipeline("serial.jsonl", workers=1)
+        self.assertEqual(len(serial.splitlines()), len(LINES))
+        self.assertEqual(self.run_pipeline("parallel.jsonl", workers=3), serial)
+
+    def test_worker_profiles_are_merged(self):
+        serial_profiler, parallel_profiler = StageProfiler(), StageProfiler()
+        serial = self.run_pipeline("serial.jsonl", workers=1, profiler=serial_profiler)
+        parallel = self.run_pipeline("parallel.jsonl", workers=3, profiler=parallel_profiler)
+
+        self.assertEqual(parallel, serial)
+        for stage in ("extract", "standardize", "enhance", "serialize", "write"):
+            with self.subTest(stage=stage):
+                expected = serial_profiler.stages[stage]
+                merged = parallel_profiler.stages[stage]
+                self.assertEqual((merged.calls, merged.entries), (expected.calls, expected.entries))
+
+    def test_pending_chunks_are_bounded(self):
+        submitted = []
+        chunks = ([line] for line in LINES)
+
+        def tracked():
+            for chunk in chunks:
+                submitted.append(chunk)
+                yield chunk
+
+        results = run_pipeline._iter_processed(tracked(), "raw.txt", workers=2)
+        next(results)
+        self.assertLessEqual(len(submitted), 2 * run_pipeline.MAX_PENDING_PER_WORKER)
+        self.assertEqual(1 + sum(1 for _ in results), len(LINES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import pickle
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from dataio.profiling import StageProfiler, profile_stage
+
+
+class StageProfilerTests(unittest.TestCase):
+    def test_nested_stages_record_exclusive_time(self):
+        profiler = StageProfiler()
+
+        def slow_items():
+            for item in range(3):
+                time.sleep(0.01)
+                yield item
+
+        with profiler.stage("outer") as sample:
+            items = list(profiler.iter("inner", slow_items(), size=lambda _item: 10))
+            sample.entries = len(items)
+
+        inner, outer = profiler.stages["inner"], profiler.stages["outer"]
+        self.assertEqual((inner.calls, inner.entries, inner.bytes), (3, 3, 30))
+        self.assertGreaterEqual(inner.seconds, 0.03)
+        self.assertLess(outer.seconds, 0.01)
+        self.assertEqual((outer.calls, outer.entries), (1, 3))
+
+    def test_hooks_merge_and_pickling(self):
+        events = []
+        worker = StageProfiler()
+        worker.record("extract", 0.5, entries=10, nbytes=100)
+        worker.add_hook(lambda *event: None)
+        worker = pickle.loads(pickle.dumps(worker))
+
+        profiler = StageProfiler()
+        profiler.add_hook(lambda *event: events.append(event))
+        profiler.merge(worker)
+        profiler.merge(worker)
+
+        stats = profiler.stages["extract"]
+        self.assertEqual((stats.calls, stats.entries, stats.bytes), (2, 20, 200))
+        self.assertEqual(stats.entries_per_sec, 20.0)
+        self.assertEqual(events, [("extract", 0.5, 10, 100)] * 2)
+
+    def test_table_and_json_dump(self):
+        profiler = StageProfiler()
+        profiler.record("load", 1.0, entries=1000, nbytes=2_000_000)
+        profiler.record("validate", 3.0, entries=1000)
+
+        table = profiler.format_table()
+        self.assertTrue(table[1].startswith("load"))
+        self.assertIn("25.0%", table[1])
+        self.assertIn("2.00", table[1])
+        self.assertTrue(table[-1].startswith("total"))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "profile.json"
+            profiler.dump(path)
+            data = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(data["total_seconds"], 4.0)
+        self.assertEqual(data["stages"]["load"]["bytes_per_sec"], 2_000_000.0)
+
+    def test_disabled_stage_is_a_no_op(self):
+        with profile_stage(None, "anything", 5) as sample:
+            sample.nbytes = 10
+        self.assertEqual(sample.entries, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import json
+import random
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from jsonschema import Draft7Validator
+
+from validator.compiler import UnsupportedSchemaError, compile_schema, compiled_check, generate_source
+from validator.validate import check_entry
+
+
+ROOT = Path(__file__).parent.parent
+SCHEMA_PATHS = sorted(
+    path
+    for directory in ("schema", "schemas")
+    for path in (ROOT / directory).glob("*.json")
+    if path.stat().st_size  # lfsl/metadata schemas are empty placeholders
+)
+
+# Exercises keywords the shipped schemas do not use
+FEATURE_SCHEMA = {
+    "type": "object",
+    "required": ["kind"],
+    "properties": {
+        "kind": {"const": "sample"},
+        "count": {"type": "integer"},
+        "score": {"type": ["number", "null"]},
+        "label": {"enum": ["a", "b", None], "maxLength": 1},
+        "tags": {"type": "array"},
+        "note": {"minLength": 2, "description": "untyped"},
+        "free": True,
+        "never": False,
+        "nested": {
+            "type": "object",
+            "properties": {"flag": {"type": "boolean"}},
+            "additionalProperties": {"type": "string"},
+        },
+        "closed": {"properties": {"x": {}}, "additionalProperties": False},
+    },
+}
+
+ODD_VALUES = [
+    None, True, False, 0, 1, -3, 1.0, 2.5, float("nan"), "", " ", "x", "ab", "user", "low",
+    "sample", "a", [], ["a"], {}, {"a": 1}, {"flag": True}, {"x": 1}, {"y": "z"},
+]
+
+
+def _valid_value(schema, rng):
+    if schema is True or not isinstance(schema, dict):
+        return "free"
+    if "const" in schema:
+        return schema["const"]
+    if "enum" in schema:
+        return rng.choice([v for v in schema["enum"] if v is None or len(v) <= schema.get("maxLength", 99)])
+    types = schema.get("type", "string")
+    kind = rng.choice(types) if isinstance(types, list) else types
+    if kind == "object":
+        return {key: _valid_value(sub, rng) for key, sub in schema.get("properties", {}).items() if sub is not False}
+    return {"string": "text", "null": None, "boolean": True, "integer": 3, "number": 0.5, "array": []}[kind]
+
+
+def _instances(schema, count, seed=0):
+    """
+    Valid instances of ``schema`` and random mutations of them.
+    """
+    rng = random.Random(seed)
+    properties = schema.get("properties", {})
+    keys = list(properties) + ["extra"]
+    yield from ODD_VALUES
+    for _ in range(count):
+        instance = _valid_value(schema, rng)
+        yield json.loads(json.dumps(instance))
+        for _ in range(rng.randint(1, 3)):
+            key = rng.choice(keys)
+            action = rng.random()
+            if action < 0.2:
+                instance.pop(key, None)
+            elif action < 0.7:
+                instance[key] = rng.choice(ODD_VALUES)
+            elif isinstance(properties.get(key), dict) and properties[key].get("type") == "object":
+                nested = instance.setdefault(key, {})
+                if isinstance(nested, dict):
+                    nested[rng.choice(list(properties[key]["properties"]) + ["other"])] = rng.choice(ODD_VALUES)
+            else:
+                # Near miss of an enum member
+                subschema = properties.get(key)
+                enum = subschema.get("enum", []) if isinstance(subschema, dict) else []
+                members = [value for value in enum if isinstance(value, str)]
+                instance[key] = rng.choice(members).upper() if members else rng.choice(ODD_VALUES)
+        yield instance
+
+
+def _outcome(entry, all_errors):
+    # The semantic checks raise on some malformed entries; that must not change either
+    try:
+        return check_entry(entry, all_errors=all_errors)
+    except Exception as exc:
+        return type(exc)
+
+
+class SchemaCompilerTests(unittest.TestCase):
+    def assert_same_decisions(self, schema, count=2000):
+        reference = Draft7Validator(schema)
+        check = compile_schema(schema)
+        accepted = rejected = 0
+        for instance in _instances(schema, count):
+            expected = reference.is_valid(instance)
+            self.assertEqual(check(instance), expected, f"{instance!r}\n{check.source}")
+            accepted += expected
+            rejected += not expected
+        # Both outcomes must be well represented for the comparison to mean anything
+        self.assertGreater(accepted, count // 10)
+        self.assertGreater(rejected, count // 10)
+
+    def test_repository_schemas_match_jsonschema(self):
+        self.assertTrue(SCHEMA_PATHS)
+        for path in SCHEMA_PATHS:
+            with self.subTest(schema=path.name):
+                self.assert_same_decisions(json.loads(path.read_text(encoding="utf-8")))
+
+    def test_feature_schema_matches_jsonschema(self):
+        self.assert_same_decisions(FEATURE_SCHEMA)
+
+    def test_boolean_schemas(self):
+        self.assertTrue(compile_schema(True)({"anything": 1}))
+        self.assertFalse(compile_schema(False)(None))
+
+    def test_unsupported_keywords_are_not_compiled(self):
+        schema = {"type": "object", "properties": {"n": {"type": "integer", "minimum": 0}}}
+        with self.assertRaisesRegex(UnsupportedSchemaError, "minimum"):
+            generate_source(schema)
+        self.assertIsNone(compiled_check(schema))
+        with self.assertRaises(UnsupportedSchemaError):
+            generate_source({"enum": [1, 2]})
+
+    def test_compiled_check_is_cached_per_schema_object(self):
+        schema = {"type": "string"}
+        self.assertIs(compiled_check(schema), compiled_check(schema))
+        self.assertIsNot(compiled_check(schema), compiled_check(dict(schema)))
+
+    def test_generated_source_is_reproducible(self):
+        path = ROOT / "schema" / "entry_schema.json"
+        schema = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(generate_source(schema), generate_source(json.loads(path.read_text(encoding="utf-8"))))
+
+    def test_check_entry_findings_unchanged(self):
+        schema = json.loads((ROOT / "schema" / "entry_schema.json").read_text(encoding="utf-8"))
+        for entry in _instances(schema, 300, seed=1):
+            if not isinstance(entry, dict):
+                continue
+            for all_errors in (True, False):
+                fast = _outcome(entry, all_errors)
+                with mock.patch("validator.validate.compiled_check", return_value=None):
+                    self.assertEqual(fast, _outcome(entry, all_errors))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from validator import cache as cache_module
+from validator.cache import ValidationCache, entry_digest
+from validator.validate import check_entry
+
+
+VALID_ENTRY = {
+    "role": "user",
+    "content": "Example content",
+    "intent": "instruction",
+    "mode": "instruction",
+    "context": None,
+    "meaning_preserved": True,
+    "density_goal": "medium",
+    "entropy_class": "low",
+}
+
+
+class ValidationCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmpdir = Path(self._tmpdir.name)
+        self.cache_path = self.tmpdir / "findings.sqlite"
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_digest_ignores_key_order_but_not_mode(self):
+        reordered = dict(reversed(list(VALID_ENTRY.items())))
+        self.assertEqual(entry_digest(VALID_ENTRY, True), entry_digest(reordered, True))
+        self.assertNotEqual(entry_digest(VALID_ENTRY, True), entry_digest(VALID_ENTRY, False))
+
+    def test_cached_findings_match_fresh_checks_across_runs(self):
+        invalid = dict(VALID_ENTRY, role="bot", content="")
+        expected = check_entry(invalid, all_errors=True)
+
+        with ValidationCache(self.cache_path) as cache:
+            self.assertEqual(cache.check(invalid), expected)
+            self.assertEqual(cache.check(dict(invalid)), expected)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        with ValidationCache(self.cache_path) as cache:
+            with mock.patch("validator.validate.check_entry") as check:
+                self.assertEqual(cache.check(invalid), expected)
+            check.assert_not_called()
+            self.assertEqual(cache.stats()["hit_rate"], 1.0)
+
+    def test_schema_change_invalidates_cache(self):
+        schema_path = self.tmpdir / "schema.json"
+        schema_path.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+        with ValidationCache(self.cache_path, schema_path) as cache:
+            cache.check(VALID_ENTRY)
+
+        schema_path.write_text(json.dumps({"type": "object", "required": ["id"]}), encoding="utf-8")
+        with ValidationCache(self.cache_path, schema_path):
+            pass
+
+        with sqlite3.connect(str(self.cache_path)) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0], 0)
+
+    def test_checks_version_change_invalidates_cache(self):
+        with ValidationCache(self.cache_path) as cache:
+            cache.check(VALID_ENTRY)
+
+        with mock.patch("validator.validate.CHECKS_VERSION", -1):
+            with ValidationCache(self.cache_path) as cache:
+                cache.check(VALID_ENTRY)
+                self.assertEqual(cache.misses, 1)
+
+    def _stored_rows(self):
+        with sqlite3.connect(str(self.cache_path)) as conn:
+            return conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
+
+    def test_pending_results_are_flushed_periodically(self):
+        entries = [dict(VALID_ENTRY, content=f"entry {i}") for i in range(5)]
+        with mock.patch.object(cache_module, "COMMIT_EVERY", 2):
+            with ValidationCache(self.cache_path) as cache:
+                for entry in entries:
+                    cache.check(entry)
+                self.assertEqual(len(cache._pending), 1)
+                self.assertEqual(self._stored_rows(), 4)
+        self.assertEqual(self._stored_rows(), 5)
+
+    def test_results_are_kept_when_run_is_interrupted(self):
+        with self.assertRaises(KeyboardInterrupt):
+            with ValidationCache(self.cache_path) as cache:
+                cache.check(VALID_ENTRY)
+                raise KeyboardInterrupt
+        self.assertEqual(self._stored_rows(), 1)
+
+    def test_stats_formatting(self):
+        stats = cache_module.cache_stats(3, 1, 0.5)
+        self.assertEqual(stats["hit_rate"], 0.75)
+        self.assertIn("75.0% hit rate", cache_module.format_cache_stats(stats))
+
+
+if __name__ == "__main__":
+    unittest.main()
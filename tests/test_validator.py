@@ -0,0 +1,179 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from validator import parallel
+from validator.density_score import score_file
+from validator.entropy_check import check_file
+from validator import validate as validate_module
+from validator import engine
+from validator.engine import clear_validator_cache, get_validator, load_schema
+from validator.validate import collect_findings, validate_entry, validate_file
+
+
+VALID_ENTRY = {
+    "role": "user",
+    "content": "Example content",
+    "intent": "instruction",
+    "mode": "instruction",
+    "context": None,
+    "meaning_preserved": True,
+    "density_goal": "medium",
+    "entropy_class": "low",
+}
+
+
+class ValidatorEngineTests(unittest.TestCase):
+    def test_validator_is_cached_per_schema_file(self):
+        self.assertIs(get_validator(), get_validator())
+
+    def test_entry_schema_is_loaded_on_first_access(self):
+        schema = validate_module.ENTRY_SCHEMA
+        self.assertEqual(schema, load_schema(validate_module.SCHEMA_PATH))
+        self.assertIs(validate_module.ENTRY_SCHEMA, schema)
+        with self.assertRaises(AttributeError):
+            validate_module.NOT_A_SCHEMA
+
+    def test_cache_refreshes_when_schema_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_path = Path(tmpdir) / "schema.json"
+            schema_path.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+            first = get_validator(schema_path)
+
+            schema_path.write_text(json.dumps({"type": "array"}), encoding="utf-8")
+            stat = schema_path.stat()
+            os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            # Within the check interval the cached validator is trusted
+            self.assertIs(get_validator(schema_path), first)
+            with mock.patch.object(engine, "MTIME_CHECK_INTERVAL", 0):
+                second = get_validator(schema_path)
+
+            self.assertIsNot(first, second)
+            self.assertTrue(second.is_valid([]))
+            clear_validator_cache()
+
+    def test_cached_validator_skips_stat_within_interval(self):
+        get_validator()
+        with mock.patch("validator.engine.os.stat", side_effect=AssertionError("stat called")):
+            for _ in range(3):
+                get_validator()
+
+    def test_validate_entry_reports_schema_error(self):
+        entry = dict(VALID_ENTRY)
+        entry.pop("intent")
+
+        errors = validate_entry(entry, 3)
+
+        self.assertEqual(errors, ["[Entry 3] SCHEMA ERROR: 'intent' is a required property"])
+
+    def test_validate_entry_accepts_valid_entry(self):
+        self.assertEqual(validate_entry(VALID_ENTRY, 1), [])
+
+    def test_collect_findings_reports_every_schema_error(self):
+        entry = dict(VALID_ENTRY)
+        entry.pop("intent")
+        entry["mode"] = "poetry"
+        entry["metadata"] = {"lfsl_enabled": "yes"}
+
+        findings = collect_findings(entry, 2)
+        schema_findings = [f for f in findings if f["message"].startswith("[Entry 2] SCHEMA ERROR")]
+
+        self.assertEqual(
+            sorted((f["path"], f["keyword"]) for f in schema_findings),
+            [("/intent", "required"), ("/metadata/lfsl_enabled", "type"), ("/mode", "enum")],
+        )
+
+    def test_first_error_mode_keeps_single_schema_error(self):
+        entry = dict(VALID_ENTRY)
+        entry.pop("intent")
+        entry["mode"] = "poetry"
+
+        findings = collect_findings(entry, 1, all_errors=False)
+
+        self.assertEqual(len(findings), 1)
+
+
+class ParallelValidationTests(unittest.TestCase):
+    def _write_dataset(self, path):
+        lines = []
+        for i in range(400):
+            entry = dict(VALID_ENTRY, content=f"Entry {i}")
+            if i % 7 == 0:
+                entry.pop("intent")
+            if i % 11 == 0:
+                entry["role"] = "narrator"
+            lines.append(json.dumps(entry))
+            if i % 50 == 0:
+                lines.append("")
+        lines.insert(3, "{not json")
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def test_split_byte_ranges_align_to_lines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            self._write_dataset(data_path)
+            original = parallel.MIN_CHUNK_BYTES
+            parallel.MIN_CHUNK_BYTES = 512
+            try:
+                ranges = parallel.split_byte_ranges(data_path, 8)
+            finally:
+                parallel.MIN_CHUNK_BYTES = original
+
+            data = data_path.read_bytes()
+            self.assertEqual(len(ranges), 8)
+            self.assertEqual(ranges[0][0], 0)
+            self.assertEqual(ranges[-1][1], len(data))
+            for start, _end in ranges[1:]:
+                self.assertEqual(data[start - 1:start], b"\n")
+
+    def test_parallel_output_matches_serial(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            self._write_dataset(data_path)
+
+            outputs = []
+            original = parallel.MIN_CHUNK_BYTES
+            parallel.MIN_CHUNK_BYTES = 512
+            try:
+                for workers in (1, 3):
+                    buf = io.StringIO()
+                    with redirect_stdout(buf):
+                        error_count = validate_file(data_path, all_errors=True, workers=workers)
+                    outputs.append((error_count, buf.getvalue()))
+            finally:
+                parallel.MIN_CHUNK_BYTES = original
+
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertIn("[Entry 4] JSON ERROR: Invalid JSON line.", outputs[0][1])
+
+    def test_entropy_and_density_checks_match_serial(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "dataset.jsonl"
+            self._write_dataset(data_path)
+
+            for check in (check_file, score_file):
+                # One chunk, then many small chunks serially and in a pool
+                outputs = []
+                for min_chunk_bytes, workers in ((parallel.MIN_CHUNK_BYTES, 1), (512, 1), (512, 3)):
+                    original = parallel.MIN_CHUNK_BYTES
+                    parallel.MIN_CHUNK_BYTES = min_chunk_bytes
+                    try:
+                        buf = io.StringIO()
+                        with redirect_stdout(buf):
+                            check(data_path, workers=workers)
+                    finally:
+                        parallel.MIN_CHUNK_BYTES = original
+                    outputs.append(buf.getvalue())
+
+                self.assertEqual(outputs[0], outputs[1])
+                self.assertEqual(outputs[0], outputs[2])
+                self.assertIn("[Entry 4] JSON ERROR", outputs[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
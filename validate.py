@@ -6,25 +6,22 @@ This is a thin wrapper around the canonical validator in validator/validate.py.
 It provides the same CLI interface for backward compatibility.
 
 Usage:
-    python validate.py <dataset.jsonl>
+    python validate.py <dataset.jsonl> [--all-errors] [--workers N]
+                       [--lines FIRST:LAST] [--shard K/N] [--cache PATH]
+
+--lines and --shard validate part of an uncompressed file (1-based,
+inclusive lines, or shard K of N); --cache reuses findings for unchanged
+entries from a cache file across runs.
 """
 import sys
-from pathlib import Path
 
 # Import the canonical validator
-from validator.validate import validate_file
+from validator.validate import main as validator_main
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python validate.py <dataset.jsonl>")
-        sys.exit(1)
-
-    jsonl_file = sys.argv[1]
-    error_count = validate_file(jsonl_file)
-    
     # Exit with appropriate code
-    sys.exit(0 if error_count == 0 else 1)
+    sys.exit(validator_main(sys.argv[1:]))
 
 
 if __name__ == "__main__":
@@ -3,9 +3,10 @@ Deterministic aggregation of validator results into a hygiene score and rating.
 
 This module is intentionally independent from validator internals and relies
 only on the presence of a severity value for each result item. It exposes a
-single pure function, ``aggregate_validator_results``, which accepts an
-iterable of validator outputs and returns an explainable score, rating, and
-severity counts.
+pure function, ``aggregate_validator_results``, which accepts an iterable of
+validator outputs and returns an explainable score, rating, and severity
+counts, and ``HygieneAggregator``, the incremental form of the same
+computation for unbounded streams and sharded runs.
 """
 from collections import Counter, defaultdict
 from typing import Any, Iterable, Mapping, MutableMapping, Optional
@@ -94,6 +95,87 @@ def _build_summary(rating: str, counts: Mapping[str, int]) -> Iterable[str]:
     yield secondary_messages[rating]
 
 
+class HygieneAggregator:
+    """
+    Incremental hygiene aggregation.
+
+    Only per-severity counts are kept, so memory is constant regardless of
+    how many results are added, and partial aggregates from parallel workers
+    or shards combine in O(1) via ``merge``. ``snapshot`` can be taken at any
+    point and returns the same structure as ``aggregate_validator_results``.
+    """
+
+    def __init__(self, severity_weights: Optional[Mapping[str, int]] = None) -> None:
+        weights = dict(DEFAULT_SEVERITY_WEIGHTS)
+        if severity_weights:
+            weights.update(severity_weights)
+
+        self.weights: Mapping[str, int] = weights
+        self.severity_counts: Counter[str] = Counter()
+        self.total_penalty = 0
+
+    def __len__(self) -> int:
+        return sum(self.severity_counts.values())
+
+    def add(self, result: Any) -> None:
+        """
+        Record a single validator result.
+        """
+        severity = _extract_severity(result)
+        self.severity_counts[severity] += 1
+        self.total_penalty += self.weights.get(severity, UNKNOWN_SEVERITY_WEIGHT)
+
+    def update(self, results: Iterable[Any]) -> None:
+        """
+        Record every result from an iterable.
+        """
+        for result in results:
+            self.add(result)
+
+    def merge(self, other: "HygieneAggregator") -> "HygieneAggregator":
+        """
+        Fold another partial aggregate into this one and return ``self``.
+        """
+        if dict(other.weights) != dict(self.weights):
+            raise ValueError("Cannot merge aggregators with different severity weights")
+
+        self.severity_counts.update(other.severity_counts)
+        self.total_penalty += other.total_penalty
+        return self
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """
+        Current hygiene score, rating, counts and penalty breakdown.
+        """
+        weights = self.weights
+        penalty_by_severity: MutableMapping[str, int] = defaultdict(
+            int, {severity: 0 for severity in weights}
+        )
+        for severity, count in self.severity_counts.items():
+            penalty_by_severity[severity] += count * weights.get(severity, UNKNOWN_SEVERITY_WEIGHT)
+
+        hygiene_score = max(0, MAX_SCORE - self.total_penalty)
+        rating = _rating_from_score(hygiene_score)
+
+        severity_counts_output = dict(self.severity_counts)
+        for severity in weights:
+            severity_counts_output.setdefault(severity, 0)
+
+        return {
+            "hygiene_score": hygiene_score,
+            "rating": rating,
+            "severity_counts": severity_counts_output,
+            "penalties": {
+                "total_penalty": self.total_penalty,
+                "by_severity": dict(penalty_by_severity),
+                "weights": dict(weights),
+                "unknown_weight": UNKNOWN_SEVERITY_WEIGHT,
+            },
+            "max_score": MAX_SCORE,
+            "summary": list(_build_summary(rating, severity_counts_output)),
+        }
+
+
 def aggregate_validator_results(
     results: Iterable[Any],
     severity_weights: Optional[Mapping[str, int]] = None,
@@ -119,42 +201,6 @@ def aggregate_validator_results(
         - penalties: explainable penalty breakdown
         - summary: short human-readable statements derived from findings
     """
-    weights = dict(DEFAULT_SEVERITY_WEIGHTS)
-    if severity_weights:
-        weights.update(severity_weights)
-
-    severity_counts: Counter[str] = Counter()
-    penalty_by_severity: MutableMapping[str, int] = defaultdict(
-        int, {severity: 0 for severity in weights}
-    )
-
-    total_penalty = 0
-
-    for result in results:
-        severity = _extract_severity(result)
-        weight = weights.get(severity, UNKNOWN_SEVERITY_WEIGHT)
-
-        severity_counts[severity] += 1
-        penalty_by_severity[severity] += weight
-        total_penalty += weight
-
-    hygiene_score = max(0, MAX_SCORE - total_penalty)
-    rating = _rating_from_score(hygiene_score)
-
-    severity_counts_output = dict(severity_counts)
-    for severity in weights:
-        severity_counts_output.setdefault(severity, 0)
-
-    return {
-        "hygiene_score": hygiene_score,
-        "rating": rating,
-        "severity_counts": severity_counts_output,
-        "penalties": {
-            "total_penalty": total_penalty,
-            "by_severity": dict(penalty_by_severity),
-            "weights": dict(weights),
-            "unknown_weight": UNKNOWN_SEVERITY_WEIGHT,
-        },
-        "max_score": MAX_SCORE,
-        "summary": list(_build_summary(rating, severity_counts_output)),
-    }
+    aggregator = HygieneAggregator(severity_weights)
+    aggregator.update(results)
+    return aggregator.snapshot()
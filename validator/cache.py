@@ -0,0 +1,180 @@
+"""
+Persistent cache of per-entry validation findings.
+
+Entries are keyed by a hash of their canonical JSON form (sorted keys,
+compact separators) together with the ``all_errors`` mode. The cache file is
+tied to the schema content and ``CHECKS_VERSION``; when either changes, the
+stored findings are discarded on open. Each row also records how long the
+entry took to validate, so re-runs can report the time a hit saved.
+
+The cache is a SQLite database in WAL mode, which lets parallel validation
+workers read and write it concurrently.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from validator.engine import ENTRY_SCHEMA_PATH
+
+# Seconds to wait for another process holding the write lock
+BUSY_TIMEOUT = 60.0
+
+# Buffered new results are written once this many are pending, bounding
+# memory and the work lost if a run is interrupted
+COMMIT_EVERY = 10_000
+
+Problem = Tuple[str, str, str]
+
+
+def entry_digest(entry: Mapping[str, Any], all_errors: bool) -> bytes:
+    """
+    Stable 16-byte digest of an entry's canonical JSON form.
+    """
+    canonical = json.dumps(entry, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(b"1" if all_errors else b"0")
+    digest.update(canonical.encode("utf-8"))
+    return digest.digest()
+
+
+def schema_digest(schema_path: Union[str, Path] = ENTRY_SCHEMA_PATH) -> str:
+    with open(schema_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class ValidationCache:
+    """
+    Findings cache backed by SQLite.
+
+    Use ``check`` in place of ``validator.validate.check_entry``; new results
+    are buffered and written every ``COMMIT_EVERY`` misses and on ``commit``
+    (also done by ``close`` and on leaving a ``with`` block, even through an
+    exception).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        schema_path: Union[str, Path] = ENTRY_SCHEMA_PATH,
+    ) -> None:
+        from validator.validate import CHECKS_VERSION
+
+        self.path = Path(path)
+        self.version = f"{schema_digest(schema_path)}:{CHECKS_VERSION}"
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+        self.seconds_validating = 0.0
+        self._pending: Dict[bytes, Tuple[List[Problem], float]] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS findings ("
+                "digest BLOB PRIMARY KEY, problems TEXT NOT NULL, seconds REAL NOT NULL)"
+            )
+            row = self._conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != self.version:
+                # Schema or checks changed: every stored finding is stale
+                self._conn.execute("DELETE FROM findings")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)",
+                    (self.version,),
+                )
+
+    def __enter__(self) -> "ValidationCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def lookup(self, digest: bytes) -> Optional[Tuple[List[Problem], float]]:
+        """
+        Stored problems and validation time for ``digest``, or None.
+        """
+        if digest in self._pending:
+            return self._pending[digest]
+        row = self._conn.execute(
+            "SELECT problems, seconds FROM findings WHERE digest = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            return None
+        return [tuple(problem) for problem in json.loads(row[0])], row[1]
+
+    def check(self, entry: Mapping[str, Any], schema_validator=None, all_errors: bool = True) -> List[Problem]:
+        """
+        ``check_entry`` with caching: reuse stored problems for unchanged
+        entries and validate (and remember) everything else.
+        """
+        from validator.validate import check_entry
+
+        digest = entry_digest(entry, all_errors)
+        cached = self.lookup(digest)
+        if cached is not None:
+            problems, seconds = cached
+            self.hits += 1
+            self.seconds_saved += seconds
+            return problems
+
+        start = time.perf_counter()
+        problems = check_entry(entry, schema_validator, all_errors)
+        seconds = time.perf_counter() - start
+
+        self.misses += 1
+        self.seconds_validating += seconds
+        self._pending[digest] = (problems, seconds)
+        if len(self._pending) >= COMMIT_EVERY:
+            self.commit()
+        return problems
+
+    def commit(self) -> None:
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO findings (digest, problems, seconds) VALUES (?, ?, ?)",
+                [
+                    (digest, json.dumps(problems), seconds)
+                    for digest, (problems, seconds) in self._pending.items()
+                ],
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        try:
+            self.commit()
+        finally:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, float]:
+        return cache_stats(self.hits, self.misses, self.seconds_saved)
+
+
+def cache_stats(hits: int, misses: int, seconds_saved: float) -> Dict[str, float]:
+    """
+    Summary figures for cache use, merged across workers by the caller.
+    """
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "seconds_saved": seconds_saved,
+    }
+
+
+def format_cache_stats(stats: Mapping[str, float]) -> str:
+    return (
+        f"Cache: {stats['hits']} hits, {stats['misses']} misses "
+        f"({stats['hit_rate'] * 100:.1f}% hit rate), "
+        f"~{stats['seconds_saved']:.2f}s validation time saved"
+    )
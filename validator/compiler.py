@@ -0,0 +1,290 @@
+"""
+Schema compiler for the NDRP validator.
+
+NDRP schemas are small and fixed: required keys, string enums, type unions
+and nested objects. ``compile_schema`` turns such a schema into generated
+Python source with straight-line checks and compiles it into an
+``is_valid(instance) -> bool`` function that accepts exactly the instances
+jsonschema's ``Draft7Validator`` accepts, far faster than walking the schema
+per entry.
+
+The fast function only answers accept/reject. Callers fall back to the
+jsonschema validator for detailed errors when it rejects an instance (see
+``validator.validate.check_entry``). Schemas using keywords outside the
+supported subset are not compiled and ``compiled_check`` returns None, so
+they are always validated by jsonschema.
+
+To inspect the generated code:
+    python validator/compiler.py schema/entry_schema.json
+"""
+import argparse
+import json
+import numbers
+import sys
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Keywords with no effect on validity. ``format`` is an annotation as well:
+# the engine builds validators without a format checker.
+ANNOTATION_KEYWORDS = frozenset({
+    "$schema", "$id", "$comment", "title", "description", "default", "examples",
+    "readOnly", "writeOnly", "format",
+})
+CHECKED_KEYWORDS = frozenset({
+    "type", "enum", "const", "minLength", "maxLength",
+    "required", "properties", "additionalProperties",
+})
+
+# Draft 7 type name -> condition template; bools are not numbers and
+# integral floats are integers, as in jsonschema's draft 6+ type checker
+TYPE_CONDITIONS = {
+    "string": "isinstance({v}, str)",
+    "null": "{v} is None",
+    "boolean": "isinstance({v}, bool)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+    "integer": (
+        "((isinstance({v}, int) and not isinstance({v}, bool))"
+        " or (isinstance({v}, float) and {v}.is_integer()))"
+    ),
+}
+
+Check = Callable[[Any], bool]
+
+# id(schema) -> (schema, compiled check or None); the schema is kept alive so
+# its id cannot be reused by another object
+_CHECK_CACHE: Dict[int, Tuple[Any, Optional[Check]]] = {}
+_CACHE_LOCK = Lock()
+
+
+class UnsupportedSchemaError(ValueError):
+    """
+    The schema uses a keyword or value the compiler does not handle.
+    """
+
+
+class _Generator:
+    def __init__(self):
+        self.constants: List[str] = []
+        self.lines: List[str] = []
+        self._names = 0
+
+    def name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def constant(self, values: List[str]) -> str:
+        """
+        Emit a frozenset constant (sorted, so the source is reproducible).
+        """
+        name = f"_C{len(self.constants)}"
+        members = ", ".join(repr(value) for value in sorted(values))
+        self.constants.append(f"{name} = frozenset({{{members}}})" if values else f"{name} = frozenset()")
+        return name
+
+    def emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def schema(self, schema: Any, var: str, depth: int, where: str) -> None:
+        """
+        Emit checks returning False when ``var`` does not match ``schema``.
+        """
+        if schema is True:
+            return
+        if schema is False:
+            self.emit(depth, "return False")
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"{where}: schema must be an object or boolean")
+
+        unknown = set(schema) - ANNOTATION_KEYWORDS - CHECKED_KEYWORDS
+        if unknown:
+            raise UnsupportedSchemaError(f"{where}: unsupported keyword(s) {', '.join(sorted(unknown))}")
+
+        types = self._types(schema, where)
+        if types is not None:
+            self.emit(depth, f"if not ({' or '.join(TYPE_CONDITIONS[t].format(v=var) for t in types)}):")
+            self.emit(depth + 1, "return False")
+
+        for keyword in ("enum", "const"):
+            if keyword in schema:
+                values = schema["enum"] if keyword == "enum" else [schema["const"]]
+                self._enum(values, var, depth, types, f"{where}/{keyword}")
+
+        self._string(schema, var, depth, types, where)
+        self._object(schema, var, depth, types, where)
+
+    def _types(self, schema: Dict[str, Any], where: str) -> Optional[List[str]]:
+        if "type" not in schema:
+            return None
+        types = schema["type"]
+        types = [types] if isinstance(types, str) else types
+        if not isinstance(types, list) or not all(t in TYPE_CONDITIONS for t in types):
+            raise UnsupportedSchemaError(f"{where}/type: unsupported type {schema['type']!r}")
+        return types
+
+    def _enum(self, values: Any, var: str, depth: int, types, where: str) -> None:
+        # Only string and null members: they compare as plain ``==`` / ``is``
+        # under jsonschema's equality, which keeps bools apart from numbers
+        if not isinstance(values, list) or not all(v is None or isinstance(v, str) for v in values):
+            raise UnsupportedSchemaError(f"{where}: only string and null values are supported")
+        strings = {v for v in values if v is not None}
+        conditions = []
+        if None in values:
+            conditions.append(f"{var} is None")
+        if strings:
+            allowed = self.constant(list(strings))
+            if types == ["string"]:
+                conditions.append(f"{var} in {allowed}")
+            else:
+                # Unhashable values must not reach the set lookup
+                conditions.append(f"(isinstance({var}, str) and {var} in {allowed})")
+        self.emit(depth, f"if not ({' or '.join(conditions) or 'False'}):")
+        self.emit(depth + 1, "return False")
+
+    def _string(self, schema: Dict[str, Any], var: str, depth: int, types, where: str) -> None:
+        bounds = [(k, schema[k]) for k in ("minLength", "maxLength") if k in schema]
+        if not bounds:
+            return
+        for keyword, value in bounds:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise UnsupportedSchemaError(f"{where}/{keyword}: must be an integer")
+        if types != ["string"]:
+            self.emit(depth, f"if isinstance({var}, str):")
+            depth += 1
+        for keyword, value in bounds:
+            operator = "<" if keyword == "minLength" else ">"
+            self.emit(depth, f"if len({var}) {operator} {value}:")
+            self.emit(depth + 1, "return False")
+
+    def _object(self, schema: Dict[str, Any], var: str, depth: int, types, where: str) -> None:
+        required = schema.get("required", [])
+        properties = schema.get("properties", {})
+        additional = schema.get("additionalProperties", True)
+        if not isinstance(required, list) or not all(isinstance(k, str) for k in required):
+            raise UnsupportedSchemaError(f"{where}/required: must be a list of strings")
+        if not isinstance(properties, dict):
+            raise UnsupportedSchemaError(f"{where}/properties: must be an object")
+        if not required and not properties and additional is True:
+            return
+
+        start = len(self.lines)
+        if types != ["object"]:
+            self.emit(depth, f"if isinstance({var}, dict):")
+            depth += 1
+        body = len(self.lines)
+        self._object_body(required, properties, additional, var, depth, where)
+        if len(self.lines) == body:
+            del self.lines[start:]  # nothing to check beyond annotations
+
+    def _object_body(self, required, properties, additional, var: str, depth: int, where: str) -> None:
+        if required:
+            missing = " or ".join(f"{key!r} not in {var}" for key in dict.fromkeys(required))
+            self.emit(depth, f"if {missing}:")
+            self.emit(depth + 1, "return False")
+
+        for key, subschema in properties.items():
+            value = self.name("v")
+            start = len(self.lines)
+            if key in required:
+                # Presence was checked above
+                self.emit(depth, f"{value} = {var}[{key!r}]")
+                body = len(self.lines)
+                self.schema(subschema, value, depth, f"{where}/properties/{key}")
+            else:
+                self.emit(depth, f"{value} = {var}.get({key!r}, _MISSING)")
+                self.emit(depth, f"if {value} is not _MISSING:")
+                body = len(self.lines)
+                self.schema(subschema, value, depth + 1, f"{where}/properties/{key}")
+            if len(self.lines) == body:
+                del self.lines[start:]  # annotation-only property
+
+        if additional is True:
+            return
+        known = self.constant(list(properties))
+        if additional is False:
+            self.emit(depth, f"if not {known}.issuperset({var}):")
+            self.emit(depth + 1, "return False")
+            return
+        key, value = self.name("k"), self.name("v")
+        self.emit(depth, f"for {key}, {value} in {var}.items():")
+        self.emit(depth + 1, f"if {key} not in {known}:")
+        body = len(self.lines)
+        self.schema(additional, value, depth + 2, f"{where}/additionalProperties")
+        if len(self.lines) == body:
+            del self.lines[body - 2:]
+
+
+def generate_source(schema: Any, name: str = "is_valid") -> str:
+    """
+    Python source of a module defining ``name(instance) -> bool`` for
+    ``schema``. Raises ``UnsupportedSchemaError`` for keywords outside the
+    supported subset.
+    """
+    generator = _Generator()
+    generator.schema(schema, "instance", 1, "#")
+    lines = [
+        f"# Generated from schema {schema.get('title', '') if isinstance(schema, dict) else ''!r}",
+        *generator.constants,
+        "",
+        f"def {name}(instance):",
+        *generator.lines,
+        "    return True",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def compile_schema(schema: Any) -> Check:
+    """
+    Compile ``schema`` into a fast ``is_valid(instance) -> bool`` function.
+    """
+    source = generate_source(schema)
+    namespace: Dict[str, Any] = {"_MISSING": object(), "_Number": numbers.Number}
+    exec(compile(source, "<compiled schema>", "exec"), namespace)
+    check = namespace["is_valid"]
+    check.source = source
+    return check
+
+
+def compiled_check(schema: Any) -> Optional[Check]:
+    """
+    Cached ``compile_schema(schema)`` keyed by the schema object, or None
+    when the schema is not supported by the compiler.
+    """
+    cached = _CHECK_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    with _CACHE_LOCK:
+        try:
+            check: Optional[Check] = compile_schema(schema)
+        except UnsupportedSchemaError:
+            check = None
+        _CHECK_CACHE[id(schema)] = (schema, check)
+        return check
+
+
+def clear_compiled_checks() -> None:
+    with _CACHE_LOCK:
+        _CHECK_CACHE.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the validator generated from a JSON schema")
+    parser.add_argument("schema", help="Path to a JSON schema file")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.schema, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+        print(generate_source(schema), end="")
+    except (OSError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
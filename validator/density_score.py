@@ -1,7 +1,15 @@
+import argparse
 import json
 from pathlib import Path
 import math
 import sys
+from typing import Iterable
+
+if __package__ in (None, ""):
+    # Allow running as ``python validator/density_score.py`` from the repository root
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validator.parallel import MessageChunk, map_line_chunks
 
 
 def compute_density(text: str) -> float:
@@ -40,9 +48,34 @@ def compute_density(text: str) -> float:
     return round(density, 4)
 
 
-def score_file(jsonl_path):
+def _score_lines(lines: Iterable[bytes]) -> MessageChunk:
+    """
+    Density scores for one chunk of raw JSONL lines.
+    """
+    result = MessageChunk()
+
+    for line in lines:
+        result.line_count += 1
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            result.flagged += 1
+            result.messages.append((result.line_count, "JSON ERROR"))
+            continue
+
+        content = entry.get("content", "")
+        density = compute_density(content)
+        result.messages.append((result.line_count, f"Density: {density}"))
+
+    return result
+
+
+def score_file(jsonl_path, workers=1):
     """
     Computes and prints density scores for each entry.
+
+    With ``workers`` > 1 chunks of the file are scored in a process pool;
+    output is identical to a serial run.
     """
 
     jsonl_path = Path(jsonl_path)
@@ -53,22 +86,26 @@ def score_file(jsonl_path):
 
     print(f"Computing density scores for: {jsonl_path}\n")
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f, start=1):
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                print(f"[Entry {i}] JSON ERROR")
-                continue
+    line_base = 0
+    for chunk in map_line_chunks(jsonl_path, _score_lines, workers):
+        for line, message in chunk.messages:
+            print(f"[Entry {line_base + line}] {message}")
+        line_base += chunk.line_count
 
-            content = entry.get("content", "")
-            density = compute_density(content)
-            print(f"[Entry {i}] Density: {density}")
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print a density score for each dataset entry")
+    parser.add_argument("path", help="Path to the .jsonl dataset")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes (default: 1)",
+    )
+    args = parser.parse_args(argv)
+    score_file(args.path, workers=args.workers)
+    return 0
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python density_score.py <dataset.jsonl>")
-        sys.exit(1)
 
-    score_file(sys.argv[1])
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Compiled schema validators for the NDRP validator.
+
+Building a jsonschema validator re-checks the schema itself and resolves its
+keywords, which costs far more than validating one entry. ``get_validator``
+builds a single ``Draft7Validator`` per schema file and caches it keyed by the
+path and modification time, so long-running processes pick up schema edits
+without paying the construction cost on every entry. The modification time is
+checked at most once every ``MTIME_CHECK_INTERVAL`` seconds, so per-entry
+callers do not pay a ``stat`` call each either.
+
+jsonschema is imported on the first ``get_validator`` call, so importing the
+validator modules (e.g. for ``--help`` or argument errors) stays cheap.
+"""
+import json
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
+
+ENTRY_SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "entry_schema.json"
+
+# Seconds a cached validator is trusted before the schema file is stat'ed again
+MTIME_CHECK_INTERVAL = 1.0
+
+# Schema path -> (mtime in ns, compiled validator, monotonic time of the last mtime check)
+_VALIDATOR_CACHE: Dict[str, Tuple[int, "Draft7Validator", float]] = {}
+_CACHE_LOCK = Lock()
+
+
+def load_schema(schema_path: Union[str, Path] = ENTRY_SCHEMA_PATH) -> dict:
+    """
+    Read and parse a JSON schema file.
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def get_validator(schema_path: Union[str, Path] = ENTRY_SCHEMA_PATH) -> "Draft7Validator":
+    """
+    Return a compiled ``Draft7Validator`` for the schema at ``schema_path``.
+
+    The schema is checked and compiled once; subsequent calls return the
+    cached instance until the file's modification time changes, which is
+    checked at most once every ``MTIME_CHECK_INTERVAL`` seconds.
+    """
+    key = os.fspath(schema_path)
+    now = time.monotonic()
+    cached = _VALIDATOR_CACHE.get(key)
+    if cached is not None and now - cached[2] < MTIME_CHECK_INTERVAL:
+        return cached[1]
+
+    mtime = os.stat(key).st_mtime_ns
+    if cached is not None and cached[0] == mtime:
+        _VALIDATOR_CACHE[key] = (mtime, cached[1], now)
+        return cached[1]
+
+    with _CACHE_LOCK:
+        cached = _VALIDATOR_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        from jsonschema import Draft7Validator
+
+        schema = load_schema(key)
+        Draft7Validator.check_schema(schema)
+        compiled = Draft7Validator(schema)
+        _VALIDATOR_CACHE[key] = (mtime, compiled, now)
+        return compiled
+
+
+def clear_validator_cache() -> None:
+    """
+    Drop every cached validator (mainly useful for tests and benchmarks).
+    """
+    with _CACHE_LOCK:
+        _VALIDATOR_CACHE.clear()
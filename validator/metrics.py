@@ -0,0 +1,230 @@
+"""
+Fused per-entry text metrics.
+
+``compute_metrics`` derives density factors, character entropy, word and
+punctuation statistics from one character histogram plus one whitespace
+split, instead of the separate scans made by ``compute_density`` (split, word
+lengths, one ``count`` per punctuation mark) and ``shannon_entropy``. Results
+are identical to those two functions.
+
+Usage:
+    python validator/metrics.py <dataset.jsonl>
+"""
+import argparse
+import json
+import math
+from collections import Counter
+from pathlib import Path
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+if __package__ in (None, ""):
+    # Allow running as ``python validator/metrics.py`` from the repository root
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dataio.compression import open_input
+from validator.entropy_check import classify_entropy
+
+PUNCTUATION = ".,;:!?"
+
+# Percentiles reported by summarize_values
+SUMMARY_PERCENTILES = (50, 90, 99)
+
+_log2 = math.log2
+
+
+class TextMetrics(NamedTuple):
+    """
+    Metrics of one text.
+
+    Attributes:
+        chars: Length in characters
+        words: Number of whitespace-separated words
+        avg_word_len: Mean word length in characters
+        punctuation: Occurrences of ``.,;:!?``
+        token_factor: Density factor from the word/character ratio
+        wordlen_factor: Density factor from the average word length
+        punct_factor: Density factor from punctuation per word
+        density: Composite density, as ``compute_density`` returns it
+        entropy: Character-level Shannon entropy, as ``shannon_entropy``
+    """
+    chars: int
+    words: int
+    avg_word_len: float
+    punctuation: int
+    token_factor: float
+    wordlen_factor: float
+    punct_factor: float
+    density: float
+    entropy: float
+
+
+EMPTY_METRICS = TextMetrics(0, 0, 0.0, 0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def compute_metrics(text: str) -> TextMetrics:
+    """
+    Compute all text metrics of ``text`` in one histogram pass.
+    """
+    if not text:
+        return EMPTY_METRICS
+
+    chars = len(text)
+    entropy = 0.0
+    punctuation = 0
+    whitespace = 0
+
+    for char, count in Counter(text).items():
+        p = count / chars
+        entropy -= p * _log2(p)
+        if char in PUNCTUATION:
+            punctuation += count
+        elif char.isspace():
+            whitespace += count
+
+    # Word lengths add up to every non-whitespace character
+    word_count = len(text.split())
+    if word_count == 0:
+        return EMPTY_METRICS._replace(chars=chars, punctuation=punctuation, entropy=entropy)
+
+    avg_word_len = (chars - whitespace) / word_count
+    token_ratio = word_count / chars
+
+    # Same normalization as compute_density
+    token_factor = max(0.0, min(1.0, 1 - token_ratio * 4))
+    wordlen_factor = max(0.0, min(1.0, (avg_word_len - 3) / 7))
+    punct_factor = max(0.0, min(1.0, punctuation / (word_count + 1)))
+    density = round((token_factor + wordlen_factor + punct_factor) / 3, 4)
+
+    return TextMetrics(
+        chars,
+        word_count,
+        avg_word_len,
+        punctuation,
+        token_factor,
+        wordlen_factor,
+        punct_factor,
+        density,
+        entropy,
+    )
+
+
+def compute_metrics_batch(texts: Iterable[str]) -> List[TextMetrics]:
+    """
+    Metrics for a batch of texts; equivalent to
+    ``[compute_metrics(t) for t in texts]``.
+    """
+    return list(map(compute_metrics, texts))
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    The ``q``-th percentile of already sorted values, interpolating
+    linearly between ranks (NumPy's default method).
+    """
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = rank - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def summarize_values(values: Iterable[float]) -> Dict[str, float]:
+    """
+    Count, min, max, mean and ``SUMMARY_PERCENTILES`` of a metric column.
+    """
+    ordered = sorted(values)
+    summary: Dict[str, float] = {
+        "count": len(ordered),
+        "min": ordered[0] if ordered else 0.0,
+        "max": ordered[-1] if ordered else 0.0,
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+    }
+    for q in SUMMARY_PERCENTILES:
+        summary[f"p{q}"] = percentile(ordered, q)
+    return summary
+
+
+def histogram(
+    values: Iterable[float],
+    bins: int = 10,
+    low: Optional[float] = None,
+    high: Optional[float] = None,
+) -> List[Tuple[float, float, int]]:
+    """
+    Equal-width histogram as ``(bin_start, bin_end, count)`` rows. The range
+    defaults to the data's min and max; values outside it are clamped into
+    the first or last bin.
+    """
+    values = list(values)
+    if not values:
+        return []
+    low = min(values) if low is None else low
+    high = max(values) if high is None else high
+    width = (high - low) / bins if high > low else 1.0
+
+    counts = [0] * bins
+    for value in values:
+        index = int((value - low) / width)
+        counts[max(0, min(bins - 1, index))] += 1
+    return [(low + width * i, low + width * (i + 1), count) for i, count in enumerate(counts)]
+
+
+def metrics_file(jsonl_path):
+    """
+    Prints density and entropy for each entry in one pass over the file,
+    flagging entropy class mismatches like ``entropy_check.check_file``.
+    """
+    jsonl_path = Path(jsonl_path)
+
+    if not jsonl_path.exists():
+        print(f"Error: File not found → {jsonl_path}")
+        return
+
+    print(f"Computing text metrics for: {jsonl_path}\n")
+
+    total = 0
+    mismatches = 0
+
+    with open_input(jsonl_path) as f:
+        for i, line in enumerate(f, start=1):
+            total += 1
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"[Entry {i}] JSON ERROR")
+                continue
+
+            metrics = compute_metrics(entry.get("content", ""))
+            measured_class = classify_entropy(metrics.entropy)
+            declared_class = entry.get("entropy_class", "undefined")
+            flag = ""
+            if measured_class != declared_class:
+                mismatches += 1
+                flag = f" | ENTROPY MISMATCH (declared: {declared_class})"
+
+            print(
+                f"[Entry {i}] Density: {metrics.density} | "
+                f"Entropy: {metrics.entropy:.2f} ({measured_class}) | "
+                f"Words: {metrics.words}{flag}"
+            )
+
+    print("\n--- SUMMARY ---")
+    print(f"Total entries: {total}")
+    print(f"Entropy mismatches: {mismatches}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Print density and entropy for each entry in one pass"
+    )
+    parser.add_argument("path", help="Path to the .jsonl dataset")
+    args = parser.parse_args(argv)
+    metrics_file(args.path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
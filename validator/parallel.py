@@ -0,0 +1,458 @@
+"""
+Multi-process validation of JSONL datasets.
+
+The input file is split into byte ranges aligned to line boundaries. Each
+range is validated independently (in a process pool when ``workers`` > 1) and
+reports problems with chunk-local line and entry numbers. Results are then
+consumed strictly in file order and rebased to global numbers, so callers see
+exactly the same sequence of findings as a serial pass over the file.
+
+Compressed inputs cannot be split by byte offset; they are decoded once in the
+parent and shipped to workers as batches of lines instead.
+
+Line numbers count every physical line; entry numbers count only non-blank
+lines, matching how ``ndrpy`` numbers JSONL entries.
+
+``map_line_chunks`` applies the same chunking and ordering to any
+line-oriented check (entropy, density), whose chunk results the caller merges
+in file order.
+"""
+import json
+import math
+import os
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+from dataio.compression import is_compressed, open_input
+from dataio.jsonl_index import IndexedJSONL
+
+# Ranges smaller than this are not worth the scheduling overhead.
+MIN_CHUNK_BYTES = 1 << 20
+
+# Ranges per worker; more ranges smooth out uneven line lengths.
+CHUNKS_PER_WORKER = 4
+
+# Upper bound for one range in map_line_chunks, so per-chunk results stay small
+MAX_CHUNK_BYTES = 64 << 20
+
+
+@dataclass
+class LineProblem:
+    """
+    A problem found on one line of the input.
+
+    Attributes:
+        line: Physical line number (1-based)
+        entry: Entry number among non-blank lines (0 for blank lines)
+        kind: One of "blank", "json", "not_object", "findings"
+        detail: JSON error message for "json", or ``check_entry`` tuples
+                for "findings"
+    """
+    line: int
+    entry: int
+    kind: str
+    detail: Any = None
+
+
+@dataclass
+class MessageChunk:
+    """
+    Printable outcome of a line-oriented check over one chunk.
+
+    Attributes:
+        line_count: Lines in the chunk
+        flagged: Lines the check counted against the data (e.g. mismatches)
+        messages: ``(line, text)`` pairs with chunk-local 1-based line numbers
+    """
+    line_count: int = 0
+    flagged: int = 0
+    messages: List[Tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass
+class ChunkResult:
+    """
+    Validation outcome for one byte range of the input.
+
+    Only lines with problems are recorded, so the result stays small for
+    mostly-valid data. The ``cache_*`` counters are filled in when a
+    findings cache is used.
+    """
+    line_count: int = 0
+    entry_count: int = 0
+    problems: List[LineProblem] = field(default_factory=list)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_seconds_saved: float = 0.0
+
+
+def _read_byte_range(path: Union[str, Path], start: int, end: int) -> Iterator[bytes]:
+    position = start
+    with open(path, "rb") as f:
+        f.seek(start)
+        while position < end:
+            raw = f.readline()
+            if not raw:
+                break
+            position += len(raw)
+            yield raw
+
+
+def split_byte_ranges(path: Union[str, Path], parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into at most ``parts`` ``(start, end)`` byte ranges whose
+    boundaries fall just after a newline.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    parts = max(1, min(parts, math.ceil(size / MIN_CHUNK_BYTES)))
+    boundaries = [0]
+
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            target = size * i // parts
+            if target <= boundaries[-1]:
+                continue
+            f.seek(target - 1)
+            # Finish the line containing target - 1 so the range starts at a line
+            f.readline()
+            offset = f.tell()
+            if boundaries[-1] < offset < size:
+                boundaries.append(offset)
+
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def validate_byte_range(
+    path: Union[str, Path],
+    start: int,
+    end: int,
+    all_errors: bool = False,
+    cache_path: Optional[str] = None,
+) -> ChunkResult:
+    """
+    Validate the lines in ``[start, end)`` of a plain file; numbers in the
+    result are local to the range.
+    """
+    return validate_lines(_read_byte_range(path, start, end), all_errors, cache_path)
+
+
+def validate_lines(
+    lines: Iterable[Union[bytes, str]],
+    all_errors: bool = False,
+    cache_path: Optional[str] = None,
+) -> ChunkResult:
+    """
+    Validate a run of raw JSONL lines; numbers in the result are local to
+    the run. With ``cache_path``, findings for unchanged entries are read
+    from (and new ones written to) that validation cache.
+    """
+    from validator.engine import get_validator
+    from validator.validate import SCHEMA_PATH, check_entry
+
+    schema_validator = get_validator(SCHEMA_PATH)
+    result = ChunkResult()
+
+    if cache_path is None:
+        return _validate_lines(lines, result, check_entry, schema_validator, all_errors)
+
+    from validator.cache import ValidationCache
+
+    with ValidationCache(cache_path, SCHEMA_PATH) as cache:
+        _validate_lines(lines, result, cache.check, schema_validator, all_errors)
+    result.cache_hits = cache.hits
+    result.cache_misses = cache.misses
+    result.cache_seconds_saved = cache.seconds_saved
+    return result
+
+
+def _validate_lines(
+    lines: Iterable[Union[bytes, str]],
+    result: ChunkResult,
+    check: Callable[..., List[Tuple[str, str, str]]],
+    schema_validator: Any,
+    all_errors: bool,
+) -> ChunkResult:
+
+    for raw in lines:
+        result.line_count += 1
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+
+        if not line.strip():
+            result.problems.append(LineProblem(result.line_count, 0, "blank"))
+            continue
+
+        result.entry_count += 1
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as exc:
+            result.problems.append(
+                LineProblem(result.line_count, result.entry_count, "json", exc.msg)
+            )
+            continue
+
+        if not isinstance(entry, dict):
+            result.problems.append(
+                LineProblem(result.line_count, result.entry_count, "not_object")
+            )
+            continue
+
+        problems = check(entry, schema_validator, all_errors)
+        if problems:
+            result.problems.append(
+                LineProblem(result.line_count, result.entry_count, "findings", problems)
+            )
+
+    return result
+
+
+def _validate_range_task(task: Tuple[str, int, int, bool, Optional[str]]) -> ChunkResult:
+    return validate_byte_range(*task)
+
+
+def _validate_lines_task(task: Tuple[List[bytes], bool, Optional[str]]) -> ChunkResult:
+    return validate_lines(*task)
+
+
+def _iter_line_chunks(
+    path: Union[str, Path],
+    all_errors: bool,
+    cache_path: Optional[str],
+) -> Iterator[Tuple[List[bytes], bool, Optional[str]]]:
+    with open_input(path, "rb") as f:
+        while True:
+            lines = f.readlines(MIN_CHUNK_BYTES)
+            if not lines:
+                return
+            yield lines, all_errors, cache_path
+
+
+def _apply_to_byte_range(task: Tuple[Callable[[Iterable[bytes]], Any], str, int, int]) -> Any:
+    func, path, start, end = task
+    return func(_read_byte_range(path, start, end))
+
+
+def _apply_to_lines(task: Tuple[Callable[[Iterable[bytes]], Any], List[bytes]]) -> Any:
+    func, lines = task
+    return func(lines)
+
+
+def map_line_chunks(
+    path: Union[str, Path],
+    func: Callable[[Iterable[bytes]], Any],
+    workers: int = 1,
+) -> Iterator[Any]:
+    """
+    Apply ``func`` to consecutive runs of raw lines of ``path`` and yield its
+    results in file order.
+
+    ``func`` receives an iterable of ``bytes`` lines and must be a
+    module-level function so it can be sent to worker processes. Results
+    come back strictly in file order, so callers that merge them in that
+    order get the same output for any worker count.
+    """
+    workers = max(1, workers)
+
+    if is_compressed(path):
+        tasks: Iterable = (
+            (func, lines) for lines, _all_errors, _cache in _iter_line_chunks(path, False, None)
+        )
+        yield from _run_tasks(_apply_to_lines, tasks, workers)
+        return
+
+    size = os.path.getsize(path)
+    parts = max(workers * CHUNKS_PER_WORKER, math.ceil(size / MAX_CHUNK_BYTES))
+    tasks = [(func, str(path), start, end) for start, end in split_byte_ranges(path, parts)]
+    yield from _run_tasks(_apply_to_byte_range, tasks, workers)
+
+
+def parse_line_spec(spec: str) -> Tuple[int, int]:
+    """
+    Parse ``"FIRST:LAST"`` (1-based, inclusive; either side may be empty)
+    into a line range. ``LAST`` of 0 means "to the end of the file".
+    """
+    first, sep, last = spec.partition(":")
+    if not sep:
+        raise ValueError(f"Invalid line range '{spec}', expected FIRST:LAST")
+    try:
+        line_range = (int(first) if first else 1, int(last) if last else 0)
+    except ValueError:
+        raise ValueError(f"Invalid line range '{spec}', expected FIRST:LAST") from None
+    if line_range[0] < 1 or (line_range[1] and line_range[1] < line_range[0]):
+        raise ValueError(f"Invalid line range '{spec}'")
+    return line_range
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """
+    Parse ``"K/N"`` (shard K of N, 1-based).
+    """
+    index, sep, count = spec.partition("/")
+    try:
+        shard = (int(index), int(count))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}', expected K/N") from None
+    if not sep or not 1 <= shard[0] <= shard[1]:
+        raise ValueError(f"Invalid shard '{spec}', expected K/N with 1 <= K <= N")
+    return shard
+
+
+def resolve_line_range(
+    path: Union[str, Path],
+    lines: Optional[Tuple[int, int]] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Optional[Tuple[int, int]]:
+    """
+    Turn a ``--lines`` range and/or ``--shard`` into concrete inclusive line
+    numbers using the file's line index. A shard splits the (optionally
+    restricted) line range into N near-equal parts. Returns None for a
+    whole-file run.
+    """
+    if lines is None and shard is None:
+        return None
+
+    with IndexedJSONL(path) as reader:
+        total = len(reader)
+
+    first, last = lines if lines is not None else (1, 0)
+    last = min(last or total, total)
+
+    if shard is not None:
+        index, count = shard
+        span = max(0, last - first + 1)
+        shard_first = first + span * (index - 1) // count
+        shard_last = first + span * index // count - 1
+        first, last = shard_first, shard_last
+
+    return first, last
+
+
+def iter_chunk_results(
+    path: Union[str, Path],
+    workers: int = 1,
+    all_errors: bool = False,
+    line_range: Optional[Tuple[int, int]] = None,
+    cache_path: Optional[Union[str, Path]] = None,
+) -> Iterator[ChunkResult]:
+    """
+    Validate a JSONL file and yield per-range results in file order, with
+    line and entry numbers rebased to the whole file.
+
+    Plain files are split into byte ranges that workers read themselves.
+    Compressed files cannot be seeked into, so they are decoded here and
+    handed to workers as batches of lines.
+
+    ``line_range`` restricts validation to lines ``first..last`` inclusive,
+    located through the file's line-offset index. In such partial runs
+    entries are numbered by physical line.
+
+    ``cache_path`` enables the findings cache in every worker; the database
+    tolerates concurrent writers.
+    """
+    workers = max(1, workers)
+    cache = str(cache_path) if cache_path is not None else None
+
+    if line_range is not None:
+        tasks = [
+            (str(path), start, end, all_errors, cache)
+            for start, end in _indexed_byte_ranges(path, line_range, workers * CHUNKS_PER_WORKER)
+        ]
+        results = _run_tasks(_validate_range_task, tasks, workers)
+        yield from _rebase(results, line_base=line_range[0] - 1, entries_by_line=True)
+        return
+
+    if is_compressed(path):
+        task_func = _validate_lines_task
+        tasks: Iterable = _iter_line_chunks(path, all_errors, cache)
+    else:
+        task_func = _validate_range_task
+        ranges = split_byte_ranges(path, workers * CHUNKS_PER_WORKER)
+        tasks = [(str(path), start, end, all_errors, cache) for start, end in ranges]
+
+    yield from _rebase(_run_tasks(task_func, tasks, workers))
+
+
+def _indexed_byte_ranges(
+    path: Union[str, Path],
+    line_range: Tuple[int, int],
+    parts: int,
+) -> List[Tuple[int, int]]:
+    """
+    Split lines ``first..last`` into at most ``parts`` byte ranges using the
+    line-offset index; no scanning for newlines is needed.
+    """
+    first, last = line_range
+    if last < first:
+        return []
+
+    with IndexedJSONL(path) as reader:
+        start, end = reader.byte_range(first, last)
+        parts = max(1, min(parts, math.ceil((end - start) / MIN_CHUNK_BYTES)))
+        span = last - first + 1
+        cuts = sorted({first + span * i // parts for i in range(parts)} | {last + 1})
+        return [
+            (reader.offsets[lo - 1], reader.offsets[hi - 1])
+            for lo, hi in zip(cuts[:-1], cuts[1:])
+        ]
+
+
+def _run_tasks(
+    func: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    workers: int,
+) -> Iterator[Any]:
+    if workers == 1:
+        yield from map(func, tasks)
+        return
+
+    # Loaded here so single-process runs do not pay for multiprocessing imports
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _iter_ordered(executor, func, tasks, workers * CHUNKS_PER_WORKER)
+
+
+def _iter_ordered(
+    executor: Executor,
+    func: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    max_pending: int,
+) -> Iterator[Any]:
+    """
+    Submit tasks lazily with at most ``max_pending`` in flight and yield
+    their results in submission order.
+    """
+    pending: Deque[Future] = deque()
+    for task in tasks:
+        pending.append(executor.submit(func, task))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _rebase(
+    results: Iterable[ChunkResult],
+    line_base: int = 0,
+    entry_base: int = 0,
+    entries_by_line: bool = False,
+) -> Iterator[ChunkResult]:
+    """
+    Offset chunk-local line and entry numbers to whole-file numbers. With
+    ``entries_by_line`` entries are numbered by their physical line, since
+    the count of entries before a partial range is unknown.
+    """
+    for chunk in results:
+        for problem in chunk.problems:
+            problem.line += line_base
+            if problem.entry:
+                problem.entry = problem.line if entries_by_line else problem.entry + entry_base
+        line_base += chunk.line_count
+        entry_base += chunk.entry_count
+        yield chunk
@@ -1,53 +1,171 @@
-import json
-import jsonschema
-from jsonschema import validate
+import argparse
 import sys
 from pathlib import Path
 
-# Load entry schema
-SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "entry_schema.json"
+if __package__ in (None, ""):
+    # Allow running as ``python validator/validate.py`` from the repository root
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-with open(SCHEMA_PATH, "r") as f:
-    ENTRY_SCHEMA = json.load(f)
+from dataio.compression import is_compressed
+from standardization.vocabulary import ROLES
+from validator.cache import cache_stats, format_cache_stats
+from validator.compiler import compiled_check
+from validator.engine import ENTRY_SCHEMA_PATH, get_validator, load_schema
+from validator.parallel import (
+    iter_chunk_results,
+    parse_line_spec,
+    parse_shard_spec,
+    resolve_line_range,
+)
 
+SCHEMA_PATH = ENTRY_SCHEMA_PATH
 
-def validate_entry(entry, index):
+# Version of the checks in ``check_entry``. Bump it whenever their results can
+# change so cached findings (see ``validator.cache``) are invalidated.
+CHECKS_VERSION = 1
+
+
+def __getattr__(name):
+    # The parsed entry schema is loaded on first access, not at import
+    if name == "ENTRY_SCHEMA":
+        schema = globals()["ENTRY_SCHEMA"] = load_schema(SCHEMA_PATH)
+        return schema
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _json_pointer(parts):
     """
-    Validates a single dataset entry using the NDRP entry schema.
-    Returns a list of error strings (empty if valid).
+    Render path components as an RFC 6901 JSON pointer ("" is the root).
     """
-    errors = []
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in parts
+    )
 
-    try:
-        validate(instance=entry, schema=ENTRY_SCHEMA)
-    except jsonschema.exceptions.ValidationError as e:
-        errors.append(f"[Entry {index}] SCHEMA ERROR: {e.message}")
+
+def _schema_error_pointer(error):
+    """
+    JSON pointer for a schema error. ``required`` errors point at the missing
+    property rather than its parent object so findings group per field.
+    """
+    parts = list(error.absolute_path)
+    if error.validator == "required" and isinstance(error.instance, dict):
+        for prop in error.validator_value:
+            if prop not in error.instance and error.message.startswith(repr(prop)):
+                parts.append(prop)
+                break
+    return _json_pointer(parts)
+
+
+def check_entry(entry, schema_validator=None, all_errors=True):
+    """
+    Runs schema and semantic checks on a single entry.
+
+    Returns a list of ``(message, path, keyword)`` tuples where ``path`` is a
+    JSON pointer into the entry and ``keyword`` is the schema keyword or
+    semantic check that failed. With ``all_errors`` every schema violation is
+    reported from a single ``iter_errors`` pass; otherwise only the best
+    match is kept, as ``jsonschema.validate`` would raise.
+    """
+    problems = []
+
+    if schema_validator is None:
+        schema_validator = get_validator(SCHEMA_PATH)
+
+    # The compiled check decides accept/reject; jsonschema only runs to
+    # explain a rejection
+    fast_check = compiled_check(schema_validator.schema)
+    if fast_check is not None and fast_check(entry):
+        schema_errors = []
+    elif all_errors:
+        schema_errors = list(schema_validator.iter_errors(entry))
+    else:
+        from jsonschema.exceptions import best_match
+
+        # Same error selection as jsonschema.validate, without rebuilding the validator
+        best = best_match(schema_validator.iter_errors(entry))
+        schema_errors = [best] if best is not None else []
+
+    for error in schema_errors:
+        problems.append(
+            (f"SCHEMA ERROR: {error.message}", _schema_error_pointer(error), error.validator)
+        )
 
     # Additional checks beyond JSON Schema:
 
     # 1. Meaning preservation field should match boolean type
     if not isinstance(entry.get("meaning_preserved"), bool):
-        errors.append(f"[Entry {index}] meaning_preserved must be true or false")
+        problems.append(("meaning_preserved must be true or false", "/meaning_preserved", "type"))
 
     # 2. Density & entropy must be coherent
     if entry.get("density_goal") == "high" and entry.get("entropy_class") == "high":
-        errors.append(f"[Entry {index}] High density cannot coexist with high entropy")
+        problems.append(
+            ("High density cannot coexist with high entropy", "/entropy_class", "coherence")
+        )
 
     # 3. Content must not be empty
     if not entry.get("content") or entry["content"].strip() == "":
-        errors.append(f"[Entry {index}] Content is empty")
+        problems.append(("Content is empty", "/content", "non_empty"))
 
     # 4. Role must be valid
-    if entry.get("role") not in ["user", "assistant", "system"]:
-        errors.append(f"[Entry {index}] Invalid role: {entry.get('role')}")
+    if entry.get("role") not in ROLES:
+        problems.append((f"Invalid role: {entry.get('role')}", "/role", "enum"))
+
+    return problems
+
+
+def format_findings(problems, index):
+    """
+    Turns ``check_entry`` output into finding dicts for entry ``index``.
+    """
+    return [
+        {
+            "entry": index,
+            "message": f"[Entry {index}] {message}",
+            "path": path,
+            "keyword": keyword,
+        }
+        for message, path, keyword in problems
+    ]
 
-    return errors
+
+def collect_findings(entry, index, schema_validator=None, all_errors=True):
+    """
+    Validates a single dataset entry and returns structured findings.
+
+    Each finding is a dict with ``entry``, ``message``, ``path`` (JSON pointer
+    into the entry) and ``keyword`` (the schema keyword or semantic check that
+    failed). See ``check_entry`` for ``all_errors``.
+    """
+    return format_findings(check_entry(entry, schema_validator, all_errors), index)
+
+
+def validate_entry(entry, index, schema_validator=None, all_errors=False):
+    """
+    Validates a single dataset entry using the NDRP entry schema.
+    Returns a list of error strings (empty if valid).
+
+    ``schema_validator`` may be a precompiled validator from
+    ``validator.engine.get_validator``; when omitted the cached entry
+    schema validator is used. Set ``all_errors`` to report every schema
+    violation instead of only the first.
+    """
+    return [
+        finding["message"]
+        for finding in collect_findings(entry, index, schema_validator, all_errors)
+    ]
 
 
-def validate_file(jsonl_path):
+def validate_file(jsonl_path, all_errors=False, workers=1, lines=None, shard=None, cache_path=None):
     """
     Validates all entries in a .jsonl dataset file.
     Returns the number of errors found.
+
+    With ``all_errors`` every schema violation of an entry is printed in the
+    same pass instead of only the first. ``workers`` > 1 validates newline-
+    aligned byte ranges in a process pool; output is identical to a serial run.
+    ``lines`` (first, last) and/or ``shard`` (k, n) restrict the run to part
+    of the file, located through its line-offset index. ``cache_path``
+    names a findings cache (see ``validator.cache``) reused across runs.
     """
     jsonl_path = Path(jsonl_path)
 
@@ -55,45 +173,108 @@ def validate_file(jsonl_path):
         print(f"Error: File not found → {jsonl_path}")
         return -1
 
-    print(f"Validating: {jsonl_path}\n")
+    line_range = resolve_line_range(jsonl_path, lines, shard)
+    if line_range is None:
+        print(f"Validating: {jsonl_path}\n")
+    else:
+        print(f"Validating: {jsonl_path} (lines {line_range[0]}-{line_range[1]})\n")
 
     total = 0
     valid = 0
     errors_found = 0
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f, start=1):
-            total += 1
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                print(f"[Entry {i}] JSON ERROR: Invalid JSON line.")
-                errors_found += 1
-                continue
+    cache_hits = 0
+    cache_misses = 0
+    cache_seconds_saved = 0.0
 
-            errors = validate_entry(entry, i)
+    chunks = iter_chunk_results(
+        jsonl_path,
+        workers=workers,
+        all_errors=all_errors,
+        line_range=line_range,
+        cache_path=cache_path,
+    )
+    for chunk in chunks:
+        total += chunk.line_count
+        cache_hits += chunk.cache_hits
+        cache_misses += chunk.cache_misses
+        cache_seconds_saved += chunk.cache_seconds_saved
+        problem_lines = 0
 
-            if errors:
-                errors_found += len(errors)
-                for err in errors:
-                    print(err)
+        for problem in chunk.problems:
+            problem_lines += 1
+            if problem.kind in ("blank", "json"):
+                print(f"[Entry {problem.line}] JSON ERROR: Invalid JSON line.")
+                errors_found += 1
+            elif problem.kind == "not_object":
+                print(f"[Entry {problem.line}] JSON ERROR: Entry must be a JSON object.")
+                errors_found += 1
             else:
-                valid += 1
+                for finding in format_findings(problem.detail, problem.line):
+                    print(finding["message"])
+                errors_found += len(problem.detail)
+
+        valid += chunk.line_count - problem_lines
 
     print("\n--- SUMMARY ---")
     print(f"Total entries: {total}")
     print(f"Valid entries: {valid}")
     print(f"Errors found: {errors_found}")
-    
+    if cache_path is not None:
+        print(format_cache_stats(cache_stats(cache_hits, cache_misses, cache_seconds_saved)))
+
     return errors_found
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python validate.py <dataset.jsonl>")
-        sys.exit(1)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate an NDRP .jsonl dataset")
+    parser.add_argument("path", help="Path to the .jsonl dataset")
+    parser.add_argument(
+        "--all-errors",
+        action="store_true",
+        help="Report every schema error per entry instead of only the first",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of validation processes (default: 1)",
+    )
+    parser.add_argument(
+        "--lines",
+        type=parse_line_spec,
+        help="Only validate lines FIRST:LAST (1-based, inclusive)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard_spec,
+        help="Only validate shard K of N, e.g. 3/8",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="Reuse findings for unchanged entries from this cache file",
+    )
+    args = parser.parse_args(argv)
+
+    # A missing file is reported by ``validate_file``
+    partial = args.lines or args.shard
+    if partial and Path(args.path).exists() and is_compressed(args.path):
+        print("Error: --lines and --shard require an uncompressed JSONL file", file=sys.stderr)
+        return 1
+
+    error_count = validate_file(
+        args.path,
+        all_errors=args.all_errors,
+        workers=args.workers,
+        lines=args.lines,
+        shard=args.shard,
+        cache_path=args.cache,
+    )
 
-    error_count = validate_file(sys.argv[1])
-    
     # Return appropriate exit code based on validation results
-    sys.exit(0 if error_count == 0 else 1)
+    return 0 if error_count == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())